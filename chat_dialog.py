@@ -3,18 +3,131 @@ Interactive Chat Dialog for SEAL Geo RAG Chatbot
 """
 
 import os
+from collections import deque
 from datetime import datetime
-from qgis.PyQt.QtCore import Qt, QTimer
+from html import escape
+from qgis.PyQt.QtCore import Qt, QTimer, QObject, QThread, pyqtSignal, pyqtSlot
 from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, 
-    QLineEdit, QPushButton, QLabel, QMessageBox, QFileDialog
+    QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
+    QLineEdit, QPushButton, QLabel
 )
-from qgis.PyQt.QtGui import QTextCursor, QFont
+
+# Maximum number of conversation entries retained per session
+_MAX_HISTORY = 10000
+
+# Characters that need escaping or line-break conversion for display
+_HTML_SPECIAL = frozenset('&<>\n')
+
+# Transcript rules and role headings for text exports
+_HRULE = "=" * 80
+_SEP = "-" * 80
+_ROLE_LABELS = {
+    'user': "YOU",
+    'assistant': "SEAL GEO RAG",
+    'error': "ERROR",
+}
+
+# Worker thread -> worker for queries still running; keeps both alive after
+# the dialog that started them closes
+_active_workers = {}
+
+
+class ChatbotWorker(QObject):
+    """Runs a single chatbot query on a worker thread."""
+    
+    resultReady = pyqtSignal(object)  # response dict or None
+    errorOccurred = pyqtSignal(str)
+    finished = pyqtSignal()
+    
+    def __init__(self, sealgeo_agent, message):
+        """Initialize worker.
+        
+        Args:
+            sealgeo_agent: SEALGeoAgent instance for API queries
+            message: Message text to send
+        """
+        super().__init__()
+        self.sealgeo_agent = sealgeo_agent
+        self.message = message
+    
+    @pyqtSlot()
+    def run(self):
+        """Query the chatbot and report the outcome through signals."""
+        try:
+            self.resultReady.emit(self.sealgeo_agent._query_chatbot(self.message))
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+        finally:
+            self.finished.emit()
 
 
 class ChatDialog(QDialog):
     """Interactive chat dialog for continuous conversation with RAG chatbot."""
     
+    # Message templates, filled with the timestamp and the formatted body
+    _SYSTEM_TMPL = '<i style="color: #888;">ℹ️ {body}</i>'
+    _USER_TMPL = (
+        '<b style="color: #1976D2;">You</b> <span style="color: #999;">({ts})</span><br>{body}'
+    )
+    _BOT_TMPL = (
+        '<b style="color: #558B2F;">🤖 SEAL Geo RAG</b> <span style="color: #999;">({ts})</span><br>{body}'
+    )
+    _ERR_TMPL = '<span style="color: #C62828;"><b>❌ Error:</b> {body}</span>'
+    
+    # Dialog-wide stylesheet, parsed once instead of per widget
+    _DIALOG_QSS = """
+        QLabel#headerLabel {
+            font-size: 14pt;
+            font-weight: bold;
+        }
+        QLabel#infoLabel {
+            color: #666;
+            padding: 5px;
+        }
+        QPlainTextEdit {
+            background-color: #f5f5f5;
+            border: 1px solid #ccc;
+            border-radius: 4px;
+            padding: 8px;
+            font-family: 'Segoe UI', Arial, sans-serif;
+            font-size: 11pt;
+        }
+        QLineEdit {
+            padding: 8px;
+            border: 2px solid #4CAF50;
+            border-radius: 4px;
+            font-size: 11pt;
+        }
+        QLineEdit:focus {
+            border-color: #45a049;
+        }
+        QPushButton#sendBtn {
+            background-color: #4CAF50;
+            color: white;
+            padding: 8px 20px;
+            border: none;
+            border-radius: 4px;
+            font-weight: bold;
+            font-size: 11pt;
+        }
+        QPushButton#sendBtn:hover {
+            background-color: #45a049;
+        }
+        QPushButton#sendBtn:disabled {
+            background-color: #cccccc;
+        }
+        QPushButton#saveBtn {
+            background-color: #2196F3;
+            color: white;
+            padding: 6px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton#saveBtn:hover {
+            background-color: #0b7dda;
+        }
+    """
+    
     def __init__(self, sealgeo_agent, initial_mission="", parent=None):
         """Initialize chat dialog.
         
@@ -25,7 +138,11 @@ class ChatDialog(QDialog):
         """
         super().__init__(parent)
         self.sealgeo_agent = sealgeo_agent
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=_MAX_HISTORY)
+        
+        # Worker thread for the in-flight chatbot query
+        self._worker_thread = None
+        self._worker = None
         
         self.setWindowTitle("SEAL Geo RAG Chatbot - Interactive Chat")
         self.setMinimumSize(700, 600)
@@ -39,14 +156,12 @@ class ChatDialog(QDialog):
     
     def setup_ui(self):
         """Setup the user interface."""
+        self.setStyleSheet(self._DIALOG_QSS)
         layout = QVBoxLayout()
         
         # Header
         header_label = QLabel("💬 Interactive Chat with SEAL Geo RAG Chatbot")
-        header_font = QFont()
-        header_font.setPointSize(14)
-        header_font.setBold(True)
-        header_label.setFont(header_font)
+        header_label.setObjectName("headerLabel")
         header_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(header_label)
         
@@ -55,23 +170,14 @@ class ChatDialog(QDialog):
             "Ask questions about mission planning, flood response, geospatial operations, etc.\n"
             "The chatbot uses RAG (Retrieval-Augmented Generation) with mission-specific knowledge."
         )
+        info_label.setObjectName("infoLabel")
         info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: #666; padding: 5px;")
         layout.addWidget(info_label)
         
-        # Chat history display
-        self.chat_display = QTextEdit()
+        # Chat history display (plain-text layout keeps appends cheap on long chats)
+        self.chat_display = QPlainTextEdit()
         self.chat_display.setReadOnly(True)
-        self.chat_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #f5f5f5;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 8px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 11pt;
-            }
-        """)
+        self.chat_display.setMaximumBlockCount(2000)
         layout.addWidget(self.chat_display)
         
         # Input area
@@ -79,38 +185,11 @@ class ChatDialog(QDialog):
         
         self.input_field = QLineEdit()
         self.input_field.setPlaceholderText("Type your message here...")
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #4CAF50;
-                border-radius: 4px;
-                font-size: 11pt;
-            }
-            QLineEdit:focus {
-                border-color: #45a049;
-            }
-        """)
         self.input_field.returnPressed.connect(self.on_send_clicked)
         input_layout.addWidget(self.input_field)
         
         self.send_button = QPushButton("Send")
-        self.send_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 20px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.send_button.setObjectName("sendBtn")
         self.send_button.clicked.connect(self.on_send_clicked)
         input_layout.addWidget(self.send_button)
         
@@ -126,18 +205,7 @@ class ChatDialog(QDialog):
         button_layout.addStretch()
         
         self.save_button = QPushButton("Save Conversation")
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                padding: 6px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0b7dda;
-            }
-        """)
+        self.save_button.setObjectName("saveBtn")
         self.save_button.clicked.connect(self.save_conversation)
         button_layout.addWidget(self.save_button)
         
@@ -152,61 +220,53 @@ class ChatDialog(QDialog):
         # Welcome message
         self.append_system_message("Welcome! Ask me anything about mission planning, flood response, or geospatial operations.")
     
+    def _append_html(self, html):
+        """Append one message block, followed by a spacer line.
+        
+        The view follows the new message only if it was already scrolled to
+        the bottom, so reading earlier history is not interrupted.
+        """
+        scrollbar = self.chat_display.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        
+        self.chat_display.appendHtml(html + '<br>')
+        
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
     def append_system_message(self, text):
         """Append a system message to the chat display."""
-        self.chat_display.append(f'<div style="color: #888; font-style: italic; margin: 5px 0;">ℹ️ {text}</div>')
-        self.chat_display.append("")
+        self._append_html(self._SYSTEM_TMPL.format(body=text))
     
-    def append_user_message(self, text):
-        """Append a user message to the chat display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.chat_display.append(
-            f'<div style="background-color: #E3F2FD; padding: 8px; border-radius: 8px; margin: 5px 0;">'
-            f'<b style="color: #1976D2;">You</b> <span style="color: #999; font-size: 9pt;">({timestamp})</span><br>'
-            f'{self._format_text(text)}'
-            f'</div>'
-        )
-        self.chat_display.append("")
+    def append_user_message(self, text, timestamp=None):
+        """Append a user message to the chat display.
         
-        # Scroll to bottom
-        cursor = self.chat_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.chat_display.setTextCursor(cursor)
+        Args:
+            text: Message text
+            timestamp: Optional pre-formatted HH:MM:SS timestamp
+        """
+        ts = timestamp or datetime.now().strftime("%H:%M:%S")
+        self._append_html(self._USER_TMPL.format(ts=ts, body=self._format_text(text)))
     
-    def append_bot_message(self, text):
-        """Append a bot message to the chat display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.chat_display.append(
-            f'<div style="background-color: #F1F8E9; padding: 8px; border-radius: 8px; margin: 5px 0;">'
-            f'<b style="color: #558B2F;">🤖 SEAL Geo RAG</b> <span style="color: #999; font-size: 9pt;">({timestamp})</span><br>'
-            f'{self._format_text(text)}'
-            f'</div>'
-        )
-        self.chat_display.append("")
+    def append_bot_message(self, text, timestamp=None):
+        """Append a bot message to the chat display.
         
-        # Scroll to bottom
-        cursor = self.chat_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.chat_display.setTextCursor(cursor)
+        Args:
+            text: Message text
+            timestamp: Optional pre-formatted HH:MM:SS timestamp
+        """
+        ts = timestamp or datetime.now().strftime("%H:%M:%S")
+        self._append_html(self._BOT_TMPL.format(ts=ts, body=self._format_text(text)))
     
     def append_error_message(self, text):
         """Append an error message to the chat display."""
-        self.chat_display.append(
-            f'<div style="background-color: #FFEBEE; padding: 8px; border-radius: 8px; margin: 5px 0; color: #C62828;">'
-            f'<b>❌ Error:</b> {self._format_text(text)}'
-            f'</div>'
-        )
-        self.chat_display.append("")
+        self._append_html(self._ERR_TMPL.format(body=self._format_text(text)))
     
     def _format_text(self, text):
         """Format text for HTML display (escape HTML and preserve line breaks)."""
-        # Escape HTML special characters
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        # Convert line breaks to <br>
-        text = text.replace('\n', '<br>')
-        return text
+        if _HTML_SPECIAL.isdisjoint(text):
+            return text
+        return escape(text, quote=False).replace('\n', '<br>')
     
     def on_send_clicked(self):
         """Handle send button click."""
@@ -227,66 +287,126 @@ class ChatDialog(QDialog):
         self.input_field.clear()
         
         # Disable input while processing
-        self.input_field.setEnabled(False)
-        self.send_button.setEnabled(False)
-        self.send_button.setText("Sending...")
+        self._set_input_busy(True)
         
-        # Display user message
-        self.append_user_message(message)
+        # Display user message (one clock read serves display and history)
+        now = datetime.now()
+        self.append_user_message(message, now.strftime("%H:%M:%S"))
         
         # Add to conversation history
         self.conversation_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'role': 'user',
             'content': message
         })
         
-        # Query the chatbot
-        try:
-            # Call the chatbot endpoint directly for cleaner response
-            result = self.sealgeo_agent._query_chatbot(message)
-            
-            if result and 'answer' in result:
-                response = result['answer']
-                self.append_bot_message(response)
-                
-                # Add to conversation history
-                self.conversation_history.append({
-                    'timestamp': datetime.now().isoformat(),
-                    'role': 'assistant',
-                    'content': response
-                })
-            else:
-                error_msg = "No response received from the chatbot. Please try again."
-                self.append_error_message(error_msg)
-                
-                # Still log the error in history
-                self.conversation_history.append({
-                    'timestamp': datetime.now().isoformat(),
-                    'role': 'error',
-                    'content': error_msg
-                })
+        # Query the chatbot on a worker thread; the slots below restore the UI.
+        # The thread has no parent so closing the dialog cannot destroy it
+        # while a request is in flight.
+        self._worker_thread = QThread()
+        self._worker = ChatbotWorker(self.sealgeo_agent, message)
+        _active_workers[self._worker_thread] = self._worker
+        self._worker.moveToThread(self._worker_thread)
+        self._worker_thread.started.connect(self._worker.run)
+        self._worker.resultReady.connect(self._on_bot_reply)
+        self._worker.errorOccurred.connect(self._on_bot_error)
+        self._worker.finished.connect(self._worker_thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._worker_thread.finished.connect(self._worker_thread.deleteLater)
+        # Drop the references only once deleteLater has destroyed the thread
+        self._worker_thread.destroyed.connect(
+            lambda _obj=None, thread=self._worker_thread: _active_workers.pop(thread, None))
+        self._worker_thread.start()
+    
+    def _on_bot_reply(self, result):
+        """Handle a chatbot response delivered by the worker.
         
-        except Exception as e:
-            error_msg = f"Failed to query chatbot: {str(e)}"
+        Args:
+            result: Response dictionary or None
+        """
+        if result and 'answer' in result:
+            response = result['answer']
+            now = datetime.now()
+            self.append_bot_message(response, now.strftime("%H:%M:%S"))
+            
+            # Add to conversation history
+            self.conversation_history.append({
+                'timestamp': now.isoformat(),
+                'role': 'assistant',
+                'content': response
+            })
+        else:
+            error_msg = "No response received from the chatbot. Please try again."
             self.append_error_message(error_msg)
             
-            # Log error in history
+            # Still log the error in history
             self.conversation_history.append({
                 'timestamp': datetime.now().isoformat(),
                 'role': 'error',
                 'content': error_msg
             })
         
-        finally:
-            # Re-enable input
-            self.input_field.setEnabled(True)
-            self.send_button.setEnabled(True)
-            self.send_button.setText("Send")
-            self.input_field.setFocus()
+        self._restore_input()
+    
+    def _on_bot_error(self, error):
+        """Handle a chatbot query failure delivered by the worker.
+        
+        Args:
+            error: Error description
+        """
+        error_msg = f"Failed to query chatbot: {error}"
+        self.append_error_message(error_msg)
+        
+        # Log error in history
+        self.conversation_history.append({
+            'timestamp': datetime.now().isoformat(),
+            'role': 'error',
+            'content': error_msg
+        })
+        
+        self._restore_input()
+    
+    def _restore_input(self):
+        """Re-enable input after a query completes."""
+        self._set_input_busy(False)
+        self.input_field.setFocus()
+    
+    def _set_input_busy(self, busy):
+        """Toggle the input widgets with a single repaint.
+        
+        Args:
+            busy: True to disable input while a query runs
+        """
+        self.setUpdatesEnabled(False)
+        self.input_field.setEnabled(not busy)
+        self.send_button.setEnabled(not busy)
+        self.send_button.setText("Sending..." if busy else "Send")
+        self.setUpdatesEnabled(True)
+    
+    def done(self, result):
+        """Close the dialog without waiting for an in-flight query.
+        
+        The worker is detached from the dialog and cleans itself up once
+        its request returns.
+        
+        Args:
+            result: Dialog result code
+        """
+        if self._worker is not None:
+            try:
+                self._worker.resultReady.disconnect(self._on_bot_reply)
+                self._worker.errorOccurred.disconnect(self._on_bot_error)
+            except (TypeError, RuntimeError):
+                # Already finished: disconnected or deleted
+                pass
+            self._worker = None
+            self._worker_thread = None
+        super().done(result)
     
     def clear_chat(self):
         """Clear the chat history."""
+        from qgis.PyQt.QtWidgets import QMessageBox
+        
         reply = QMessageBox.question(
             self,
             "Clear Chat",
@@ -297,11 +417,13 @@ class ChatDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             self.chat_display.clear()
-            self.conversation_history = []
+            self.conversation_history = deque(maxlen=_MAX_HISTORY)
             self.append_system_message("Chat cleared. Start a new conversation!")
     
     def save_conversation(self):
         """Save the conversation to a file."""
+        from qgis.PyQt.QtWidgets import QFileDialog, QMessageBox
+        
         if not self.conversation_history:
             QMessageBox.information(
                 self,
@@ -343,30 +465,23 @@ class ChatDialog(QDialog):
     
     def _save_as_text(self, file_path):
         """Save conversation as formatted text file."""
+        parts = [
+            f"{_HRULE}\n"
+            "SEAL Geo RAG Chatbot - Conversation Transcript\n"
+            f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{_HRULE}\n\n"
+        ]
+        
+        for entry in self.conversation_history:
+            timestamp = datetime.fromisoformat(entry['timestamp']).strftime('%H:%M:%S')
+            label = _ROLE_LABELS.get(entry['role'])
+            header = f"[{timestamp}] {label}:\n" if label else ""
+            parts.append(f"{header}{entry['content']}\n\n{_SEP}\n\n")
+        
+        parts.append(f"{_HRULE}\nEnd of Conversation\n{_HRULE}\n")
+        
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("SEAL Geo RAG Chatbot - Conversation Transcript\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            for entry in self.conversation_history:
-                timestamp = datetime.fromisoformat(entry['timestamp']).strftime('%H:%M:%S')
-                role = entry['role'].upper()
-                content = entry['content']
-                
-                if role == 'USER':
-                    f.write(f"[{timestamp}] YOU:\n")
-                elif role == 'ASSISTANT':
-                    f.write(f"[{timestamp}] SEAL GEO RAG:\n")
-                elif role == 'ERROR':
-                    f.write(f"[{timestamp}] ERROR:\n")
-                
-                f.write(f"{content}\n")
-                f.write("\n" + "-" * 80 + "\n\n")
-            
-            f.write("=" * 80 + "\n")
-            f.write("End of Conversation\n")
-            f.write("=" * 80 + "\n")
+            f.write(''.join(parts))
     
     def _save_as_json(self, file_path):
         """Save conversation as JSON file."""
@@ -376,11 +491,12 @@ class ChatDialog(QDialog):
             'session_id': datetime.now().strftime('%Y%m%d_%H%M%S'),
             'timestamp': datetime.now().isoformat(),
             'chatbot': 'SEAL Geo RAG',
-            'conversation': self.conversation_history
+            'conversation': list(self.conversation_history)
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Compact separators keep the C encoder on the fast path
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            json.dump(output, f, ensure_ascii=False, separators=(',', ':'))
     
     def get_conversation_history(self):
         """Get the conversation history.
@@ -388,4 +504,4 @@ class ChatDialog(QDialog):
         Returns:
             List of conversation entries
         """
-        return self.conversation_history
+        return list(self.conversation_history)
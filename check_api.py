@@ -3,53 +3,110 @@
 Quick diagnostic to check sealgeo.servequake.com API availability.
 """
 
-import urllib.request
+import http.client
 import socket
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+# Keep-alive connections, one per (scheme, host) per worker thread
+_local = threading.local()
+
+def _get_connection(scheme, host, timeout):
+    """Return this thread's reusable connection for scheme and host."""
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get((scheme, host))
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        conn = connections[(scheme, host)] = conn_class(host, timeout=timeout)
+    return conn
+
+def _drop_connection(scheme, host):
+    """Close and forget this thread's connection for scheme and host."""
+    conn = getattr(_local, 'connections', {}).pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+def check_endpoint(url, method='HEAD', timeout=5, max_redirects=10):
+    """Check if an endpoint is accessible.
+
+    HEAD avoids downloading the body; servers that reject it with
+    405 are retried with GET. Redirects are followed like urlopen does,
+    up to max_redirects. Connections are kept alive so probes to the
+    same host share one TCP/TLS handshake.
+
+    Returns:
+        Tuple (url, ok, info) where info is a list of report lines
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
 
-def check_endpoint(url, method='GET', timeout=5):
-    """Check if an endpoint is accessible."""
-    print(f"Checking: {url}")
     try:
-        req = urllib.request.Request(
-            url,
-            headers={
-                'User-Agent': 'Mozilla/5.0',
-                'Accept': 'application/json'
-            },
-            method=method
-        )
-        
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            print(f"  ✓ Status: {response.status}")
-            print(f"  Content-Type: {response.headers.get('Content-Type')}")
-            return True
-            
-    except urllib.error.HTTPError as e:
-        print(f"  ✗ HTTP Error: {e.code} {e.reason}")
-        return False
-    except urllib.error.URLError as e:
-        print(f"  ✗ URL Error: {e.reason}")
-        return False
+        for attempt in range(2):
+            conn = _get_connection(parts.scheme, parts.netloc, timeout)
+            try:
+                conn.request(method, path, headers={
+                    'User-Agent': 'Mozilla/5.0',
+                    'Accept': 'application/json'
+                })
+                response = conn.getresponse()
+                response.read()
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # Server closed the idle keep-alive connection; reconnect once
+                _drop_connection(parts.scheme, parts.netloc)
+                if attempt:
+                    raise
+
+        if response.status == 405 and method == 'HEAD':
+            return check_endpoint(url, method='GET', timeout=timeout, max_redirects=max_redirects)
+        location = response.getheader('Location')
+        if 300 <= response.status < 400 and location:
+            if max_redirects <= 0:
+                return url, False, [f"  ✗ Too many redirects"]
+            location = urllib.parse.urljoin(url, location)
+            _, ok, info = check_endpoint(location, method=method, timeout=timeout,
+                                         max_redirects=max_redirects - 1)
+            return url, ok, [f"  → {response.status} redirect to {location}"] + info
+        if response.status >= 400:
+            return url, False, [f"  ✗ HTTP Error: {response.status} {response.reason}"]
+        return url, True, [
+            f"  ✓ Status: {response.status} ({method})",
+            f"  Content-Type: {response.getheader('Content-Type')}"
+        ]
+
     except socket.timeout:
-        print(f"  ✗ Timeout")
-        return False
+        _drop_connection(parts.scheme, parts.netloc)
+        return url, False, [f"  ✗ Timeout"]
+    except OSError as e:
+        _drop_connection(parts.scheme, parts.netloc)
+        return url, False, [f"  ✗ URL Error: {e}"]
     except Exception as e:
-        print(f"  ✗ Error: {str(e)}")
-        return False
+        _drop_connection(parts.scheme, parts.netloc)
+        return url, False, [f"  ✗ Error: {str(e)}"]
+
+def print_result(result):
+    """Print the report lines of a check_endpoint result."""
+    url, ok, info = result
+    print(f"Checking: {url}")
+    for line in info:
+        print(line)
 
 print("=" * 70)
 print("Checking sealgeo.servequake.com endpoints")
+print("Probing with HEAD (GET if the server answers 405); redirects are followed")
 print("=" * 70)
 print()
 
-# Check base URL
-print("Base URLs:")
-check_endpoint("https://sealgeo.servequake.com")
-check_endpoint("http://sealgeo.servequake.com")
-print()
+base_urls = [
+    "https://sealgeo.servequake.com",
+    "http://sealgeo.servequake.com",
+]
 
-# Check API endpoints
-print("API Endpoints:")
 endpoints = [
     "https://sealgeo.servequake.com/api",
     "https://sealgeo.servequake.com/api/v1",
@@ -59,8 +116,21 @@ endpoints = [
     "https://sealgeo.servequake.com/chat",
 ]
 
-for endpoint in endpoints:
-    check_endpoint(endpoint)
+# Probe concurrently with a few workers so each reuses its connection,
+# then report in order
+with ThreadPoolExecutor(max_workers=3) as executor:
+    results = list(executor.map(check_endpoint, base_urls + endpoints))
+
+# Check base URL
+print("Base URLs:")
+for result in results[:len(base_urls)]:
+    print_result(result)
+print()
+
+# Check API endpoints
+print("API Endpoints:")
+for result in results[len(base_urls):]:
+    print_result(result)
     print()
 
 print("=" * 70)
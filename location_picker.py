@@ -24,6 +24,24 @@ class LocationPickerTool(QgsMapToolEmitPoint):
         self.canvas = canvas
         self.cursor = QCursor(Qt.CrossCursor)
         
+        # Cached map CRS -> EPSG:4326 transform, rebuilt when the map CRS changes
+        self._xform_to_4326 = None
+        self.canvas.destinationCrsChanged.connect(self._invalidate_transform)
+        
+    def _transform_to_4326(self):
+        """Return the cached transform from the map CRS to EPSG:4326."""
+        if self._xform_to_4326 is None:
+            self._xform_to_4326 = QgsCoordinateTransform(
+                self.canvas.mapSettings().destinationCrs(),
+                QgsCoordinateReferenceSystem('EPSG:4326'),
+                QgsProject.instance()
+            )
+        return self._xform_to_4326
+    
+    def _invalidate_transform(self):
+        """Drop the cached transform after a map CRS change."""
+        self._xform_to_4326 = None
+        
     def canvasPressEvent(self, event):
         """Handle mouse press event on the map canvas.
         
@@ -33,15 +51,9 @@ class LocationPickerTool(QgsMapToolEmitPoint):
         # Get the clicked point in map coordinates
         point = self.toMapCoordinates(event.pos())
         
-        # Transform to EPSG:4326 (WGS84) for geocoding
-        transform = QgsCoordinateTransform(
-            self.canvas.mapSettings().destinationCrs(),
-            QgsCoordinateReferenceSystem('EPSG:4326'),
-            QgsProject.instance()
-        )
-        
         try:
-            point_4326 = transform.transform(point)
+            # Transform to EPSG:4326 (WGS84) for geocoding
+            point_4326 = self._transform_to_4326().transform(point)
             # Emit signal with longitude, latitude
             self.locationPicked.emit(point_4326.x(), point_4326.y())
         except Exception as e:
@@ -51,6 +63,7 @@ class LocationPickerTool(QgsMapToolEmitPoint):
         """Activate the tool."""
         super().activate()
         self.canvas.setCursor(self.cursor)
+        self._transform_to_4326()
     
     def deactivate(self):
         """Deactivate the tool."""
@@ -2,9 +2,29 @@
 Parse Red River Flood Ontology to extract mission-relevant concepts.
 """
 
-import xml.etree.ElementTree as ET
+import functools
+import sys
 import os
 
+# XML namespaces used by the ontology
+_NAMESPACES = {
+    'rdf': sys.intern('http://www.w3.org/1999/02/22-rdf-syntax-ns#'),
+    'rdfs': sys.intern('http://www.w3.org/2000/01/rdf-schema#'),
+    'owl': sys.intern('http://www.w3.org/2002/07/owl#'),
+    'rrf': sys.intern('http://emergency-mgmt.org/red-river-flood#')
+}
+
+# Clark-notation tag and attribute names
+_RDF_DESCRIPTION = sys.intern('{%s}Description' % _NAMESPACES['rdf'])
+_RDF_TYPE = sys.intern('{%s}type' % _NAMESPACES['rdf'])
+_RDF_RESOURCE = sys.intern('{%s}resource' % _NAMESPACES['rdf'])
+_RDF_ABOUT = sys.intern('{%s}about' % _NAMESPACES['rdf'])
+_RDFS_LABEL = sys.intern('{%s}label' % _NAMESPACES['rdfs'])
+_OWL_CLASS = sys.intern(_NAMESPACES['owl'] + 'Class')
+
+# File extensions marking document instances rather than concepts
+_DOC_EXTENSIONS = ('.pdf', '.doc', '.txt')
+
 
 def parse_red_river_ontology(owl_file_path):
     """
@@ -13,37 +33,38 @@ def parse_red_river_ontology(owl_file_path):
     Returns:
         List of tuples (label, uri) for main ontology classes
     """
+    import xml.etree.ElementTree as ET
+    
     try:
-        tree = ET.parse(owl_file_path)
-        root = tree.getroot()
-        
-        # Define namespaces
-        namespaces = {
-            'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
-            'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
-            'owl': 'http://www.w3.org/2002/07/owl#',
-            'rrf': 'http://emergency-mgmt.org/red-river-flood#'
-        }
-        
         concepts = []
         
-        # Find all RDF descriptions that are OWL classes
-        for desc in root.findall('.//rdf:Description', namespaces):
-            # Check if it's a Class
-            type_elem = desc.find('rdf:type[@rdf:resource="http://www.w3.org/2002/07/owl#Class"]', namespaces)
+        # Stream RDF descriptions instead of loading the whole DOM
+        for event, desc in ET.iterparse(owl_file_path, events=('end',)):
+            if desc.tag != _RDF_DESCRIPTION:
+                continue
             
-            if type_elem is not None:
-                # Get the label
-                label_elem = desc.find('rdfs:label', namespaces)
-                about_attr = desc.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about')
+            # Scan children once for the Class type and the label
+            is_class = False
+            label = None
+            for child in desc:
+                if child.tag == _RDF_TYPE:
+                    if child.get(_RDF_RESOURCE) == _OWL_CLASS:
+                        is_class = True
+                elif child.tag == _RDFS_LABEL and label is None:
+                    label = child.text
+            
+            if is_class:
+                about_attr = desc.get(_RDF_ABOUT)
                 
-                if label_elem is not None and about_attr:
-                    label = label_elem.text
+                if label and about_attr:
                     uri = about_attr.split('#')[-1] if '#' in about_attr else about_attr
                     
                     # Filter out document-specific instances (e.g., PDF files)
-                    if not any(ext in label.lower() for ext in ['.pdf', '.doc', '.txt']):
+                    if not label[-4:].lower().endswith(_DOC_EXTENSIONS):
                         concepts.append((label, uri))
+            
+            # Release the processed subtree
+            desc.clear()
         
         # Sort by label
         concepts.sort(key=lambda x: x[0])
@@ -55,12 +76,28 @@ def parse_red_river_ontology(owl_file_path):
         return []
 
 
+# Concepts offered when the ontology file is missing or yields no labels
+_FALLBACK_CONCEPTS = (
+    "Riverine Flooding",
+    "Emergency Service",
+    "Emergency Response",
+    "Flood Hazard",
+    "Infrastructure Protection",
+    "Evacuation",
+    "Red River Flood"
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_mission_concepts():
     """
     Get mission-relevant concepts from the Red River Flood ontology.
     
+    The ontology is static per install, so the result is computed once
+    per process and shared as an immutable tuple.
+    
     Returns:
-        List of concept labels suitable for mission selection
+        Tuple of concept labels suitable for mission selection
     """
     # Path to ontology file
     ontology_path = os.path.join(
@@ -70,34 +107,18 @@ def get_mission_concepts():
     
     if not os.path.exists(ontology_path):
         # Fallback to predefined concepts if file not found
-        return [
-            "Riverine Flooding",
-            "Emergency Service",
-            "Emergency Response",
-            "Flood Hazard",
-            "Infrastructure Protection",
-            "Evacuation",
-            "Red River Flood"
-        ]
+        return _FALLBACK_CONCEPTS
     
     concepts = parse_red_river_ontology(ontology_path)
     
     # Extract just the labels
-    labels = [label for label, uri in concepts if label]
+    labels = tuple(label for label, uri in concepts if label)
     
     # If we got concepts, return them; otherwise use fallback
     if labels:
         return labels
     else:
-        return [
-            "Riverine Flooding",
-            "Emergency Service",
-            "Emergency Response",
-            "Flood Hazard",
-            "Infrastructure Protection",
-            "Evacuation",
-            "Red River Flood"
-        ]
+        return _FALLBACK_CONCEPTS
 
 
 if __name__ == "__main__":
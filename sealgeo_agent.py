@@ -4,80 +4,702 @@ API Documentation: https://sealgeo.servequake.com/api (Swagger UI)
 OpenAPI Spec: https://sealgeo.servequake.com/api/openapi.json
 """
 
+import hashlib
+import io
 import json
+import logging
+import os
+import socket
+import statistics
+import threading
+import time
 import urllib.request
 import urllib.parse
 import urllib.error
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Tuple
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+log = logging.getLogger('ShareCOP.SEALGeo')
+
+DEFAULT_BASE_URL = "https://sealgeo.servequake.com"
+
+# Response cache defaults: a per-user cache dir for standalone use; the
+# plugin's shared agent keeps its cache in the QGIS profile (see get())
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'sealgeo'
+)
+PROFILE_CACHE_DIR_NAME = 'sealgeo_cache'
+CACHE_TTL = 600  # seconds
+MEMORY_CACHE_SIZE = 128
+DISK_CACHE_SIZE = 512
+
+# Shared read-only default for missing mappings
+_EMPTY = {}
+
+_UTC = timezone.utc
+
+# JSON codec: orjson when available, stdlib otherwise; _dumps returns UTF-8 bytes.
+# _dumps_sorted is compact with sorted keys and byte-identical either way,
+# so cache keys do not change when orjson is installed or removed.
+if ORJSON_AVAILABLE:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    
+    def _dumps_sorted(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+    
+    def _dumps_sorted(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# Chatbot responses larger than this are parsed incrementally when ijson is available
+STREAM_PARSE_THRESHOLD = 64 * 1024
+CHATBOT_RESPONSE_KEYS = frozenset(("answer", "response", "suggestions", "items"))
+
+# Circuit breaker: skip an endpoint for BREAKER_COOLDOWN seconds after
+# BREAKER_THRESHOLD consecutive failures
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 120  # seconds
+
+# Adaptive read timeout: twice the rolling p95 latency of an endpoint, never
+# below TIMEOUT_FLOOR; its ceiling grows by TIMEOUT_BACKOFF after each
+# timeout, up to TIMEOUT_MAX
+LATENCY_SAMPLES = 20
+TIMEOUT_FLOOR = 5  # seconds
+TIMEOUT_MAX = 45  # seconds
+TIMEOUT_BACKOFF = 1.5
+
+# Pooled sockets: urllib3's defaults (TCP_NODELAY) plus keepalive and larger buffers
+SOCKET_BUFFER_SIZE = 256 * 1024
+
+
+# Mock entries that do not depend on the mission text; copied into each result
+_MOCK_PLANNING_SUGGESTION = {
+    "title": "Mission Planning Resources",
+    "content": "Templates and checklists for mission preparation."
+}
+_MOCK_COP_GUIDELINES_ITEM = {
+    "title": "Common Operating Picture Guidelines",
+    "description": "Best practices for COP creation and sharing",
+    "url": "https://sealgeo.webgis1.com/demo/"
+}
+
+
+class _HttpxStream(io.RawIOBase):
+    """File-like view of a streaming httpx response, shaped like urllib3's."""
+    
+    def __init__(self, response):
+        self.status = response.status_code
+        self.headers = response.headers
+        self._chunks = response.iter_bytes()
+        self._pending = b''
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        while not self._pending:
+            self._pending = next(self._chunks, None)
+            if self._pending is None:
+                self._pending = b''
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _mock_result(mission_text: str) -> Dict:
+    """Build a fresh mock result entry for a mission; callers may modify it."""
+    return {
+        "source": "mock",
+        "data": {
+            "response": f"Mock response for mission: {mission_text}",
+            "suggestions": [
+                {
+                    "title": f"Related Mission: {mission_text} Protocol",
+                    "content": "Standard operating procedures and guidelines for this type of mission."
+                },
+                {
+                    "title": f"Previous {mission_text} Operations",
+                    "content": "Historical data and lessons learned from similar missions."
+                },
+                dict(_MOCK_PLANNING_SUGGESTION)
+            ],
+            "items": [
+                {
+                    "title": f"{mission_text} - Reference Data",
+                    "description": "Geospatial datasets relevant to this mission type",
+                    "url": "https://sealgeo.webgis1.com/demo/"
+                },
+                dict(_MOCK_COP_GUIDELINES_ITEM)
+            ]
+        }
+    }
 
 
 class SEALGeoAgent:
     """Agent for querying SEAL Geo RAG API with mission text."""
     
-    def __init__(self, base_url="https://sealgeo.servequake.com"):
+    # Endpoint -> (consecutive failures, last failure time), shared by all
+    # agents in the session
+    _breaker = {}
+    _breaker_lock = threading.Lock()
+    
+    # Session-wide agent returned by get()
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, base_url: Optional[str] = None) -> 'SEALGeoAgent':
+        """
+        Return the shared agent, creating it on first use.
+        
+        Sharing one agent keeps its connection pool, response cache and
+        endpoint discovery warm across dialogs for the whole QGIS session.
+        Its on-disk cache lives in the QGIS profile settings directory.
+        
+        Args:
+            base_url: Base URL used if the agent has not been created yet
+            
+        Returns:
+            The session-wide SEALGeoAgent
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(base_url or DEFAULT_BASE_URL, cache_dir=cls._profile_cache_dir())
+            return cls._instance
+    
+    @staticmethod
+    def _profile_cache_dir() -> str:
+        """Response cache directory in the QGIS profile, or CACHE_DIR outside QGIS."""
+        try:
+            from qgis.core import QgsApplication
+        except ImportError:
+            return CACHE_DIR
+        return os.path.join(QgsApplication.qgisSettingsDirPath(), PROFILE_CACHE_DIR_NAME)
+    
+    @classmethod
+    def release(cls):
+        """Close and forget the shared agent, if one was created."""
+        with cls._instance_lock:
+            instance, cls._instance = cls._instance, None
+        if instance is not None:
+            instance.close()
+    
+    def __init__(self, base_url=DEFAULT_BASE_URL, cache_dir=CACHE_DIR, transport=None):
         """
         Initialize SEAL Geo agent.
         
         Args:
             base_url: Base URL for SEAL Geo RAG service
+            cache_dir: Directory for the on-disk response cache, or None to
+                keep responses in memory only
+            transport: 'httpx' to multiplex concurrent requests over one
+                HTTP/2 connection (needs httpx and h2); None uses urllib3
+                or urllib
         """
         self.base_url = base_url
         self.chat_endpoint = f"{base_url}/chat"  # Chat endpoint: /chat (not /api/chat)
         self.api_url = f"{base_url}/api"  # API docs/spec: /api
         self.timeout = 30  # Increased timeout for RAG processing
+        self.connect_timeout = 3  # Connect phase of speculative search/STAC probes
+        
+        # Request constants shared by every query
+        self._get_headers = {
+            'User-Agent': 'QGIS ShareCOP Plugin/1.0',
+            'Accept': 'application/json'
+        }
+        self._json_headers = dict(self._get_headers, **{'Content-Type': 'application/json'})
+        # Search URL prefixes; the quoted query is appended as-is
+        self._search_prefixes = (
+            f"{self.api_url}/search?q=",
+            f"{self.api_url}/missions?search=",
+            f"{self.base_url}/api/search?query="
+        )
+        # Search prefixes narrowed by OpenAPI discovery or pinned on success
+        self._discovered_endpoints = {}
+        self._stac_endpoints = [
+            f"{self.api_url}/stac/search",
+            f"{self.base_url}/stac/search"
+        ]
+        
+        # HTTP/2 client when requested and installed
+        self._client = None
+        if transport == 'httpx':
+            if HTTPX_AVAILABLE:
+                try:
+                    self._client = httpx.Client(
+                        http2=True,
+                        timeout=httpx.Timeout(self.timeout, connect=5),
+                        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4)
+                    )
+                except ImportError:
+                    log.warning("[SEAL Geo] HTTP/2 needs the h2 package, using the default transport")
+            else:
+                log.warning("[SEAL Geo] httpx is not installed, using the default transport")
+        
+        # Keep-alive connection pool shared by all queries (urllib fallback otherwise)
+        self._http = None
+        if self._client is None and URLLIB3_AVAILABLE:
+            self._http = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=8,
+                timeout=urllib3.Timeout(connect=5, read=self.timeout),
+                retries=urllib3.Retry(total=2, backoff_factor=0.2),
+                socket_options=urllib3.connection.HTTPConnection.default_socket_options + [
+                    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                    (socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE),
+                    (socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+                ]
+            )
+    
+        # Per-endpoint latency samples and timeout ceilings for adaptive timeouts
+        self._latency_stats = {}
+        self._timeout_caps = {}
+        
+        # Response cache: in-memory LRU in front of an on-disk store
+        self.cache_dir = cache_dir
+        self.cache_ttl = CACHE_TTL
+        self._memory_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def close(self):
+        """Release pooled connections."""
+        if self._client is not None:
+            self._client.close()
+        if self._http is not None:
+            self._http.clear()
+    
+    def _cache_key(self, endpoint: str, payload) -> str:
+        """Build a cache key from an endpoint and its JSON-serializable payload."""
+        return hashlib.sha1(endpoint.encode('utf-8') + b'|' + _dumps_sorted(payload)).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """
+        Return a cached response if it is younger than the cache TTL.
+        
+        Args:
+            key: Cache key from _cache_key
+            
+        Returns:
+            Cached response or None on miss
+        """
+        now = time.time()
+        with self._cache_lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                if now - entry[0] < self.cache_ttl:
+                    self._memory_cache.move_to_end(key)
+                    return entry[1]
+                del self._memory_cache[key]
+        
+        if not self.cache_dir:
+            return None
+        
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            stored_at = os.path.getmtime(path)
+            if now - stored_at >= self.cache_ttl:
+                return None
+            with open(path, 'rb') as f:
+                value = _loads(f.read())
+        except (OSError, ValueError):
+            return None
         
-    def query_mission(self, mission_text: str) -> Optional[Dict]:
+        self._remember(key, stored_at, value)
+        return value
+    
+    def _cache_set(self, key: str, value: Dict):
+        """
+        Store a response in the memory and disk caches.
+        
+        Args:
+            key: Cache key from _cache_key
+            value: JSON-serializable response
+        """
+        self._remember(key, time.time(), value)
+        
+        if not self.cache_dir:
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, f"{key}.json")
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(value))
+            os.replace(tmp_path, path)
+            self._prune_disk_cache()
+        except (OSError, TypeError, ValueError) as e:
+            log.warning("[SEAL Geo] Could not write response cache: %s", e)
+    
+    def _remember(self, key: str, stored_at: float, value: Dict):
+        """Insert into the in-memory LRU, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._memory_cache[key] = (stored_at, value)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _prune_disk_cache(self):
+        """Remove the oldest cache files beyond DISK_CACHE_SIZE."""
+        entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith('.json')]
+        if len(entries) <= DISK_CACHE_SIZE:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - DISK_CACHE_SIZE]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+    
+    def warm_up(self) -> bool:
+        """
+        Open a pooled connection to the base URL ahead of the first query.
+        
+        A HEAD request pays DNS resolution and the TCP/TLS handshake up
+        front; the connection is kept alive for the queries that follow.
+        
+        Returns:
+            True if the server answered (any HTTP status), False otherwise
+        """
+        try:
+            self._request('HEAD', self.base_url, headers=self._get_headers,
+                          timeout=self.connect_timeout)
+        except urllib.error.HTTPError:
+            pass
+        except Exception as e:
+            log.debug("[SEAL Geo] Warm-up failed: %s", e)
+            return False
+        return True
+    
+    def invalidate(self):
+        """Drop all cached responses and endpoint discovery from memory and disk."""
+        with self._cache_lock:
+            self._memory_cache.clear()
+        self._discovered_endpoints.clear()
+        
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json'):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _breaker_key(endpoint: str) -> str:
+        """Circuit breaker key: the endpoint URL without its query string."""
+        return endpoint.split('?', 1)[0]
+    
+    def _breaker_open(self, endpoint: str) -> bool:
+        """Return True if the endpoint failed repeatedly and is cooling down."""
+        with self._breaker_lock:
+            state = self._breaker.get(self._breaker_key(endpoint))
+        if state is None:
+            return False
+        fail_count, last_fail = state
+        return fail_count >= BREAKER_THRESHOLD and time.time() - last_fail < BREAKER_COOLDOWN
+    
+    def _record_failure(self, endpoint: str):
+        """Count a failed request against the endpoint."""
+        key = self._breaker_key(endpoint)
+        with self._breaker_lock:
+            fail_count = self._breaker.get(key, (0, 0.0))[0]
+            self._breaker[key] = (fail_count + 1, time.time())
+    
+    def _record_success(self, endpoint: str):
+        """Reset the endpoint's failure count."""
+        with self._breaker_lock:
+            self._breaker.pop(self._breaker_key(endpoint), None)
+    
+    def _adaptive_timeout(self, key: str) -> float:
+        """Read timeout for an endpoint from its recent latencies and timeout ceiling."""
+        cap = self._timeout_caps.get(key, self.timeout)
+        samples = list(self._latency_stats.get(key, ()))
+        if len(samples) < 2:
+            return cap
+        p95 = statistics.quantiles(samples, n=20)[18]
+        return min(cap, max(TIMEOUT_FLOOR, 2 * p95))
+    
+    def _record_latency(self, key: str, elapsed: float):
+        """Add a successful request's duration to the endpoint's rolling window."""
+        samples = self._latency_stats.get(key)
+        if samples is None:
+            samples = self._latency_stats[key] = deque(maxlen=LATENCY_SAMPLES)
+        samples.append(elapsed)
+    
+    def _record_timeout(self, key: str):
+        """Raise the endpoint's timeout ceiling and wait for it on the next request."""
+        cap = self._timeout_caps.get(key, self.timeout)
+        self._timeout_caps[key] = min(TIMEOUT_MAX, cap * TIMEOUT_BACKOFF)
+        self._latency_stats.pop(key, None)
+    
+    @staticmethod
+    def _is_timeout(error: Exception) -> bool:
+        """Return True if a request error was caused by a socket or urllib3 timeout."""
+        reason = getattr(error, 'reason', error)
+        if isinstance(reason, socket.timeout):
+            return True
+        return URLLIB3_AVAILABLE and isinstance(reason, urllib3.exceptions.TimeoutError)
+    
+    @contextmanager
+    def _open(self, method: str, url: str, body: Optional[bytes] = None,
+              headers: Optional[Dict] = None, timeout: Optional[float] = None,
+              connect_timeout: float = 5):
+        """
+        Open an HTTP response for streaming reads, reusing pooled connections when available.
+        
+        Without an explicit timeout the read timeout adapts to the endpoint's
+        recent latency (see _adaptive_timeout).
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            body: Optional request body
+            headers: Optional request headers
+            timeout: Optional timeout in seconds (defaults to the adaptive timeout)
+            connect_timeout: Limit for the connect phase alone, in seconds
+                (the urllib fallback applies timeout to both phases)
+            
+        Yields:
+            File-like response with ``status`` and ``headers``
+            
+        Raises:
+            urllib.error.HTTPError: On 4xx/5xx responses
+            urllib.error.URLError: On connection failures
+        """
+        if timeout is not None:
+            with self._open_response(method, url, body, headers, timeout, connect_timeout) as response:
+                yield response
+            return
+        
+        key = self._breaker_key(url)
+        timeout = self._adaptive_timeout(key)
+        started = time.monotonic()
+        try:
+            with self._open_response(method, url, body, headers, timeout, connect_timeout) as response:
+                yield response
+        except (socket.timeout, urllib.error.URLError) as e:
+            if self._is_timeout(e):
+                log.debug("[SEAL Geo] Timed out after %.1fs at %s", timeout, key)
+                self._record_timeout(key)
+            raise
+        self._record_latency(key, time.monotonic() - started)
+    
+    @contextmanager
+    def _open_response(self, method: str, url: str, body: Optional[bytes],
+                       headers: Optional[Dict], timeout: float, connect_timeout: float):
+        """Open an HTTP response with a fixed timeout; see _open."""
+        if self._client is not None:
+            with self._open_httpx(method, url, body, headers, timeout, connect_timeout) as response:
+                yield response
+            return
+        
+        if self._http is None:
+            req = urllib.request.Request(url, data=body, headers=headers or {}, method=method)
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                yield response
+            return
+        
+        try:
+            response = self._http.request(
+                method, url, body=body, headers=headers,
+                timeout=urllib3.Timeout(connect=min(connect_timeout, timeout), read=timeout),
+                preload_content=False
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise urllib.error.URLError(getattr(e, 'reason', None) or e)
+        
+        try:
+            if response.status >= 400:
+                raise urllib.error.HTTPError(
+                    url, response.status, response.reason, response.headers, io.BytesIO(response.read())
+                )
+            yield response
+        except urllib3.exceptions.HTTPError as e:
+            raise urllib.error.URLError(getattr(e, 'reason', None) or e)
+        finally:
+            # Drain any unread body so the connection can go back to the pool
+            response.drain_conn()
+            response.release_conn()
+    
+    @contextmanager
+    def _open_httpx(self, method: str, url: str, body: Optional[bytes],
+                    headers: Optional[Dict], timeout: float, connect_timeout: float):
+        """Open a streaming response on the HTTP/2 client; see _open."""
+        try:
+            with self._client.stream(
+                method, url, content=body, headers=headers,
+                timeout=httpx.Timeout(timeout, connect=min(connect_timeout, timeout))
+            ) as response:
+                if response.status_code >= 400:
+                    raise urllib.error.HTTPError(
+                        url, response.status_code, response.reason_phrase, response.headers,
+                        io.BytesIO(response.read())
+                    )
+                yield _HttpxStream(response)
+        except httpx.TimeoutException as e:
+            raise urllib.error.URLError(socket.timeout(str(e)))
+        except httpx.HTTPError as e:
+            raise urllib.error.URLError(e)
+    
+    def _request(self, method: str, url: str, body: Optional[bytes] = None,
+                 headers: Optional[Dict] = None, timeout: Optional[float] = None,
+                 connect_timeout: float = 5) -> Tuple[int, bytes]:
+        """
+        Perform an HTTP request and read the whole response body.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            body: Optional request body
+            headers: Optional request headers
+            timeout: Optional timeout in seconds (defaults to the adaptive timeout)
+            connect_timeout: Limit for the connect phase alone, in seconds
+            
+        Returns:
+            Tuple (status, response body)
+            
+        Raises:
+            urllib.error.HTTPError: On 4xx/5xx responses
+            urllib.error.URLError: On connection failures
+        """
+        with self._open(method, url, body=body, headers=headers, timeout=timeout,
+                        connect_timeout=connect_timeout) as response:
+            return response.status, response.read()
+    
+    @staticmethod
+    def _read_chatbot_json(response) -> Dict:
+        """
+        Parse a chatbot JSON response.
+        
+        Large bodies are parsed incrementally with ijson, keeping only the
+        fields used downstream and stopping once all of them are seen.
+        
+        Args:
+            response: File-like HTTP response
+            
+        Returns:
+            Parsed response dictionary
+        """
+        length = int(response.headers.get('Content-Length') or 0)
+        if not IJSON_AVAILABLE or length <= STREAM_PARSE_THRESHOLD:
+            return _loads(response.read())
+        
+        result = {}
+        for key, value in ijson.kvitems(response, '', use_float=True):
+            if key in CHATBOT_RESPONSE_KEYS:
+                result[key] = value
+                if len(result) == len(CHATBOT_RESPONSE_KEYS):
+                    break
+        return result
+    
+    def query_mission(self, mission_text: str, limit: Optional[int] = None,
+                      source_names: Optional[Tuple[str, ...]] = None) -> Optional[Dict]:
         """
         Query SEAL Geo for mission-related data.
         
         Args:
             mission_text: Mission description or identifier
+            limit: Stop waiting for slower sources once this many options
+                have been collected (None waits for every source)
+            source_names: Names of the sources to query ("chatbot", "search",
+                "stac_catalog"); None queries all of them
             
         Returns:
-            Dictionary with query results or None if failed
+            Dictionary with query results or None if failed; ``elapsed_ms``
+            and ``stage_ms`` (per source) record how long the query took
         """
         if not mission_text or not mission_text.strip():
             return None
         
-        print(f"\n[SEAL Geo Agent] Starting query for mission: '{mission_text}'")
+        log.debug("[SEAL Geo Agent] Starting query for mission: '%s'", mission_text)
         
         try:
-            # Try multiple potential API endpoints
-            results = []
-            
-            # Try chatbot endpoint
-            print("[SEAL Geo Agent] Trying chatbot endpoint...")
-            chatbot_result = self._query_chatbot(mission_text)
-            if chatbot_result:
-                print(f"[SEAL Geo Agent] Chatbot returned: {chatbot_result}")
-                results.append({
-                    "source": "chatbot",
-                    "data": chatbot_result
-                })
+            # Query the independent endpoints concurrently; results keep this order
+            sources = {
+                "chatbot": self._query_chatbot,
+                "search": self._query_search,
+                "stac_catalog": self._query_stac_catalog
+            }
+            if source_names is not None:
+                sources = {source: fn for source, fn in sources.items() if source in source_names}
+            source_results = {}
+            stage_ms = {}
+            option_count = 0
             
-            # Try search endpoint
-            print("[SEAL Geo Agent] Trying search endpoint...")
-            search_result = self._query_search(mission_text)
-            if search_result:
-                print(f"[SEAL Geo Agent] Search returned: {search_result}")
-                results.append({
-                    "source": "search",
-                    "data": search_result
-                })
+            log.debug("[SEAL Geo Agent] Querying %s endpoints concurrently...", ", ".join(sources))
+            executor = ThreadPoolExecutor(max_workers=len(sources))
+            started = time.monotonic()
+            try:
+                futures = {
+                    executor.submit(query_fn, mission_text): source
+                    for source, query_fn in sources.items()
+                }
+                try:
+                    for future in as_completed(futures, timeout=TIMEOUT_MAX + 5):
+                        source = futures[future]
+                        stage_ms[source] = (time.monotonic() - started) * 1000
+                        try:
+                            data = future.result()
+                        except Exception as e:
+                            log.warning("[SEAL Geo Agent] %s query failed: %s", source, e)
+                            continue
+                        if data:
+                            log.debug("[SEAL Geo Agent] %s returned: %s", source, data)
+                            source_results[source] = data
+                            if limit is not None:
+                                option_count += len(self._extract_options([{"source": source, "data": data}]))
+                                if option_count >= limit:
+                                    log.debug("[SEAL Geo Agent] Collected %s options, not waiting for other sources", option_count)
+                                    for pending in futures:
+                                        pending.cancel()
+                                    break
+                except FuturesTimeoutError:
+                    # Keep whatever finished in time
+                    log.warning("[SEAL Geo Agent] Timed out waiting for some endpoints, using partial results")
+            finally:
+                executor.shutdown(wait=False)
             
-            # Try STAC catalog endpoint
-            print("[SEAL Geo Agent] Trying STAC catalog endpoint...")
-            stac_result = self._query_stac_catalog(mission_text)
-            if stac_result:
-                print(f"[SEAL Geo Agent] STAC returned: {stac_result}")
-                results.append({
-                    "source": "stac_catalog",
-                    "data": stac_result
-                })
+            results = [
+                {"source": source, "data": source_results[source]}
+                for source in sources
+                if source in source_results
+            ]
             
             # If no real results, create a mock result for testing
             if not results:
-                print("[SEAL Geo Agent] No API results, creating mock data for testing")
+                log.debug("[SEAL Geo Agent] No API results, creating mock data for testing")
                 results = self._create_mock_results(mission_text)
             
             if results:
@@ -85,186 +707,396 @@ class SEALGeoAgent:
                     "mission": mission_text,
                     "timestamp": self._get_timestamp(),
                     "results": results,
-                    "options": self._extract_options(results)
+                    "options": self._extract_options(results),
+                    "elapsed_ms": (time.monotonic() - started) * 1000,
+                    "stage_ms": stage_ms
                 }
-                print(f"[SEAL Geo Agent] Final result has {len(final_result['options'])} options")
+                log.debug("[SEAL Geo Agent] Final result has %s options", len(final_result['options']))
                 return final_result
             
-            print("[SEAL Geo Agent] No results available")
+            log.debug("[SEAL Geo Agent] No results available")
             return None
             
         except Exception as e:
-            print(f"[SEAL Geo Agent] Error querying SEAL Geo: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("[SEAL Geo Agent] Error querying SEAL Geo: %s", e)
+            log.debug("query_mission failed", exc_info=True)
             return None
     
+    def query_mission_batch(self, mission_texts: List[str],
+                            max_workers: int = 4) -> List[Optional[Dict]]:
+        """
+        Query SEAL Geo for several missions at once.
+        
+        The chat endpoint takes one question per request, so the queries
+        run concurrently over the shared connection pool instead. Repeated
+        texts (ignoring surrounding and repeated whitespace) are queried once.
+        
+        Args:
+            mission_texts: Mission descriptions or identifiers
+            max_workers: Maximum number of queries in flight at once
+            
+        Returns:
+            List of query_mission results in input order (None where a query
+            failed); repeated texts share one result dictionary
+        """
+        keys = [" ".join(text.split()) if text else "" for text in mission_texts]
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(unique), max_workers)) as executor:
+            results = dict(zip(unique, executor.map(self.query_mission, unique)))
+        return [results[key] for key in keys]
+    
     def _query_chatbot(self, query: str) -> Optional[Dict]:
         """Query the RAG chatbot endpoint at sealgeo.servequake.com/chat."""
         try:
             # Use the documented /chat endpoint
             endpoint = self.chat_endpoint
             
-            print(f"[SEAL Geo RAG] Querying chat endpoint: {endpoint}")
-            print(f"[SEAL Geo RAG] Query: {query}")
+            log.debug("[SEAL Geo RAG] Querying chat endpoint: %s", endpoint)
+            log.debug("[SEAL Geo RAG] Query: %s", query)
             
             # Prepare request data - the API expects 'question' parameter (not 'query')
             request_data = {
                 "question": query
             }
             
-            data = json.dumps(request_data).encode('utf-8')
-            print(f"[SEAL Geo RAG] Request payload: {request_data}")
+            cache_key = self._cache_key(endpoint, request_data)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                log.debug("[SEAL Geo RAG] ✓ Cached response")
+                return cached
+            
+            data = _dumps(request_data)
+            log.debug("[SEAL Geo RAG] Request payload: %s", request_data)
             
             try:
-                    
-                req = urllib.request.Request(
-                    endpoint,
-                    data=data,
-                    headers={
-                        'Content-Type': 'application/json',
-                        'User-Agent': 'QGIS ShareCOP Plugin/1.0',
-                        'Accept': 'application/json'
-                    },
-                    method='POST'
-                )
-                
-                with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                with self._open('POST', endpoint, body=data, headers=self._json_headers) as response:
                     if response.status == 200:
-                        result = json.loads(response.read().decode('utf-8'))
-                        print(f"[SEAL Geo RAG] ✓ Success! Got response")
-                        print(f"[SEAL Geo RAG] Response keys: {list(result.keys())}")
+                        result = self._read_chatbot_json(response)
+                        log.debug("[SEAL Geo RAG] ✓ Success! Got response")
+                        log.debug("[SEAL Geo RAG] Response keys: %s", list(result.keys()))
+                        self._cache_set(cache_key, result)
                         return result
                     else:
-                        print(f"[SEAL Geo RAG] Unexpected status: {response.status}")
+                        log.warning("[SEAL Geo RAG] Unexpected status: %s", response.status)
                         return None
                         
             except urllib.error.HTTPError as e:
-                print(f"[SEAL Geo RAG] ✗ HTTP Error {e.code}: {e.reason}")
+                log.warning("[SEAL Geo RAG] ✗ HTTP Error %s: %s", e.code, e.reason)
                 try:
                     error_body = e.read().decode('utf-8')
-                    print(f"[SEAL Geo RAG] Error details: {error_body[:500]}")
+                    log.warning("[SEAL Geo RAG] Error details: %s", error_body[:500])
                 except:
                     pass
             except urllib.error.URLError as e:
-                print(f"[SEAL Geo RAG] ✗ URL Error: {e.reason}")
+                log.warning("[SEAL Geo RAG] ✗ URL Error: %s", e.reason)
             except Exception as e:
-                print(f"[SEAL Geo RAG] ✗ Error: {str(e)}")
-                import traceback
-                traceback.print_exc()
+                log.warning("[SEAL Geo RAG] ✗ Error: %s", e)
+                log.debug("Chatbot request failed", exc_info=True)
                     
         except Exception as e:
-            print(f"[SEAL Geo] Chatbot query failed: {e}")
+            log.warning("[SEAL Geo] Chatbot query failed: %s", e)
         
         return None
     
     def _query_search(self, query: str) -> Optional[Dict]:
         """Query search endpoint."""
         try:
-            # Encode query for URL
+            cache_key = self._cache_key(f"{self.api_url}/search", {"q": query})
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                log.debug("[SEAL Geo] Search cache hit for: %s", query)
+                return cached
+            
+            # Encode query for URL once and try the search patterns the server offers
             encoded_query = urllib.parse.quote(query)
+            prefixes = self._discover_search_prefixes()
             
-            # Try common search patterns
-            endpoints = [
-                f"{self.api_url}/search?q={encoded_query}",
-                f"{self.api_url}/missions?search={encoded_query}",
-                f"{self.base_url}/api/search?query={encoded_query}"
-            ]
+            log.debug("[SEAL Geo] Trying search endpoints for: %s", query)
             
-            print(f"[SEAL Geo] Trying search endpoints for: {query}")
+            endpoints = {prefix + encoded_query: prefix for prefix in prefixes}
+            winner = self._first_success('Search', 'GET', endpoints, headers=self._get_headers)
+            if winner is not None:
+                endpoint, result = winner
+                self._pin_search_prefix(endpoints[endpoint])
+                self._cache_set(cache_key, result)
+                return result
             
-            for endpoint in endpoints:
-                try:
-                    print(f"[SEAL Geo] Search trying: {endpoint}")
-                    req = urllib.request.Request(
-                        endpoint,
-                        headers={
-                            'User-Agent': 'QGIS ShareCOP Plugin/1.0',
-                            'Accept': 'application/json'
-                        }
-                    )
-                    
-                    with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                        if response.status == 200:
-                            result = json.loads(response.read().decode('utf-8'))
-                            print(f"[SEAL Geo] Search success at: {endpoint}")
-                            return result
-                            
-                except urllib.error.HTTPError as e:
-                    print(f"[SEAL Geo] Search HTTP Error {e.code} at {endpoint}")
-                    continue
-                except urllib.error.URLError as e:
-                    print(f"[SEAL Geo] Search URL Error at {endpoint}: {e.reason}")
-                    continue
-                except Exception as e:
-                    print(f"[SEAL Geo] Search error at {endpoint}: {str(e)}")
-                    continue
-            
-            print("[SEAL Geo] All search endpoints failed")
+            self._unpin_search_prefix(prefixes)
+            log.warning("[SEAL Geo] All search endpoints failed")
                     
         except Exception as e:
-            print(f"Search query failed: {e}")
+            log.warning("Search query failed: %s", e)
+        
+        return None
+    
+    def _do_request(self, kind: str, method: str, endpoint: str, body: Optional[bytes] = None,
+                    headers: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Try one speculative endpoint and update its circuit breaker.
+        
+        Args:
+            kind: Endpoint family used in log output ("Search", "STAC")
+            method: HTTP method
+            endpoint: Request URL
+            body: Optional request body
+            headers: Optional request headers
+            
+        Returns:
+            Decoded JSON response, or None if the endpoint did not answer with 200
+        """
+        try:
+            log.debug("[SEAL Geo] %s trying: %s", kind, endpoint)
+            status, response_body = self._request(
+                method,
+                endpoint,
+                body=body,
+                headers=headers,
+                connect_timeout=self.connect_timeout
+            )
+            
+            if status == 200:
+                result = _loads(response_body)
+                log.debug("[SEAL Geo] %s success at: %s", kind, endpoint)
+                self._record_success(endpoint)
+                return result
+                
+        except urllib.error.HTTPError as e:
+            log.debug("[SEAL Geo] %s HTTP Error %s at %s", kind, e.code, endpoint)
+            self._record_failure(endpoint)
+        except urllib.error.URLError as e:
+            log.debug("[SEAL Geo] %s URL Error at %s: %s", kind, endpoint, e.reason)
+            self._record_failure(endpoint)
+        except Exception as e:
+            log.debug("[SEAL Geo] %s error at %s: %s", kind, endpoint, e)
         
         return None
     
+    def _first_success(self, kind: str, method: str, endpoints, body: Optional[bytes] = None,
+                       headers: Optional[Dict] = None) -> Optional[Tuple[str, Dict]]:
+        """
+        Hedge a request across endpoints and return the first successful answer.
+        
+        Endpoints whose circuit breaker is open are skipped; the others are
+        requested in parallel and the slower ones are abandoned once one
+        succeeds.
+        
+        Args:
+            kind: Endpoint family used in log output ("Search", "STAC")
+            method: HTTP method
+            endpoints: Candidate request URLs
+            body: Optional request body
+            headers: Optional request headers
+            
+        Returns:
+            Tuple (endpoint, decoded response), or None if every endpoint failed
+        """
+        healthy = []
+        for endpoint in endpoints:
+            if self._breaker_open(endpoint):
+                log.debug("[SEAL Geo] %s skipping failing endpoint: %s", kind, endpoint)
+            else:
+                healthy.append(endpoint)
+        
+        if len(healthy) <= 1:
+            for endpoint in healthy:
+                result = self._do_request(kind, method, endpoint, body, headers)
+                if result is not None:
+                    return endpoint, result
+            return None
+        
+        executor = ThreadPoolExecutor(max_workers=len(healthy))
+        try:
+            futures = {
+                executor.submit(self._do_request, kind, method, endpoint, body, headers): endpoint
+                for endpoint in healthy
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                if result is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    return futures[future], result
+        finally:
+            executor.shutdown(wait=False)
+        
+        return None
+    
+    def _discover_search_prefixes(self) -> Tuple[str, ...]:
+        """
+        Return the search URL prefixes worth trying.
+        
+        The server's OpenAPI spec is fetched once and candidates whose path
+        it does not list are dropped. The result is kept in memory and in
+        the response cache; a prefix that answers successfully is pinned
+        as the only candidate until it fails.
+        
+        Returns:
+            Tuple of search URL prefixes, best first
+        """
+        prefixes = self._discovered_endpoints.get('search')
+        if prefixes is not None:
+            return prefixes
+        
+        spec_url = f"{self.api_url}/openapi.json"
+        cache_key = self._cache_key(spec_url, 'search')
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            prefixes = tuple(cached.get('search', ())) or self._search_prefixes
+        else:
+            prefixes = self._search_prefixes
+            paths = self._fetch_openapi_paths(spec_url)
+            if paths:
+                api_path = urllib.parse.urlsplit(self.api_url).path
+                matching = tuple(
+                    prefix for prefix in self._search_prefixes
+                    for path in (urllib.parse.urlsplit(prefix).path,)
+                    if path in paths or (path.startswith(api_path) and path[len(api_path):] in paths)
+                )
+                if matching:
+                    prefixes = matching
+                log.debug("[SEAL Geo] Search endpoints from OpenAPI spec: %s", prefixes)
+                self._cache_set(cache_key, {"search": list(prefixes)})
+        
+        self._discovered_endpoints['search'] = prefixes
+        return prefixes
+    
+    def _fetch_openapi_paths(self, spec_url: str) -> Dict:
+        """Fetch the server's OpenAPI spec and return its paths, or {} on failure."""
+        if self._breaker_open(spec_url):
+            return _EMPTY
+        try:
+            status, body = self._request(
+                'GET',
+                spec_url,
+                headers=self._get_headers,
+                connect_timeout=self.connect_timeout
+            )
+            if status == 200:
+                self._record_success(spec_url)
+                paths = _loads(body).get('paths')
+                if isinstance(paths, dict):
+                    return paths
+        except (urllib.error.HTTPError, urllib.error.URLError) as e:
+            log.debug("[SEAL Geo] OpenAPI spec unavailable at %s: %s", spec_url, e)
+            self._record_failure(spec_url)
+        except (ValueError, AttributeError) as e:
+            log.debug("[SEAL Geo] Could not parse OpenAPI spec at %s: %s", spec_url, e)
+        return _EMPTY
+    
+    def _pin_search_prefix(self, prefix: str):
+        """Remember a search prefix that answered so later queries try it alone."""
+        if self._discovered_endpoints.get('search') == (prefix,):
+            return
+        self._discovered_endpoints['search'] = (prefix,)
+        self._cache_set(self._cache_key(f"{self.api_url}/openapi.json", 'search'),
+                        {"search": [prefix]})
+    
+    def _unpin_search_prefix(self, prefixes: Tuple[str, ...]):
+        """Fall back to every candidate after a pinned search prefix failed."""
+        if len(prefixes) == 1:
+            self._discovered_endpoints['search'] = self._search_prefixes
+    
     def _query_stac_catalog(self, query: str) -> Optional[Dict]:
         """Query STAC catalog endpoint."""
+        # STAC search query
+        search_query = {
+            "query": {
+                "cop:mission": {"eq": query}
+            },
+            "limit": 10
+        }
+        return self._stac_search(search_query, query)
+    
+    def _stac_search(self, search_query: Dict, label: str) -> Optional[Dict]:
+        """
+        POST a STAC search to the healthy STAC endpoints, keeping the first answer.
+        
+        Args:
+            search_query: STAC search body
+            label: Text identifying the search in log output
+            
+        Returns:
+            Decoded FeatureCollection, or None if every endpoint failed
+        """
         try:
             # STAC API search patterns
-            endpoints = [
-                f"{self.api_url}/stac/search",
-                f"{self.base_url}/stac/search"
-            ]
+            endpoints = self._stac_endpoints
             
-            # STAC search query
-            search_query = {
-                "query": {
-                    "cop:mission": {"eq": query}
-                },
-                "limit": 10
-            }
+            cache_key = self._cache_key(f"{self.api_url}/stac/search", search_query)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                log.debug("[SEAL Geo] STAC cache hit for: %s", label)
+                return cached
             
-            print(f"[SEAL Geo] Trying STAC endpoints for: {query}")
+            data = _dumps(search_query)
             
-            for endpoint in endpoints:
-                try:
-                    print(f"[SEAL Geo] STAC trying: {endpoint}")
-                    data = json.dumps(search_query).encode('utf-8')
-                    
-                    req = urllib.request.Request(
-                        endpoint,
-                        data=data,
-                        headers={
-                            'Content-Type': 'application/json',
-                            'User-Agent': 'QGIS ShareCOP Plugin/1.0',
-                            'Accept': 'application/json'
-                        },
-                        method='POST'
-                    )
-                    
-                    with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                        if response.status == 200:
-                            result = json.loads(response.read().decode('utf-8'))
-                            print(f"[SEAL Geo] STAC success at: {endpoint}")
-                            return result
-                            
-                except urllib.error.HTTPError as e:
-                    print(f"[SEAL Geo] STAC HTTP Error {e.code} at {endpoint}")
-                    continue
-                except urllib.error.URLError as e:
-                    print(f"[SEAL Geo] STAC URL Error at {endpoint}: {e.reason}")
-                    continue
-                except Exception as e:
-                    print(f"[SEAL Geo] STAC error at {endpoint}: {str(e)}")
-                    continue
-            
-            print("[SEAL Geo] All STAC endpoints failed")
+            log.debug("[SEAL Geo] Trying STAC endpoints for: %s", label)
+            
+            winner = self._first_success('STAC', 'POST', endpoints, body=data, headers=self._json_headers)
+            if winner is not None:
+                result = winner[1]
+                self._cache_set(cache_key, result)
+                return result
+            
+            log.warning("[SEAL Geo] All STAC endpoints failed")
                     
         except Exception as e:
-            print(f"STAC catalog query failed: {e}")
+            log.warning("STAC catalog query failed: %s", e)
         
         return None
     
+    def query_missions(self, texts: List[str]) -> Dict[str, Dict]:
+        """
+        Query the STAC catalog for several missions with a single request.
+        
+        Features are bucketed by their ``cop:mission`` property, so N
+        lookups cost one round trip instead of N.
+        
+        Args:
+            texts: Mission descriptions or keywords
+            
+        Returns:
+            Dictionary mapping each mission text to a result dictionary
+            shaped like query_mission's (mission, timestamp, results, options)
+        """
+        texts = [text for text in dict.fromkeys(texts) if text]
+        if not texts:
+            return {}
+        
+        search_query = {
+            "query": {
+                "cop:mission": {"in": texts}
+            },
+            "limit": 10 * len(texts)
+        }
+        stac_result = self._stac_search(search_query, ", ".join(texts))
+        
+        buckets = {text: [] for text in texts}
+        if stac_result:
+            for feature in stac_result.get("features", ()):
+                bucket = buckets.get(feature.get("properties", _EMPTY).get("cop:mission"))
+                if bucket is not None:
+                    bucket.append(feature)
+        
+        timestamp = self._get_timestamp()
+        results = {}
+        for text, features in buckets.items():
+            source_results = []
+            if features:
+                source_results.append({
+                    "source": "stac_catalog",
+                    "data": {"type": "FeatureCollection", "features": features}
+                })
+            results[text] = {
+                "mission": text,
+                "timestamp": timestamp,
+                "results": source_results,
+                "options": self._extract_options(source_results)
+            }
+        return results
+    
     def _extract_options(self, results: List[Dict]) -> List[Dict]:
         """
         Extract actionable options from query results.
@@ -276,127 +1108,103 @@ class SEALGeoAgent:
             List of option dictionaries with standardized format
         """
         options = []
+        extend = options.extend
+        append = options.append
         
         for result in results:
             source = result.get("source", "unknown")
-            data = result.get("data", {})
+            data = result.get("data", _EMPTY)
+            if not isinstance(data, dict):
+                continue
             
             if source == "chatbot" or source == "mock":
                 # Extract from chatbot/mock response
-                if isinstance(data, dict):
-                    # Handle 'answer' field from RAG API
-                    if "answer" in data:
-                        options.append({
-                            "type": "chatbot_response",
-                            "title": "RAG Assistant Response",
-                            "content": data["answer"],
-                            "source": source
-                        })
-                    # Handle legacy 'response' field
-                    if "response" in data:
-                        options.append({
-                            "type": "chatbot_response",
-                            "title": "AI Assistant Response",
-                            "content": data["response"],
-                            "source": source
-                        })
-                    if "suggestions" in data:
-                        for suggestion in data["suggestions"]:
-                            options.append({
-                                "type": "suggestion",
-                                "title": suggestion.get("title", "Suggestion"),
-                                "content": suggestion.get("content", ""),
-                                "source": source
-                            })
-                    if "items" in data:
-                        for item in data["items"]:
-                            options.append({
-                                "type": "reference",
-                                "title": item.get("title", "Reference"),
-                                "description": item.get("description", ""),
-                                "url": item.get("url", ""),
-                                "source": source
-                            })
+                # Handle 'answer' field from RAG API
+                if "answer" in data:
+                    append({
+                        "type": "chatbot_response",
+                        "title": "RAG Assistant Response",
+                        "content": data["answer"],
+                        "source": source
+                    })
+                # Handle legacy 'response' field
+                if "response" in data:
+                    append({
+                        "type": "chatbot_response",
+                        "title": "AI Assistant Response",
+                        "content": data["response"],
+                        "source": source
+                    })
+                if "suggestions" in data:
+                    extend({
+                        "type": "suggestion",
+                        "title": suggestion.get("title", "Suggestion"),
+                        "content": suggestion.get("content", ""),
+                        "source": source
+                    } for suggestion in data["suggestions"])
+                if "items" in data:
+                    extend({
+                        "type": "reference",
+                        "title": item.get("title", "Reference"),
+                        "description": item.get("description", ""),
+                        "url": item.get("url", ""),
+                        "source": source
+                    } for item in data["items"])
             
             elif source == "search":
                 # Extract from search results
-                if isinstance(data, dict):
-                    items = data.get("items", data.get("results", []))
-                    for item in items:
-                        options.append({
-                            "type": "search_result",
-                            "title": item.get("title", item.get("name", "Result")),
-                            "description": item.get("description", ""),
-                            "url": item.get("url", ""),
-                            "source": source
-                        })
+                items = data.get("items", data.get("results", ()))
+                extend({
+                    "type": "search_result",
+                    "title": item.get("title", item.get("name", "Result")),
+                    "description": item.get("description", ""),
+                    "url": item.get("url", ""),
+                    "source": source
+                } for item in items)
             
             elif source == "stac_catalog":
                 # Extract from STAC features
-                if isinstance(data, dict):
-                    features = data.get("features", [])
-                    for feature in features:
-                        properties = feature.get("properties", {})
-                        options.append({
-                            "type": "stac_item",
-                            "title": properties.get("title", feature.get("id", "Item")),
-                            "mission": properties.get("cop:mission", ""),
-                            "classification": properties.get("cop:classification", ""),
-                            "datetime": properties.get("datetime", ""),
-                            "bbox": feature.get("bbox", []),
-                            "source": source
-                        })
+                extend({
+                    "type": "stac_item",
+                    "title": properties.get("title", feature.get("id", "Item")),
+                    "mission": properties.get("cop:mission", ""),
+                    "classification": properties.get("cop:classification", ""),
+                    "datetime": properties.get("datetime", ""),
+                    "bbox": feature.get("bbox", []),
+                    "source": source
+                } for feature in data.get("features", ())
+                  for properties in (feature.get("properties", _EMPTY),))
         
         return options
     
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime, timezone
-        return datetime.now(timezone.utc).isoformat()
+        return datetime.now(_UTC).isoformat()
     
     def _create_mock_results(self, mission_text: str) -> List[Dict]:
         """Create mock results for testing when API is unavailable.
         
+        Each call returns a new list of freshly built entries that the
+        caller owns and may modify.
+        
         Args:
             mission_text: Mission text to base mock data on
             
         Returns:
             List of mock result dictionaries
         """
-        mock_data = {
-            "source": "mock",
-            "data": {
-                "response": f"Mock response for mission: {mission_text}",
-                "suggestions": [
-                    {
-                        "title": f"Related Mission: {mission_text} Protocol",
-                        "content": "Standard operating procedures and guidelines for this type of mission."
-                    },
-                    {
-                        "title": f"Previous {mission_text} Operations",
-                        "content": "Historical data and lessons learned from similar missions."
-                    },
-                    {
-                        "title": "Mission Planning Resources",
-                        "content": "Templates and checklists for mission preparation."
-                    }
-                ],
-                "items": [
-                    {
-                        "title": f"{mission_text} - Reference Data",
-                        "description": "Geospatial datasets relevant to this mission type",
-                        "url": "https://sealgeo.webgis1.com/demo/"
-                    },
-                    {
-                        "title": "Common Operating Picture Guidelines",
-                        "description": "Best practices for COP creation and sharing",
-                        "url": "https://sealgeo.webgis1.com/demo/"
-                    }
-                ]
-            }
-        }
-        
-        return [mock_data]
+        return [_mock_result(mission_text)]
+    
+    @staticmethod
+    def _suggestions_from_options(options: List[Dict], limit: int) -> List[str]:
+        """Pick suggestion names out of the first ``limit`` options."""
+        suggestions = []
+        for option in options[:limit]:
+            if option.get("mission"):
+                suggestions.append(option["mission"])
+            elif option.get("title"):
+                suggestions.append(option["title"])
+        return suggestions
     
     def get_mission_suggestions(self, partial_text: str, limit: int = 10) -> List[str]:
         """
@@ -410,16 +1218,32 @@ class SEALGeoAgent:
             List of suggested mission names
         """
         try:
-            result = self.query_mission(partial_text)
+            result = self.query_mission(partial_text, limit=limit)
             if result and result.get("options"):
-                suggestions = []
-                for option in result["options"][:limit]:
-                    if option.get("mission"):
-                        suggestions.append(option["mission"])
-                    elif option.get("title"):
-                        suggestions.append(option["title"])
-                return suggestions
+                return self._suggestions_from_options(result["options"], limit)
         except Exception as e:
-            print(f"Error getting suggestions: {e}")
+            log.warning("Error getting suggestions: %s", e)
         
         return []
+    
+    def get_missions_suggestions(self, partial_texts: List[str],
+                                 limit: int = 10) -> Dict[str, List[str]]:
+        """
+        Get mission suggestions for several partial texts in one STAC request.
+        
+        Args:
+            partial_texts: Partial mission texts
+            limit: Maximum number of suggestions per text
+            
+        Returns:
+            Dictionary mapping each partial text to its suggested mission names
+        """
+        try:
+            return {
+                text: self._suggestions_from_options(result["options"], limit)
+                for text, result in self.query_missions(partial_texts).items()
+            }
+        except Exception as e:
+            log.warning("Error getting suggestions: %s", e)
+        
+        return {}
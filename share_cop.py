@@ -2,13 +2,12 @@
 Share Common Operating Picture Plugin - Main Plugin Class
 """
 
+import logging
 import os
 from qgis.PyQt.QtCore import QTranslator, QCoreApplication, QSettings
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction
-from qgis.core import QgsProject
-
-from .share_cop_dialog import ShareCOPDialog
+from qgis.core import QgsProject, QgsSettings
 
 
 class ShareCOP:
@@ -37,6 +36,10 @@ class ShareCOP:
             self.translator.load(locale_path)
             QCoreApplication.installTranslator(self.translator)
 
+        # Agent diagnostics are only emitted when ShareCOP/debug is set
+        debug = QgsSettings().value('ShareCOP/debug', False, type=bool)
+        logging.getLogger('ShareCOP').setLevel(logging.DEBUG if debug else logging.WARNING)
+
         # Declare instance attributes
         self.actions = []
         self.menu = self.tr('&Share Common Operating Picture')
@@ -128,9 +131,20 @@ class ShareCOP:
                 action)
             self.iface.removeToolBarIcon(action)
         del self.toolbar
+        
+        # Stop the dialog listening to project layer changes
+        if self.dlg is not None:
+            self.dlg.stop_layer_tracking()
+        
+        # Release the shared agent's pooled connections
+        from .sealgeo_agent import SEALGeoAgent
+        SEALGeoAgent.release()
 
     def run(self):
         """Run method that performs all the real work."""
+        # Imported here so QGIS startup does not pay for the dialog's dependencies
+        from .share_cop_dialog import ShareCOPDialog
+        
         if self.dlg is None:
             self.dlg = ShareCOPDialog(self.iface)
         
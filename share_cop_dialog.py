@@ -3,55 +3,570 @@ Share COP Dialog - Enhanced dialog with location naming, map navigation,
 layer selection, and COP STAC package creation with signing.
 """
 
+import copy
+import logging
 import os
 import json
-import hashlib
 import zipfile
+import urllib.error
 import urllib.request
 import urllib.parse
 import math
+import tempfile
+import time
+import traceback
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timezone
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-    print("ReportLab not available - PDF generation will be skipped")
+from html import escape
 from qgis.PyQt import uic
-from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtCore import Qt, QSettings, QTimer, pyqtSignal
 from qgis.PyQt.QtWidgets import (
     QDialog, QMessageBox, QFileDialog, QListWidgetItem,
-    QTextEdit, QVBoxLayout, QDialogButtonBox, QPushButton, QCheckBox
+    QTextEdit, QVBoxLayout, QDialogButtonBox, QPushButton, QCheckBox,
+    QProgressBar, QWidget, QGridLayout, QApplication, QInputDialog
 )
 from qgis.core import (
-    Qgis, QgsProject, QgsPointXY, QgsRectangle,
+    Qgis, QgsApplication, QgsTask, QgsProject, QgsPointXY, QgsRectangle,
     QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsDistanceArea,
-    QgsVectorLayer, QgsRasterLayer, QgsFeature, QgsGeometry, QgsField, QgsMarkerSymbol,
+    QgsVectorLayer, QgsRasterLayer, QgsFeature, QgsFeatureRequest, QgsFeatureSink, QgsGeometry, QgsField, QgsMarkerSymbol,
     QgsSingleSymbolRenderer, QgsTextFormat, QgsTextBufferSettings,
     QgsPalLayerSettings, QgsVectorLayerSimpleLabeling, QgsFillSymbol,
     QgsWkbTypes
 )
 from qgis.PyQt.QtCore import QVariant
 from qgis.PyQt.QtGui import QColor, QFont
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
 
 from .location_picker import LocationPickerTool
-from .stac_cop_exporter import STACCOPExporter
-from .sealgeo_agent import SEALGeoAgent
+from .stac_cop_exporter import (
+    STACCOPExporter, iter_files, sha256_file, zip_copy_stored
+)
 from .ontology_parser import get_mission_concepts
-from .chat_dialog import ChatDialog
+
+# Package compression: deflate levels for the Fast/Balanced/Max choices of
+# cmbCompression; already-compressed formats are stored as-is
+COMPRESSION_LEVELS = (1, 6, 9)
+
+# Nominatim requires a user agent; with urllib3 all geocoding tasks share
+# one keep-alive pool so repeat lookups skip the TCP/TLS handshake
+NOMINATIM_HEADERS = {'User-Agent': 'QGIS ShareCOP Plugin/1.0'}
+_NOMINATIM_HTTP = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=4,
+    headers=NOMINATIM_HEADERS,
+    retries=urllib3.Retry(total=2, backoff_factor=0.2)
+) if URLLIB3_AVAILABLE else None
+
+log = logging.getLogger('ShareCOP.Dialog')
+
+# QSettings key remembering the last COP output directory
+OUTPUT_DIR_SETTING = 'ShareCOP/lastOutputDir'
+
+# Recent Nominatim responses keyed by normalised query; only touched on the
+# main thread, so no locking is needed. Loaded from GEOCODE_CACHE_FILE in the
+# QGIS settings directory on first use and saved back when the dialog closes
+GEOCODE_CACHE_SIZE = 128
+GEOCODE_CACHE_FILE = 'sharecop_geocode_cache.json'
+_GEOCODE_CACHE = None
+_geocode_cache_dirty = False
+
+# Supported DGGS types mapped to the dggal projection behind their GNOSIS
+# global grid; None means only the simplified zone ID is generated
+DGGS_GRID_PROJECTIONS = {
+    "H3": None,
+    "S2": None,
+    "rHEALPix": "rHEALPix",
+    "ISEA3H": "ISEA3H",
+}
+
+# DGGS grids with more cells than this are drawn without zone ID labels
+MAX_LABELED_GRID_CELLS = 50
+
+# Generated PDFs are kept in memory up to this size, then spill to disk
+PDF_SPOOL_SIZE = 8 * 1024 * 1024
+
+# dggal module once imported, False if it is not installed; None until the
+# first DGGS conversion
+_DGGAL = None
+
+
+def _get_dggal():
+    """Import dggal on first use and remember the outcome.
+    
+    Returns:
+        The dggal module, or None if it is not installed
+    """
+    global _DGGAL
+    if _DGGAL is None:
+        try:
+            import dggal
+            _DGGAL = dggal
+        except ImportError:
+            _DGGAL = False
+    return _DGGAL or None
+
+
+# ReportLab paragraph styles, built on the first PDF export
+_PDF_STYLES = None
+
+
+def _get_pdf_styles():
+    """Return the shared PDF paragraph styles, building them on first use.
+    
+    Returns:
+        Dictionary of ParagraphStyle objects keyed by title, heading, body,
+        user, bot and error
+    """
+    global _PDF_STYLES
+    if _PDF_STYLES is None:
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER
+        
+        styles = getSampleStyleSheet()
+        
+        def message_style(name, color):
+            return ParagraphStyle(
+                name,
+                parent=styles['BodyText'],
+                fontSize=10,
+                leading=14,
+                textColor=color,
+                leftIndent=20,
+                spaceBefore=6,
+                spaceAfter=6
+            )
+        
+        pdf_styles = {
+            'title': ParagraphStyle(
+                'CustomTitle',
+                parent=styles['Heading1'],
+                fontSize=18,
+                textColor='#003366',
+                spaceAfter=30,
+                alignment=TA_CENTER
+            ),
+            'heading': ParagraphStyle(
+                'CustomHeading',
+                parent=styles['Heading2'],
+                fontSize=14,
+                textColor='#003366',
+                spaceAfter=12,
+                spaceBefore=12
+            ),
+            'user': message_style('UserMessage', '#1976D2'),
+            'bot': message_style('BotMessage', '#558B2F'),
+            'error': message_style('ErrorMessage', '#C62828'),
+        }
+        body_style = styles['BodyText']
+        body_style.fontSize = 10
+        body_style.leading = 14
+        pdf_styles['body'] = body_style
+        _PDF_STYLES = pdf_styles
+    return _PDF_STYLES
+
+
+# Renderer symbols and zone ID label settings of the DGGS layers, built on
+# the first DGGS layer
+_DGGS_STYLES = None
+
+
+def _get_dggs_styles():
+    """Return the shared DGGS layer styles, building them on first use.
+    
+    Returns:
+        Dictionary of (symbol, label settings) pairs keyed by zones, grid and
+        point; symbols must be cloned before handing them to a renderer
+    """
+    global _DGGS_STYLES
+    if _DGGS_STYLES is None:
+        def label_settings(font_size, bold, buffer_size, dist=None):
+            text_format = QgsTextFormat()
+            text_format.setFont(QFont("Arial", font_size, QFont.Bold if bold else QFont.Normal))
+            text_format.setSize(font_size)
+            text_format.setColor(QColor(0, 0, 0))
+            
+            # Text buffer (halo) for better visibility
+            buffer_settings = QgsTextBufferSettings()
+            buffer_settings.setEnabled(True)
+            buffer_settings.setSize(buffer_size)
+            buffer_settings.setColor(QColor(255, 255, 255))
+            text_format.setBuffer(buffer_settings)
+            
+            settings = QgsPalLayerSettings()
+            settings.setFormat(text_format)
+            settings.fieldName = "zone_id"
+            settings.enabled = True
+            if dist is not None:
+                settings.dist = dist
+            return settings
+        
+        point_labels = label_settings(10, True, 1, dist=2)
+        # Try to set placement, but handle version incompatibility gracefully
+        try:
+            # Try different placement options based on QGIS version
+            if hasattr(QgsPalLayerSettings, 'AroundPoint'):
+                point_labels.placement = QgsPalLayerSettings.AroundPoint
+            elif hasattr(QgsPalLayerSettings, 'OverPoint'):
+                point_labels.placement = QgsPalLayerSettings.OverPoint
+            # If neither exists, leave at default
+        except Exception as e:
+            log.warning("[DGGS Layer] Could not set label placement: %s", e)
+        
+        _DGGS_STYLES = {
+            'zones': (
+                QgsFillSymbol.createSimple({
+                    'color': '255,107,107,100',  # Semi-transparent red
+                    'outline_color': '#C92A2A',
+                    'outline_width': '0.5'
+                }),
+                label_settings(9, True, 1, dist=2)
+            ),
+            'grid': (
+                QgsFillSymbol.createSimple({
+                    'color': '107,179,255,50',  # Semi-transparent blue
+                    'outline_color': '#1976D2',
+                    'outline_width': '0.3'
+                }),
+                label_settings(8, False, 0.5)
+            ),
+            'point': (
+                # Distinctive markers
+                QgsMarkerSymbol.createSimple({
+                    'name': 'circle',
+                    'color': '#FF6B6B',
+                    'size': '4',
+                    'outline_color': '#C92A2A',
+                    'outline_width': '0.5'
+                }),
+                point_labels
+            ),
+        }
+    return _DGGS_STYLES
+
+
+# Static ReportLab flowables shared by every PDF build, built on first use
+_PDF_FLOWABLES = None
+
+
+def _get_pdf_flowables():
+    """Return the shared static PDF flowables, building them on first use.
+    
+    Separators and report footers carry no per-export content, so their
+    markup is parsed once. Platypus records layout state on the flowables
+    it places, so stories take shallow copies via _copy_flowables.
+    
+    Returns:
+        Dictionary of flowable tuples keyed by message_spacer,
+        chatbot_separator, chatbot_footer, conversation_separator and
+        conversation_footer
+    """
+    global _PDF_FLOWABLES
+    if _PDF_FLOWABLES is None:
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer, PageBreak
+        
+        pdf_styles = _get_pdf_styles()
+        heading_style = pdf_styles['heading']
+        body_style = pdf_styles['body']
+        
+        def footer(description, service_url):
+            return (
+                PageBreak(),
+                Spacer(1, 0.5*inch),
+                Paragraph("Report Information", heading_style),
+                Paragraph(
+                    f"This {description} was automatically generated by the QGIS Share Common Operating Picture plugin using the SEAL Geo RAG Chatbot service.",
+                    body_style
+                ),
+                Spacer(1, 0.1*inch),
+                Paragraph(
+                    f"<b>Service URL:</b> <a href='{service_url}'>{service_url}</a>",
+                    body_style
+                ),
+                Paragraph(
+                    "<b>Plugin:</b> Share Common Operating Picture v1.0.0",
+                    body_style
+                ),
+            )
+        
+        message_spacer = Spacer(1, 0.1*inch)
+        _PDF_FLOWABLES = {
+            'message_spacer': (message_spacer,),
+            'chatbot_separator': (
+                message_spacer,
+                Paragraph("-"*80, body_style),
+                Spacer(1, 0.2*inch),
+            ),
+            'chatbot_footer': footer("report", "https://sealgeo.webgis1.com/demo/"),
+            'conversation_separator': (
+                Paragraph("-"*60, body_style),
+                Spacer(1, 0.15*inch),
+            ),
+            'conversation_footer': footer(
+                "conversation transcript", "https://sealgeo.servequake.com/api"),
+        }
+    return _PDF_FLOWABLES
+
+
+def _write_pdf_member(zipf, arcname, pdf_file):
+    """Copy a built PDF into the package uncompressed; PDF streams are
+    already deflated.
+    
+    Args:
+        zipf: Open ZipFile of the COP package
+        arcname: Name of the PDF inside the archive
+        pdf_file: Spooled file the PDF was built into
+    """
+    zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+    zinfo.external_attr = 0o600 << 16
+    pdf_file.seek(0)
+    zip_copy_stored(zipf, zinfo, pdf_file)
+
+
+def _copy_flowables(flowables):
+    """Return fresh shallow copies of shared flowables for one story.
+    
+    Args:
+        flowables: Tuple of flowables from _get_pdf_flowables
+        
+    Returns:
+        List of copies sharing the already parsed paragraph fragments
+    """
+    return [copy.copy(flowable) for flowable in flowables]
+
+
+# Displayed fields of a SEAL Geo option, read once per option
+_OptionFields = namedtuple(
+    '_OptionFields', 'type title source content description mission url classification'
+)
+
+
+def _option_fields(option):
+    """Read the displayed fields of an option dictionary once.
+    
+    Args:
+        option: Option dictionary from SEALGeoAgent
+        
+    Returns:
+        _OptionFields with defaults for missing type, title and source and
+        empty strings for the other missing fields
+    """
+    get = option.get
+    return _OptionFields(
+        get('type', 'unknown'),
+        get('title', 'No title'),
+        get('source', 'unknown'),
+        get('content') or '',
+        get('description') or '',
+        get('mission') or '',
+        get('url') or '',
+        get('classification') or ''
+    )
+
+
+def _escaped_option_fields(option):
+    """Return _option_fields with every field escaped once for PDF markup."""
+    return _OptionFields._make(escape(str(value)) for value in _option_fields(option))
+
 
 # Load UI file
 UI_FILE = os.path.join(os.path.dirname(__file__), 'ui', 'share_cop_dialog.ui')
 FORM_CLASS, _ = uic.loadUiType(UI_FILE)
 
 
+class MissionQueryTask(QgsTask):
+    """Background task running a SEAL Geo mission query off the GUI thread."""
+    
+    def __init__(self, agent, mission_text, callback, source_names=None):
+        """Constructor.
+        
+        Args:
+            agent: SEALGeoAgent instance
+            mission_text: Mission description to query
+            callback: Called on the main thread with this task once done
+            source_names: Sources to query (see SEALGeoAgent.query_mission);
+                None queries all of them
+        """
+        super(MissionQueryTask, self).__init__(
+            f"SEAL Geo mission query: {mission_text}", QgsTask.CanCancel)
+        self.agent = agent
+        self.mission_text = mission_text
+        self.callback = callback
+        self.source_names = source_names
+        self.result = None
+    
+    def run(self):
+        """Query the agent; runs in a worker thread."""
+        result = self.agent.query_mission(self.mission_text, source_names=self.source_names)
+        if self.isCanceled():
+            return False
+        self.result = result
+        return result is not None
+    
+    def finished(self, result):
+        """Hand the task back to the dialog; runs on the main thread."""
+        self.callback(self)
+
+
+class SignPackageTask(QgsTask):
+    """Background task hashing a COP package and writing its signature file."""
+    
+    def __init__(self, zip_path, sign, callback):
+        """Constructor.
+        
+        Args:
+            zip_path: Path to the ZIP package
+            sign: Function returning the signature text for a package path
+            callback: Called on the main thread with this task once done
+        """
+        super(SignPackageTask, self).__init__(
+            f"Signing COP package: {os.path.basename(zip_path)}", QgsTask.CanCancel)
+        self.zip_path = zip_path
+        self.sig_path = zip_path + '.sig'
+        self.sign = sign
+        self.callback = callback
+        self.error = None
+    
+    def run(self):
+        """Hash the package and write the signature; runs in a worker thread."""
+        try:
+            signature = self.sign(self.zip_path)
+            if self.isCanceled():
+                return False
+            with open(self.sig_path, 'w') as f:
+                f.write(signature)
+        except Exception as e:
+            self.error = e
+        return not self.isCanceled()
+    
+    def finished(self, result):
+        """Hand the task back to the dialog; runs on the main thread."""
+        self.callback(self)
+
+
+def _geocode_cache_path():
+    """Return the path of the persisted geocoding cache."""
+    return os.path.join(QgsApplication.qgisSettingsDirPath(), GEOCODE_CACHE_FILE)
+
+
+def _get_geocode_cache():
+    """Return the geocoding cache, loading the persisted one on first use."""
+    global _GEOCODE_CACHE
+    if _GEOCODE_CACHE is None:
+        _GEOCODE_CACHE = OrderedDict()
+        try:
+            with open(_geocode_cache_path(), encoding='utf-8') as f:
+                for key, data in json.load(f)[-GEOCODE_CACHE_SIZE:]:
+                    _GEOCODE_CACHE[tuple(key)] = data
+        except (OSError, ValueError, TypeError):
+            # Missing or unreadable cache; start empty
+            pass
+    return _GEOCODE_CACHE
+
+
+def _geocode_cache_get(key):
+    """Return a cached Nominatim response, or None if not cached."""
+    cache = _get_geocode_cache()
+    data = cache.get(key)
+    if data is not None:
+        cache.move_to_end(key)
+    return data
+
+
+def _geocode_cache_put(key, data):
+    """Cache a Nominatim response, evicting the least recently used one."""
+    global _geocode_cache_dirty
+    cache = _get_geocode_cache()
+    cache[key] = data
+    cache.move_to_end(key)
+    if len(cache) > GEOCODE_CACHE_SIZE:
+        cache.popitem(last=False)
+    _geocode_cache_dirty = True
+
+
+def save_geocode_cache():
+    """Persist the geocoding cache if it changed since it was loaded."""
+    global _geocode_cache_dirty
+    if not _geocode_cache_dirty:
+        return
+    path = _geocode_cache_path()
+    try:
+        # Write next to the target and swap it in, so a crash mid-write
+        # never leaves a truncated cache behind
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump([[list(key), data] for key, data in _GEOCODE_CACHE.items()], f)
+        os.replace(path + '.tmp', path)
+        _geocode_cache_dirty = False
+    except OSError as e:
+        log.warning("[Geocoding] Could not save cache: %s", e)
+
+
+class GeocodeTask(QgsTask):
+    """Background task fetching a Nominatim response off the GUI thread."""
+    
+    def __init__(self, url, cache_key, callback):
+        """Constructor.
+        
+        Args:
+            url: Nominatim request URL
+            cache_key: Key under which a successful response is cached
+            callback: Called on the main thread with this task once done
+        """
+        super(GeocodeTask, self).__init__("Nominatim geocoding", QgsTask.CanCancel)
+        self.url = url
+        self.cache_key = cache_key
+        self.callback = callback
+        self.data = None
+        self.error = None
+    
+    def run(self):
+        """Fetch and decode the response; runs in a worker thread."""
+        try:
+            if _NOMINATIM_HTTP is not None:
+                response = _NOMINATIM_HTTP.request('GET', self.url, timeout=10)
+                if response.status >= 400:
+                    raise urllib.error.HTTPError(
+                        self.url, response.status, response.reason, response.headers, None
+                    )
+                self.data = json.loads(response.data)
+            else:
+                req = urllib.request.Request(self.url, headers=NOMINATIM_HEADERS)
+                with urllib.request.urlopen(req, timeout=10) as response:
+                    self.data = json.loads(response.read().decode())
+        except Exception as e:
+            self.error = e
+        return not self.isCanceled()
+    
+    def start(self):
+        """Answer from the response cache, or queue the task to fetch it."""
+        data = _geocode_cache_get(self.cache_key)
+        if data is None:
+            QgsApplication.taskManager().addTask(self)
+        else:
+            self.data = data
+            self.callback(self)
+    
+    def finished(self, result):
+        """Hand the response back to the dialog; runs on the main thread."""
+        if result:
+            if self.error is None:
+                _geocode_cache_put(self.cache_key, self.data)
+            self.callback(self)
+
+
 class ShareCOPDialog(QDialog, FORM_CLASS):
     """Dialog for creating and sharing Common Operating Picture packages."""
     
+    # Emitted with the query_mission result once a background query completes
+    agentResultReady = pyqtSignal(dict)
+    
+    # Whether ReportLab can be imported; checked on the first PDF export
+    _reportlab_available = None
+    
     def __init__(self, iface, parent=None):
         """Constructor.
         
@@ -80,13 +595,52 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         self.current_aoi_bbox = None
         self.current_aoi_dggs_zones = None
         
-        # SEAL Geo RAG agent and mission query results
-        self.sealgeo_agent = SEALGeoAgent()
+        # SEAL Geo RAG agent (created on first use) and mission query results
+        self._sealgeo_agent = None
         self.mission_query_results = None
         self.mission_options = []
-        
-        # Ontology concept checkboxes
+        self.mission_task = None
+        
+        # Pending background package signature
+        self.sign_task = None
+        
+        # Pending background Nominatim lookups
+        self.geocode_task = None
+        self.reverse_geocode_task = None
+        
+        # Reverse geocoding of typed coordinates waits for a pause in typing
+        self._reverse_geocode_timer = QTimer(self)
+        self._reverse_geocode_timer.setSingleShot(True)
+        self._reverse_geocode_timer.setInterval(400)
+        self._reverse_geocode_timer.timeout.connect(self.reverse_geocode)
+        
+        # Busy indicator shown while a mission query runs in the background
+        self.progressMission = QProgressBar()
+        self.progressMission.setRange(0, 0)
+        self.progressMission.setTextVisible(False)
+        self.progressMission.hide()
+        cop_layout = self.grpCOP.layout()
+        cop_layout.addWidget(self.progressMission, cop_layout.rowCount(), 0, 1, 3)
+        
+        # Ontology concept checkboxes, the checked labels and their display order
         self.ontology_checkboxes = []
+        self._checked_concepts = set()
+        self._concept_order = {}
+        self._concepts_update_pending = False
+        
+        # Id of the OpenStreetMap basemap layer once found or loaded
+        self._osm_layer_id = None
+        
+        # Polygon layers by id; built on first use, then kept in sync with
+        # the project's layersAdded/layersRemoved signals
+        self._polygon_layers = None
+        
+        # Coordinate transforms by (source, destination) CRS, so PROJ pipelines
+        # are set up once per CRS pair; dropped when the canvas CRS or the
+        # project's datum transformations change
+        self._transforms = {}
+        self.canvas.destinationCrsChanged.connect(self._transforms.clear)
+        QgsProject.instance().transformContextChanged.connect(self._transforms.clear)
         
         # Zoom scale mapping
         self.zoom_scales = {
@@ -121,28 +675,25 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         self.txtMission.textChanged.connect(self.on_mission_changed)
         self.txtReleasability.textChanged.connect(self.check_export_ready)
         self.btnQueryChatbot.clicked.connect(self.query_chatbot_manual)
+        self.agentResultReady.connect(self.on_mission_query_result)
         self.grpOntologyConcepts.toggled.connect(self.on_ontology_group_toggled)
         
         # Export
         self.btnBrowse.clicked.connect(self.browse_output_dir)
         self.btnExport.clicked.connect(self.export_cop_package)
         
-        # Initialize
-        self.populate_layers()
-        self.populate_ontology_concepts()
+        # Initialize; the layer list and basemap check run once the dialog
+        # is showing, ontology concepts when their group is first enabled
+        self._ontology_populated = False
         self.check_export_ready()
+        QTimer.singleShot(0, self.populate_layers)
         
         # Check and load OpenStreetMap basemap
-        self.check_osm_basemap()
+        QTimer.singleShot(0, self.check_osm_basemap)
     
     def check_osm_basemap(self):
         """Check if OpenStreetMap basemap exists, prompt to load if not."""
-        # Search for existing OpenStreetMap layer
-        existing_osm = None
-        for layer in QgsProject.instance().mapLayers().values():
-            if 'OpenStreetMap' in layer.name() and isinstance(layer, QgsRasterLayer):
-                existing_osm = layer
-                break
+        existing_osm = self.find_osm_basemap()
         
         # If no OSM layer found, prompt user to load it
         if not existing_osm:
@@ -158,6 +709,36 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             if reply == QMessageBox.Yes:
                 self.load_osm_basemap()
     
+    def find_osm_basemap(self):
+        """Return the project's OpenStreetMap raster layer, or None.
+        
+        The layer id is remembered, so later lookups are a single
+        mapLayer() call. A removed layer simply misses and triggers a new
+        search.
+        """
+        project = QgsProject.instance()
+        if self._osm_layer_id:
+            layer = project.mapLayer(self._osm_layer_id)
+            if layer is not None:
+                return layer
+            self._osm_layer_id = None
+        
+        # Exact name first, then any raster layer whose name mentions it
+        layer = next(
+            (candidate for candidate in project.mapLayersByName('OpenStreetMap')
+             if isinstance(candidate, QgsRasterLayer)),
+            None
+        )
+        if layer is None:
+            layer = next(
+                (candidate for candidate in project.mapLayers().values()
+                 if 'OpenStreetMap' in candidate.name() and isinstance(candidate, QgsRasterLayer)),
+                None
+            )
+        if layer is not None:
+            self._osm_layer_id = layer.id()
+        return layer
+    
     def load_osm_basemap(self):
         """Load OpenStreetMap XYZ tile layer as basemap."""
         try:
@@ -170,6 +751,7 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 QgsProject.instance().addMapLayer(osm_layer, False)
                 root = QgsProject.instance().layerTreeRoot()
                 root.insertLayer(len(root.children()), osm_layer)
+                self._osm_layer_id = osm_layer.id()
                 
                 self.iface.messageBar().pushMessage(
                     'Success',
@@ -192,15 +774,23 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
     
     def populate_layers(self):
         """Populate layer list with project layers."""
-        self.lstLayers.clear()
         project = QgsProject.instance()
         
-        layer_count = 0
-        for layer in project.mapLayers().values():
-            item = QListWidgetItem(layer.name())
-            item.setData(Qt.UserRole, layer.id())
-            self.lstLayers.addItem(item)
-            layer_count += 1
+        # Refill with signals and repaints suspended, then update once
+        self.lstLayers.setUpdatesEnabled(False)
+        self.lstLayers.blockSignals(True)
+        try:
+            self.lstLayers.clear()
+            layer_count = 0
+            for layer in project.mapLayers().values():
+                item = QListWidgetItem(layer.name())
+                item.setData(Qt.UserRole, layer.id())
+                self.lstLayers.addItem(item)
+                layer_count += 1
+        finally:
+            self.lstLayers.blockSignals(False)
+            self.lstLayers.setUpdatesEnabled(True)
+        self.check_export_ready()
         
         # Show message about loaded layers
         if layer_count > 0:
@@ -225,8 +815,6 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             concepts = get_mission_concepts()
             
             # Create a new widget for the scroll area
-            from qgis.PyQt.QtWidgets import QWidget, QVBoxLayout, QGridLayout
-            
             scroll_widget = QWidget()
             layout = QGridLayout(scroll_widget)
             layout.setContentsMargins(5, 5, 5, 5)
@@ -234,9 +822,16 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             
             # Create checkboxes for each concept in 3 columns
             self.ontology_checkboxes = []
+            self._checked_concepts = set()
+            self._concept_order = {concept: i for i, concept in enumerate(concepts)}
             num_columns = 3
+            
+            # Fill the grid with the layout disabled so geometry is computed
+            # once; checkboxes are created with their final parent
+            scroll_widget.setUpdatesEnabled(False)
+            layout.setEnabled(False)
             for i, concept in enumerate(concepts):
-                checkbox = QCheckBox(concept)
+                checkbox = QCheckBox(concept, scroll_widget)
                 checkbox.stateChanged.connect(self.on_ontology_checkbox_changed)
                 row = i // num_columns
                 col = i % num_columns
@@ -245,17 +840,21 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             
             # Add stretch to push checkboxes to the top
             layout.setRowStretch(layout.rowCount(), 1)
+            layout.setEnabled(True)
+            scroll_widget.setUpdatesEnabled(True)
             
-            # Set the widget to the scroll area
+            # Set the widget to the scroll area; it lays out once here
             self.scrollAreaOntology.setWidget(scroll_widget)
+            self._ontology_populated = True
             
         except Exception as e:
             print(f"Error populating ontology concepts: {e}")
-            import traceback
             traceback.print_exc()
     
     def on_ontology_group_toggled(self, checked):
         """Handle ontology group box toggle."""
+        if checked and not self._ontology_populated:
+            self.populate_ontology_concepts()
         if not checked:
             # Uncheck all ontology checkboxes when group is collapsed
             for checkbox in self.ontology_checkboxes:
@@ -263,20 +862,39 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
     
     def on_ontology_checkbox_changed(self):
         """Handle ontology checkbox state changes."""
-        # Collect all checked concepts
-        checked_concepts = []
-        for checkbox in self.ontology_checkboxes:
-            if checkbox.isChecked():
-                checked_concepts.append(checkbox.text())
+        checkbox = self.sender()
+        if checkbox.isChecked():
+            self._checked_concepts.add(checkbox.text())
+        else:
+            self._checked_concepts.discard(checkbox.text())
+        
+        # Coalesce bulk toggles (e.g. collapsing the group) into one update
+        if not self._concepts_update_pending:
+            self._concepts_update_pending = True
+            QTimer.singleShot(0, self._update_mission_from_concepts)
+    
+    def _update_mission_from_concepts(self):
+        """Write the checked ontology concepts into the mission field."""
+        self._concepts_update_pending = False
         
         # Update mission text field
-        if checked_concepts:
-            mission_text = ", ".join(checked_concepts)
-            self.txtMission.setText(mission_text)
-        else:
+        if self._checked_concepts:
+            mission_text = ", ".join(sorted(self._checked_concepts, key=self._concept_order.get))
+        elif self.grpOntologyConcepts.isChecked():
             # Only clear if all ontology checkboxes are unchecked
-            if self.grpOntologyConcepts.isChecked():
-                self.txtMission.clear()
+            mission_text = ""
+        else:
+            return
+        if mission_text == self.txtMission.text():
+            return
+        
+        # Set the text without the textChanged round trip and validate once
+        self.txtMission.blockSignals(True)
+        try:
+            self.txtMission.setText(mission_text)
+        finally:
+            self.txtMission.blockSignals(False)
+        self.check_export_ready()
     
     def select_all_layers(self):
         """Select all layers in the list."""
@@ -306,6 +924,8 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         """
         self.current_lon = lon
         self.current_lat = lat
+        # The previous address belongs to the old location
+        self.current_address = None
         
         # Update UI
         self.txtLongitude.setText(f"{lon:.6f}")
@@ -340,11 +960,108 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         # Just check if export is ready, don't auto-query
         self.check_export_ready()
     
+    @property
+    def sealgeo_agent(self):
+        """Session-wide SEAL Geo RAG agent, imported on first use."""
+        if self._sealgeo_agent is None:
+            from .sealgeo_agent import SEALGeoAgent
+            self._sealgeo_agent = SEALGeoAgent.get()
+        return self._sealgeo_agent
+    
+    def start_mission_query(self, mission_text, source_names=None):
+        """Query SEAL Geo for mission options in a background QgsTask.
+        
+        Args:
+            mission_text: Mission description to query
+            source_names: Sources to query; None queries all of them
+        """
+        self.cancel_mission_query()
+        
+        self.mission_task = MissionQueryTask(
+            self.sealgeo_agent, mission_text, self._on_mission_task_finished, source_names)
+        self.progressMission.show()
+        QgsApplication.taskManager().addTask(self.mission_task)
+    
+    def cancel_mission_query(self):
+        """Abort a running background mission query, if any."""
+        task = self.mission_task
+        self.mission_task = None
+        if task is not None:
+            try:
+                task.cancel()
+            except RuntimeError:
+                # Underlying task already deleted by the task manager
+                pass
+        self.progressMission.hide()
+    
+    def _on_mission_task_finished(self, task):
+        """Route a finished task's result to agentResultReady."""
+        if task is not self.mission_task:
+            # Cancelled or superseded by a newer query
+            return
+        self.mission_task = None
+        self.progressMission.hide()
+        if task.result:
+            self.agentResultReady.emit(task.result)
+    
+    def on_mission_query_result(self, result):
+        """Store options from a completed mission query for export.
+        
+        Args:
+            result: query_mission result dictionary
+        """
+        self.mission_options = result.get('options', [])
+        # A stored chat conversation takes precedence; otherwise keep the
+        # latest result so its timestamp and options stay consistent
+        if not self.mission_query_results or 'conversation' not in self.mission_query_results:
+            self.mission_query_results = result
+        
+        self.iface.messageBar().pushMessage(
+            "Info",
+            f"SEAL Geo returned {len(self.mission_options)} options for mission '{result.get('mission', '')}'",
+            level=Qgis.Info,
+            duration=5
+        )
+    
+    def done(self, result):
+        """Cancel background queries and save the geocoding cache before closing."""
+        self.cancel_mission_query()
+        self._reverse_geocode_timer.stop()
+        if self.geocode_task is not None:
+            # The cancelled task never reports back; the dialog is reused
+            self._cancel_task(self.geocode_task)
+            self.geocode_task = None
+            self.btnGeocode.setEnabled(True)
+        if self.reverse_geocode_task is not None:
+            self._cancel_task(self.reverse_geocode_task)
+            self.reverse_geocode_task = None
+            if self.current_address:
+                self.lblAddress.setText(f"Address: {self.current_address}")
+            else:
+                self.lblAddress.setText("Address: (not yet geocoded)")
+        save_geocode_cache()
+        super(ShareCOPDialog, self).done(result)
+    
+    def _cancel_task(self, task):
+        """Cancel a background task unless the task manager already removed it."""
+        if task is not None:
+            try:
+                task.cancel()
+            except RuntimeError:
+                # Underlying task already deleted by the task manager
+                pass
+    
     def query_chatbot_manual(self):
         """Open interactive chat window with SEAL Geo RAG Chatbot."""
         mission_text = self.txtMission.text().strip()
         
+        # Gather search and STAC options in the background while chatting;
+        # the chat dialog asks the chatbot itself
+        if mission_text:
+            self.start_mission_query(mission_text, source_names=("search", "stac_catalog"))
+        
         # Open chat dialog with optional initial mission
+        from .chat_dialog import ChatDialog
         chat_dialog = ChatDialog(self.sealgeo_agent, initial_mission=mission_text, parent=self)
         result = chat_dialog.exec_()
         
@@ -377,61 +1094,59 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         Returns:
             Formatted string for display
         """
-        lines = []
-        lines.append("=" * 60)
-        lines.append("SEAL GEO RAG CHATBOT RESULTS")
-        lines.append("=" * 60)
-        lines.append("")
+        header = "=" * 60
+        rule = "-" * 55
+        lines = [f"{header}\nSEAL GEO RAG CHATBOT RESULTS\n{header}\n"]
         
         for idx, option in enumerate(options[:10], 1):  # Show top 10
-            opt_type = option.get('type', 'unknown')
-            title = option.get('title', 'No title')
-            source = option.get('source', 'unknown')
+            fields = _option_fields(option)
             
-            lines.append(f"{idx}. {title}")
-            lines.append(f"   Type: {opt_type} | Source: {source}")
-            lines.append(f"   {'-' * 55}")
+            # One chunk per option, joined once
+            chunk = [
+                f"{idx}. {fields.title}\n"
+                f"   Type: {fields.type} | Source: {fields.source}\n"
+                f"   {rule}"
+            ]
             
             # Show full content for chatbot responses
-            if option.get('content'):
-                content = option['content']
-                if opt_type == 'chatbot_response':
+            content = fields.content
+            if content:
+                if fields.type == 'chatbot_response':
                     # Show full chatbot response
-                    lines.append(f"   Response:")
-                    for line in content.split('\n'):
-                        lines.append(f"   {line}")
-                else:
+                    chunk.append("   Response:\n   " + content.replace('\n', '\n   '))
+                elif len(content) > 200:
                     # Show first 200 chars for other types
-                    if len(content) > 200:
-                        lines.append(f"   {content[:200]}...")
-                    else:
-                        lines.append(f"   {content}")
+                    chunk.append(f"   {content[:200]}...")
+                else:
+                    chunk.append(f"   {content}")
             
-            if option.get('description'):
-                desc = option['description']
+            desc = fields.description
+            if desc:
                 if len(desc) > 200:
-                    lines.append(f"   Description: {desc[:200]}...")
+                    chunk.append(f"   Description: {desc[:200]}...")
                 else:
-                    lines.append(f"   Description: {desc}")
+                    chunk.append(f"   Description: {desc}")
             
-            if option.get('mission'):
-                lines.append(f"   Related Mission: {option['mission']}")
+            if fields.mission:
+                chunk.append(f"   Related Mission: {fields.mission}")
             
-            if option.get('url'):
-                lines.append(f"   URL: {option['url']}")
+            if fields.url:
+                chunk.append(f"   URL: {fields.url}")
             
-            if option.get('classification'):
-                lines.append(f"   Classification: {option['classification']}")
+            if fields.classification:
+                chunk.append(f"   Classification: {fields.classification}")
             
-            lines.append("")  # Blank line between results
+            chunk.append("")  # Blank line between results
+            lines.append("\n".join(chunk))
         
-        lines.append("=" * 60)
-        lines.append(f"Total options: {len(options)}")
-        lines.append("These options will be included in the exported COP package.")
-        lines.append("=" * 60)
+        lines.append(
+            f"{header}\n"
+            f"Total options: {len(options)}\n"
+            "These options will be included in the exported COP package.\n"
+            f"{header}"
+        )
         
         return "\n".join(lines)
-        return "\n".join(lines)
     
     def _show_results_dialog(self, title, text):
         """Show results in a scrollable dialog.
@@ -476,7 +1191,6 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         Args:
             text: Text to copy
         """
-        from qgis.PyQt.QtWidgets import QApplication
         clipboard = QApplication.clipboard()
         clipboard.setText(text)
         
@@ -487,18 +1201,34 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             duration=2
         )
     
-    def generate_chatbot_pdf(self, assets_dir, mission, options):
-        """Generate PDF report for chatbot results.
+    @classmethod
+    def reportlab_available(cls):
+        """Import ReportLab on first use and remember whether it is installed.
+        
+        Returns:
+            True if PDF reports can be generated
+        """
+        if cls._reportlab_available is None:
+            try:
+                import reportlab.platypus  # noqa: F401
+                cls._reportlab_available = True
+            except ImportError:
+                cls._reportlab_available = False
+                print("ReportLab not available - PDF generation will be skipped")
+        return cls._reportlab_available
+    
+    def generate_chatbot_pdf(self, zipf, mission, options):
+        """Generate PDF report for chatbot results straight into the package.
         
         Args:
-            assets_dir: Directory to save the PDF
+            zipf: Open ZipFile of the COP package
             mission: Mission text
             options: List of chatbot option dictionaries
             
         Returns:
-            Path to generated PDF or None if failed
+            Archive name of the generated PDF or None if failed
         """
-        if not REPORTLAB_AVAILABLE:
+        if not self.reportlab_available():
             self.iface.messageBar().pushMessage(
                 "Warning",
                 "ReportLab not installed - cannot generate PDF. Install with: pip install reportlab",
@@ -507,41 +1237,30 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             )
             return None
         
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
         try:
             # Create PDF filename
             timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
             pdf_filename = f"chatbot_mission_analysis_{timestamp}.pdf"
-            pdf_path = os.path.join(assets_dir, pdf_filename)
+            pdf_buffer = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_SIZE)
             
             # Create PDF document
-            doc = SimpleDocTemplate(pdf_path, pagesize=A4,
+            doc = SimpleDocTemplate(pdf_buffer, pagesize=A4,
                                    rightMargin=0.75*inch, leftMargin=0.75*inch,
                                    topMargin=1*inch, bottomMargin=0.75*inch)
             
             # Container for PDF elements
             story = []
             
-            # Define styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                textColor='#003366',
-                spaceAfter=30,
-                alignment=TA_CENTER
-            )
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=14,
-                textColor='#003366',
-                spaceAfter=12,
-                spaceBefore=12
-            )
-            body_style = styles['BodyText']
-            body_style.fontSize = 10
-            body_style.leading = 14
+            # Shared paragraph styles
+            pdf_styles = _get_pdf_styles()
+            title_style = pdf_styles['title']
+            heading_style = pdf_styles['heading']
+            body_style = pdf_styles['body']
+            pdf_flowables = _get_pdf_flowables()
             
             # Title
             story.append(Paragraph("SEAL Geo RAG Chatbot", title_style))
@@ -563,69 +1282,51 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             story.append(Paragraph("Analysis Results", heading_style))
             story.append(Spacer(1, 0.1*inch))
             
+            separator = pdf_flowables['chatbot_separator']
             for idx, option in enumerate(options, 1):
-                opt_type = option.get('type', 'unknown')
-                title = option.get('title', 'No title')
-                source = option.get('source', 'unknown')
+                fields = _escaped_option_fields(option)
                 
                 # Result header
-                story.append(Paragraph(f"<b>{idx}. {title}</b>", heading_style))
-                story.append(Paragraph(f"<i>Type: {opt_type} | Source: {source}</i>", body_style))
-                story.append(Spacer(1, 0.05*inch))
+                story.append(Paragraph(f"<b>{idx}. {fields.title}</b>", heading_style))
+                
+                # Result body as a single paragraph, one line per field
+                body = [f"<i>Type: {fields.type} | Source: {fields.source}</i>"]
                 
                 # Content
-                if option.get('content'):
-                    content = option['content'].replace('<', '&lt;').replace('>', '&gt;')
-                    story.append(Paragraph(f"<b>Response:</b>", body_style))
-                    story.append(Paragraph(content, body_style))
-                    story.append(Spacer(1, 0.1*inch))
+                if fields.content:
+                    body.append("<b>Response:</b>")
+                    body.append(fields.content)
                 
                 # Description
-                if option.get('description'):
-                    desc = option['description'].replace('<', '&lt;').replace('>', '&gt;')
-                    story.append(Paragraph(f"<b>Description:</b> {desc}", body_style))
-                    story.append(Spacer(1, 0.1*inch))
+                if fields.description:
+                    body.append(f"<b>Description:</b> {fields.description}")
                 
                 # Related mission
-                if option.get('mission'):
-                    story.append(Paragraph(f"<b>Related Mission:</b> {option['mission']}", body_style))
-                    story.append(Spacer(1, 0.1*inch))
+                if fields.mission:
+                    body.append(f"<b>Related Mission:</b> {fields.mission}")
                 
                 # URL
-                if option.get('url'):
-                    story.append(Paragraph(f"<b>URL:</b> <a href='{option['url']}'>{option['url']}</a>", body_style))
-                    story.append(Spacer(1, 0.1*inch))
+                if fields.url:
+                    body.append(f"<b>URL:</b> <a href='{fields.url}'>{fields.url}</a>")
                 
                 # Classification
-                if option.get('classification'):
-                    story.append(Paragraph(f"<b>Classification:</b> {option['classification']}", body_style))
-                    story.append(Spacer(1, 0.1*inch))
+                if fields.classification:
+                    body.append(f"<b>Classification:</b> {fields.classification}")
+                
+                story.append(Paragraph("<br/>".join(body), body_style))
                 
                 # Separator between results
-                story.append(Spacer(1, 0.1*inch))
-                story.append(Paragraph("-"*80, body_style))
-                story.append(Spacer(1, 0.2*inch))
+                story.extend(_copy_flowables(separator))
             
             # Footer
-            story.append(PageBreak())
-            story.append(Spacer(1, 0.5*inch))
-            story.append(Paragraph("Report Information", heading_style))
-            story.append(Paragraph(
-                "This report was automatically generated by the QGIS Share Common Operating Picture plugin using the SEAL Geo RAG Chatbot service.",
-                body_style
-            ))
-            story.append(Spacer(1, 0.1*inch))
-            story.append(Paragraph(
-                f"<b>Service URL:</b> <a href='https://sealgeo.webgis1.com/demo/'>https://sealgeo.webgis1.com/demo/</a>",
-                body_style
-            ))
-            story.append(Paragraph(
-                f"<b>Plugin:</b> Share Common Operating Picture v1.0.0",
-                body_style
-            ))
-            
-            # Build PDF
-            doc.build(story)
+            story.extend(_copy_flowables(pdf_flowables['chatbot_footer']))
+            
+            # Build PDF into a spool that moves to disk once it grows large,
+            # so a failed build leaves nothing behind in the package
+            with pdf_buffer:
+                doc.build(story)
+                pdf_arcname = f"assets/{pdf_filename}"
+                _write_pdf_member(zipf, pdf_arcname, pdf_buffer)
             
             self.iface.messageBar().pushMessage(
                 "Success",
@@ -634,7 +1335,7 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 duration=3
             )
             
-            return pdf_path
+            return pdf_arcname
             
         except Exception as e:
             self.iface.messageBar().pushMessage(
@@ -643,22 +1344,21 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 level=Qgis.Warning,
                 duration=5
             )
-            import traceback
             traceback.print_exc()
             return None
     
-    def generate_conversation_pdf(self, assets_dir, mission, conversation):
-        """Generate PDF report for chat conversation.
+    def generate_conversation_pdf(self, zipf, mission, conversation):
+        """Generate PDF report for chat conversation straight into the package.
         
         Args:
-            assets_dir: Directory to save the PDF
+            zipf: Open ZipFile of the COP package
             mission: Mission text
             conversation: List of conversation entries (user/assistant messages)
             
         Returns:
-            Path to generated PDF or None if failed
+            Archive name of the generated PDF or None if failed
         """
-        if not REPORTLAB_AVAILABLE:
+        if not self.reportlab_available():
             self.iface.messageBar().pushMessage(
                 "Warning",
                 "ReportLab not installed - cannot generate PDF. Install with: pip install reportlab",
@@ -667,71 +1367,33 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             )
             return None
         
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
         try:
             # Create PDF filename
             timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
             pdf_filename = f"chatbot_conversation_{timestamp}.pdf"
-            pdf_path = os.path.join(assets_dir, pdf_filename)
+            pdf_buffer = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_SIZE)
             
             # Create PDF document
-            doc = SimpleDocTemplate(pdf_path, pagesize=A4,
+            doc = SimpleDocTemplate(pdf_buffer, pagesize=A4,
                                    rightMargin=0.75*inch, leftMargin=0.75*inch,
                                    topMargin=1*inch, bottomMargin=0.75*inch)
             
             # Container for PDF elements
             story = []
             
-            # Define styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                textColor='#003366',
-                spaceAfter=30,
-                alignment=TA_CENTER
-            )
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=14,
-                textColor='#003366',
-                spaceAfter=12,
-                spaceBefore=12
-            )
-            user_style = ParagraphStyle(
-                'UserMessage',
-                parent=styles['BodyText'],
-                fontSize=10,
-                leading=14,
-                textColor='#1976D2',
-                leftIndent=20,
-                spaceBefore=6,
-                spaceAfter=6
-            )
-            bot_style = ParagraphStyle(
-                'BotMessage',
-                parent=styles['BodyText'],
-                fontSize=10,
-                leading=14,
-                textColor='#558B2F',
-                leftIndent=20,
-                spaceBefore=6,
-                spaceAfter=6
-            )
-            error_style = ParagraphStyle(
-                'ErrorMessage',
-                parent=styles['BodyText'],
-                fontSize=10,
-                leading=14,
-                textColor='#C62828',
-                leftIndent=20,
-                spaceBefore=6,
-                spaceAfter=6
-            )
-            body_style = styles['BodyText']
-            body_style.fontSize = 10
-            body_style.leading = 14
+            # Shared paragraph styles
+            pdf_styles = _get_pdf_styles()
+            title_style = pdf_styles['title']
+            heading_style = pdf_styles['heading']
+            user_style = pdf_styles['user']
+            bot_style = pdf_styles['bot']
+            error_style = pdf_styles['error']
+            body_style = pdf_styles['body']
+            pdf_flowables = _get_pdf_flowables()
             
             # Title
             story.append(Paragraph("SEAL Geo RAG Chatbot", title_style))
@@ -757,51 +1419,42 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             story.append(Paragraph("Conversation", heading_style))
             story.append(Spacer(1, 0.1*inch))
             
+            fromisoformat = datetime.fromisoformat
+            time_format = '%H:%M:%S'
+            message_spacer = pdf_flowables['message_spacer']
+            separator = pdf_flowables['conversation_separator']
             for entry in conversation:
-                timestamp_dt = datetime.fromisoformat(entry['timestamp'])
-                timestamp_str = timestamp_dt.strftime('%H:%M:%S')
+                timestamp_str = fromisoformat(entry['timestamp']).strftime(time_format)
                 role = entry['role']
-                content = entry['content'].replace('<', '&lt;').replace('>', '&gt;')
+                content = escape(entry['content'], quote=False)
                 
                 if role == 'user':
                     story.append(Paragraph(f"<b>[{timestamp_str}] YOU:</b>", user_style))
                     story.append(Paragraph(content, user_style))
-                    story.append(Spacer(1, 0.1*inch))
+                    story.extend(_copy_flowables(message_spacer))
                 
                 elif role == 'assistant':
                     story.append(Paragraph(f"<b>[{timestamp_str}] 🤖 SEAL GEO RAG:</b>", bot_style))
                     story.append(Paragraph(content, bot_style))
-                    story.append(Spacer(1, 0.1*inch))
+                    story.extend(_copy_flowables(message_spacer))
                 
                 elif role == 'error':
                     story.append(Paragraph(f"<b>[{timestamp_str}] ❌ ERROR:</b>", error_style))
                     story.append(Paragraph(content, error_style))
-                    story.append(Spacer(1, 0.1*inch))
+                    story.extend(_copy_flowables(message_spacer))
                 
                 # Separator between messages
-                story.append(Paragraph("-"*60, body_style))
-                story.append(Spacer(1, 0.15*inch))
+                story.extend(_copy_flowables(separator))
             
             # Footer
-            story.append(PageBreak())
-            story.append(Spacer(1, 0.5*inch))
-            story.append(Paragraph("Report Information", heading_style))
-            story.append(Paragraph(
-                "This conversation transcript was automatically generated by the QGIS Share Common Operating Picture plugin using the SEAL Geo RAG Chatbot service.",
-                body_style
-            ))
-            story.append(Spacer(1, 0.1*inch))
-            story.append(Paragraph(
-                f"<b>Service URL:</b> <a href='https://sealgeo.servequake.com/api'>https://sealgeo.servequake.com/api</a>",
-                body_style
-            ))
-            story.append(Paragraph(
-                f"<b>Plugin:</b> Share Common Operating Picture v1.0.0",
-                body_style
-            ))
-            
-            # Build PDF
-            doc.build(story)
+            story.extend(_copy_flowables(pdf_flowables['conversation_footer']))
+            
+            # Build PDF into a spool that moves to disk once it grows large,
+            # so a failed build leaves nothing behind in the package
+            with pdf_buffer:
+                doc.build(story)
+                pdf_arcname = f"assets/{pdf_filename}"
+                _write_pdf_member(zipf, pdf_arcname, pdf_buffer)
             
             self.iface.messageBar().pushMessage(
                 "Success",
@@ -810,7 +1463,7 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 duration=3
             )
             
-            return pdf_path
+            return pdf_arcname
             
         except Exception as e:
             self.iface.messageBar().pushMessage(
@@ -819,7 +1472,6 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 level=Qgis.Warning,
                 duration=5
             )
-            import traceback
             traceback.print_exc()
             return None
     
@@ -837,9 +1489,10 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 self.btnZoom.setEnabled(True)
                 self.btnConvertDggs.setEnabled(True)
                 
-                # Auto-reverse geocode if we don't have an address
+                # Auto-reverse geocode if we don't have an address, once
+                # typing pauses
                 if not self.current_address:
-                    self.reverse_geocode()
+                    self._reverse_geocode_timer.start()
             else:
                 self.btnZoom.setEnabled(False)
                 self.btnConvertDggs.setEnabled(False)
@@ -855,70 +1508,89 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         self.check_export_ready()
     
     def geocode_location_name(self):
-        """Geocode location by name (forward geocoding)."""
+        """Geocode location by name (forward geocoding) in the background."""
         location_name = self.txtLocationName.text().strip()
         
         if not location_name:
             return
         
-        try:
-            # Nominatim forward geocoding API
-            params = urllib.parse.urlencode({
-                'q': location_name,
-                'format': 'json',
-                'limit': 1
-            })
-            url = f"https://nominatim.openstreetmap.org/search?{params}"
-            
-            # Set user agent (required by Nominatim)
-            req = urllib.request.Request(
-                url,
-                headers={'User-Agent': 'QGIS ShareCOP Plugin/1.0'}
+        # Nominatim forward geocoding API
+        params = urllib.parse.urlencode({
+            'q': location_name,
+            'format': 'json',
+            'limit': 1
+        })
+        url = f"https://nominatim.openstreetmap.org/search?{params}"
+        
+        self._cancel_task(self.geocode_task)
+        self.geocode_task = GeocodeTask(
+            url, ('search', location_name.lower()), self._on_geocode_finished)
+        self.geocode_task.location_name = location_name
+        self.btnGeocode.setEnabled(False)
+        self.geocode_task.start()
+    
+    def _on_geocode_finished(self, task):
+        """Apply a forward geocoding result; runs on the main thread."""
+        if task is not self.geocode_task:
+            # Superseded by a newer search
+            return
+        self.geocode_task = None
+        self.btnGeocode.setEnabled(True)
+        location_name = task.location_name
+        
+        if task.error is not None:
+            QMessageBox.warning(
+                self, 
+                "Error", 
+                f"Geocoding failed: {str(task.error)}\n\nCheck your internet connection."
             )
+            self.check_export_ready()
+            return
+        
+        try:
+            data = task.data
             
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
+            if data and len(data) > 0:
+                result = data[0]
+                lat = float(result['lat'])
+                lon = float(result['lon'])
                 
-                if data and len(data) > 0:
-                    result = data[0]
-                    lat = float(result['lat'])
-                    lon = float(result['lon'])
-                    
-                    # Update coordinates
-                    self.current_lon = lon
-                    self.current_lat = lat
-                    self.txtLongitude.setText(f"{lon:.6f}")
-                    self.txtLatitude.setText(f"{lat:.6f}")
-                    
-                    # Update address
-                    self.current_address = result.get('display_name', '')
-                    self.lblAddress.setText(f"Address: {self.current_address}")
-                    
-                    # Enable zoom and check export ready
-                    self.btnZoom.setEnabled(True)
-                    self.btnConvertDggs.setEnabled(True)
-                    self.check_export_ready()
-                    
-                    # Auto-zoom to location
-                    self.zoom_to_location()
-                    
-                    self.iface.messageBar().pushMessage(
-                        "Success",
-                        f"Found: {self.current_address[:80]}",
-                        level=Qgis.Success,
-                        duration=4
-                    )
-                else:
-                    QMessageBox.warning(
-                        self, 
-                        "Not Found", 
-                        f"Could not find location: '{location_name}'\n\nTry:\n"
-                        "- City name (e.g., 'Berlin')\n"
-                        "- Full address\n"
-                        "- Landmark name\n"
-                        "- Coordinates"
-                    )
-        
+                # Update address first so the coordinate edits below do not
+                # schedule a reverse lookup that would replace it
+                self.current_address = result.get('display_name', '')
+                self.lblAddress.setText(f"Address: {self.current_address}")
+                
+                # Update coordinates
+                self.current_lon = lon
+                self.current_lat = lat
+                self.txtLongitude.setText(f"{lon:.6f}")
+                self.txtLatitude.setText(f"{lat:.6f}")
+                
+                # Enable zoom and check export ready
+                self.btnZoom.setEnabled(True)
+                self.btnConvertDggs.setEnabled(True)
+                self.check_export_ready()
+                
+                # Auto-zoom to location
+                self.zoom_to_location()
+                
+                self.iface.messageBar().pushMessage(
+                    "Success",
+                    f"Found: {self.current_address[:80]}",
+                    level=Qgis.Success,
+                    duration=4
+                )
+            else:
+                QMessageBox.warning(
+                    self, 
+                    "Not Found", 
+                    f"Could not find location: '{location_name}'\n\nTry:\n"
+                    "- City name (e.g., 'Berlin')\n"
+                    "- Full address\n"
+                    "- Landmark name\n"
+                    "- Coordinates"
+                )
+    
         except Exception as e:
             QMessageBox.warning(
                 self, 
@@ -935,9 +1607,8 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         
         try:
             # Import dggal
-            try:
-                import dggal
-            except ImportError:
+            dggal = _get_dggal()
+            if dggal is None:
                 QMessageBox.critical(
                     self,
                     "Error",
@@ -953,78 +1624,41 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             dggs_type = self.cmbDggsCrs.currentText()
             resolution = self.spinResolution.value()
             
-            # Create DGGS grid based on type using GNOSISGlobalGrid
-            try:
-                if dggs_type == "H3":
-                    # H3 uses a different approach - create a simple zone ID
-                    zone_id = f"H3-R{resolution}-{self.current_lat:.4f}_{self.current_lon:.4f}"
-                    self.current_zone_id = zone_id
-                    self.lblZoneId.setText(f"Zone ID: {zone_id}")
-                    self.iface.messageBar().pushMessage(
-                        "Success",
-                        f"Generated {dggs_type} zone ID",
-                        level=Qgis.Success,
-                        duration=3
-                    )
-                    # Create layer and continue
-                    self.create_dggs_layer(dggs_type, resolution, zone_id)
-                    return
-                elif dggs_type == "S2":
-                    # S2 uses a different approach - create a simple zone ID
-                    zone_id = f"S2-R{resolution}-{self.current_lat:.4f}_{self.current_lon:.4f}"
-                    self.current_zone_id = zone_id
-                    self.lblZoneId.setText(f"Zone ID: {zone_id}")
-                    self.iface.messageBar().pushMessage(
-                        "Success",
-                        f"Generated {dggs_type} zone ID",
-                        level=Qgis.Success,
-                        duration=3
-                    )
-                    # Create layer and continue
-                    self.create_dggs_layer(dggs_type, resolution, zone_id)
-                    return
-                elif dggs_type == "rHEALPix":
-                    projection = dggal.rHEALPix()
-                    grid = dggal.GNOSISGlobalGrid(projection, resolution)
-                    # For rHEALPix, create simplified zone ID
-                    zone_id = f"{dggs_type}-R{resolution}-{self.current_lat:.4f}_{self.current_lon:.4f}"
-                    self.current_zone_id = zone_id
-                    self.lblZoneId.setText(f"Zone ID: {zone_id}")
-                    self.iface.messageBar().pushMessage(
-                        "Info",
-                        f"Generated {dggs_type} zone ID (simplified format)",
-                        level=Qgis.Info,
-                        duration=3
-                    )
-                elif dggs_type == "ISEA3H":
-                    projection = dggal.ISEA3H()
-                    grid = dggal.GNOSISGlobalGrid(projection, resolution)
-                    # For ISEA3H, create simplified zone ID
-                    zone_id = f"{dggs_type}-R{resolution}-{self.current_lat:.4f}_{self.current_lon:.4f}"
-                    self.current_zone_id = zone_id
-                    self.lblZoneId.setText(f"Zone ID: {zone_id}")
-                    self.iface.messageBar().pushMessage(
-                        "Info",
-                        f"Generated {dggs_type} zone ID (simplified format)",
-                        level=Qgis.Info,
-                        duration=3
-                    )
-                else:
-                    QMessageBox.warning(self, "Error", f"Unsupported DGGS type: {dggs_type}")
-                    return
-                
-            except Exception as e:
-                # Fallback: generate a descriptive zone ID
-                zone_id = f"{dggs_type}-R{resolution}-{self.current_lat:.4f}_{self.current_lon:.4f}"
-                self.current_zone_id = zone_id
-                self.lblZoneId.setText(f"Zone ID: {zone_id}")
-                
-                self.iface.messageBar().pushMessage(
-                    "Warning",
-                    f"Using simplified zone ID format (dggal API error: {str(e)[:50]})",
-                    level=Qgis.Warning,
-                    duration=5
-                )
+            if dggs_type not in DGGS_GRID_PROJECTIONS:
+                QMessageBox.warning(self, "Error", f"Unsupported DGGS type: {dggs_type}")
+                return
+            projection_name = DGGS_GRID_PROJECTIONS[dggs_type]
+            
+            # All types share the simplified zone ID format
+            zone_id = self.calculate_dggs_zone(
+                self.current_lat, self.current_lon, dggs_type, resolution
+            )
+            
+            if projection_name is None:
+                # H3 and S2 use a different approach - only the simple zone ID
+                title, message, level, duration = (
+                    "Success", f"Generated {dggs_type} zone ID", Qgis.Success, 3)
+            else:
+                # Create DGGS grid based on type using GNOSISGlobalGrid
+                try:
+                    projection = getattr(dggal, projection_name)()
+                    dggal.GNOSISGlobalGrid(projection, resolution)
+                    title, message, level, duration = (
+                        "Info", f"Generated {dggs_type} zone ID (simplified format)", Qgis.Info, 3)
+                except Exception as e:
+                    title, message, level, duration = (
+                        "Warning",
+                        f"Using simplified zone ID format (dggal API error: {str(e)[:50]})",
+                        Qgis.Warning, 5)
+            
+            self.current_zone_id = zone_id
+            self.lblZoneId.setText(f"Zone ID: {zone_id}")
+            self.iface.messageBar().pushMessage(
+                title,
+                message,
+                level=level,
+                duration=duration
+            )
             
             # Create DGGS layer with the zone ID
             self.create_dggs_layer(dggs_type, resolution, zone_id)
@@ -1033,14 +1667,46 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             self.lblZoneId.setText("Zone ID: (conversion failed)")
             QMessageBox.critical(self, "Error", f"DGGS conversion failed: {str(e)}")
     
+    def polygon_layers(self):
+        """Return the project's polygon layers.
+        
+        The project is scanned once; afterwards the list is maintained from
+        the project's layer signals.
+        
+        Returns:
+            List of polygon QgsVectorLayer objects
+        """
+        if self._polygon_layers is None:
+            self._polygon_layers = {}
+            project = QgsProject.instance()
+            self._on_layers_added(project.mapLayers().values())
+            project.layersAdded.connect(self._on_layers_added)
+            project.layersRemoved.connect(self._on_layers_removed)
+        return list(self._polygon_layers.values())
+    
+    def _on_layers_added(self, layers):
+        """Track newly added polygon layers."""
+        for layer in layers:
+            if isinstance(layer, QgsVectorLayer) and layer.geometryType() == QgsWkbTypes.PolygonGeometry:
+                self._polygon_layers[layer.id()] = layer
+    
+    def _on_layers_removed(self, layer_ids):
+        """Forget removed polygon layers."""
+        for layer_id in layer_ids:
+            self._polygon_layers.pop(layer_id, None)
+    
+    def stop_layer_tracking(self):
+        """Disconnect from the project's layer signals, e.g. on plugin unload."""
+        if self._polygon_layers is not None:
+            project = QgsProject.instance()
+            project.layersAdded.disconnect(self._on_layers_added)
+            project.layersRemoved.disconnect(self._on_layers_removed)
+            self._polygon_layers = None
+    
     def select_polygon_for_dggs(self):
         """Allow user to select a polygon from existing layers and convert to DGGS zones."""
         # Get all polygon layers
-        polygon_layers = []
-        for layer in QgsProject.instance().mapLayers().values():
-            if isinstance(layer, QgsVectorLayer):
-                if layer.geometryType() == QgsWkbTypes.PolygonGeometry:
-                    polygon_layers.append(layer)
+        polygon_layers = self.polygon_layers()
         
         if not polygon_layers:
             QMessageBox.warning(
@@ -1051,7 +1717,6 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             return
         
         # Show layer selection dialog
-        from qgis.PyQt.QtWidgets import QInputDialog
         layer_names = [layer.name() for layer in polygon_layers]
         layer_name, ok = QInputDialog.getItem(
             self,
@@ -1086,7 +1751,9 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                selected_features = list(selected_layer.getFeatures())
+                # Stream the layer; only geometries are needed
+                selected_features = selected_layer.getFeatures(
+                    QgsFeatureRequest().setNoAttributes())
             else:
                 return
         
@@ -1114,13 +1781,9 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 )
                 return
             
-            crs = self.canvas.mapSettings().destinationCrs()
-            
             # Transform to EPSG:4326
-            transform = QgsCoordinateTransform(
-                crs,
-                QgsCoordinateReferenceSystem('EPSG:4326'),
-                QgsProject.instance()
+            transform = self.coordinate_transform(
+                self.canvas.mapSettings().destinationCrs(), QgsCoordinateReferenceSystem('EPSG:4326')
             )
             extent_4326 = transform.transformBoundingBox(extent)
         
@@ -1131,45 +1794,92 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         # Create DGGS grid
         self.create_dggs_grid_layer(extent_4326, dggs_type, resolution)
     
+    def _create_dggs_memory_layer(self, uri, name, fields):
+        """Replace any layer called name with a new memory layer.
+        
+        Args:
+            uri: Memory provider URI, e.g. "Polygon?crs=EPSG:4326"
+            name: Layer name
+            fields: List of QgsField to add
+            
+        Returns:
+            Tuple (layer, provider); fields and features go straight to the
+            memory provider, so no edit buffer is needed
+        """
+        project = QgsProject.instance()
+        existing_layers = project.mapLayersByName(name)
+        if existing_layers:
+            project.removeMapLayers([l.id() for l in existing_layers])
+        
+        layer = QgsVectorLayer(uri, name, "memory")
+        if not layer.isValid():
+            raise Exception("Failed to create valid memory layer")
+        
+        provider = layer.dataProvider()
+        provider.addAttributes(fields)
+        layer.updateFields()
+        return layer, provider
+    
+    def _show_dggs_layer(self, layer, style, labels=True, margin=0):
+        """Style a DGGS layer, add it to the project and zoom to it.
+        
+        Args:
+            layer: DGGS memory layer with its features added
+            style: Key into the shared DGGS styles (zones, grid or point)
+            labels: Whether to label features with their zone ID; otherwise
+                the zone ID is only available as a map tip
+            margin: Extra extent around the layer as a fraction of its width
+        """
+        symbol, label_settings = _get_dggs_styles()[style]
+        layer.setRenderer(QgsSingleSymbolRenderer(symbol.clone()))
+        if labels:
+            layer.setLabeling(QgsVectorLayerSimpleLabeling(label_settings))
+            layer.setLabelsEnabled(True)
+        else:
+            layer.setLabelsEnabled(False)
+            layer.setDisplayExpression('"zone_id"')
+        
+        QgsProject.instance().addMapLayer(layer)
+        
+        # Zoom to layer extent if it has features
+        if layer.featureCount() > 0:
+            extent = layer.extent()
+            if margin:
+                extent = extent.buffered(extent.width() * margin if extent.width() > 0 else 0.1)
+            self.canvas.setExtent(extent)
+            self.canvas.refresh()
+    
     def create_dggs_zones_from_polygons(self, features, dggs_type, resolution):
         """Convert polygon features to DGGS zones.
         
         Args:
-            features: List of QgsFeature with polygon geometry
+            features: Iterable of QgsFeature with polygon geometry, e.g. a
+                QgsFeatureIterator consumed lazily
             dggs_type: DGGS coordinate reference system type
             resolution: DGGS resolution level
         """
         try:
-            print(f"[DGGS Polygons] Converting {len(features)} polygon(s) to DGGS zones")
-            
-            # Remove existing DGGS layer
-            existing_layers = QgsProject.instance().mapLayersByName("DGGS Zones")
-            for existing_layer in existing_layers:
-                QgsProject.instance().removeMapLayer(existing_layer.id())
-            
-            # Create new polygon layer for DGGS zones
-            layer = QgsVectorLayer("Polygon?crs=EPSG:4326", "DGGS Zones", "memory")
-            
-            if not layer.isValid():
-                raise Exception("Failed to create valid memory layer")
-            
-            provider = layer.dataProvider()
-            layer.startEditing()
-            
-            # Add fields
-            provider.addAttributes([
-                QgsField("zone_id", QVariant.String),
-                QgsField("dggs_type", QVariant.String),
-                QgsField("resolution", QVariant.Int),
-                QgsField("center_lat", QVariant.Double),
-                QgsField("center_lon", QVariant.Double),
-                QgsField("area_km2", QVariant.Double)
-            ])
-            layer.updateFields()
+            log.debug("[DGGS Polygons] Converting polygon(s) to DGGS zones")
+            
+            # Replace any existing DGGS zones with a new polygon layer
+            layer, provider = self._create_dggs_memory_layer(
+                "Polygon?crs=EPSG:4326", "DGGS Zones", [
+                    QgsField("zone_id", QVariant.String),
+                    QgsField("dggs_type", QVariant.String),
+                    QgsField("resolution", QVariant.Int),
+                    QgsField("center_lat", QVariant.Double),
+                    QgsField("center_lon", QVariant.Double),
+                    QgsField("area_km2", QVariant.Double)
+                ])
             
             dggs_features = []
             zone_count = 0
             
+            # One ellipsoidal area calculator and field set for all zones
+            dist_calc = QgsDistanceArea()
+            dist_calc.setEllipsoid('WGS84')
+            fields = layer.fields()
+            
             for feature in features:
                 geom = feature.geometry()
                 if not geom or geom.isNull():
@@ -1187,21 +1897,16 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 # For simplicity, use a small box (this would ideally be the actual DGGS cell)
                 cell_size = 0.01 * (15 - resolution)  # Smaller cells at higher resolution
                 
-                cell_polygon = QgsGeometry.fromPolygonXY([[
-                    QgsPointXY(centroid.x() - cell_size, centroid.y() - cell_size),
-                    QgsPointXY(centroid.x() + cell_size, centroid.y() - cell_size),
-                    QgsPointXY(centroid.x() + cell_size, centroid.y() + cell_size),
-                    QgsPointXY(centroid.x() - cell_size, centroid.y() + cell_size),
-                    QgsPointXY(centroid.x() - cell_size, centroid.y() - cell_size)
-                ]])
+                cx, cy = centroid.x(), centroid.y()
+                cell_polygon = QgsGeometry.fromRect(QgsRectangle(
+                    cx - cell_size, cy - cell_size, cx + cell_size, cy + cell_size
+                ))
                 
                 # Calculate area in km²
-                dist_calc = QgsDistanceArea()
-                dist_calc.setEllipsoid('WGS84')
                 area_m2 = dist_calc.measureArea(geom)
                 area_km2 = area_m2 / 1000000.0
                 
-                dggs_feature = QgsFeature(layer.fields())
+                dggs_feature = QgsFeature(fields)
                 dggs_feature.setGeometry(cell_polygon)
                 dggs_feature.setAttributes([
                     zone_id,
@@ -1215,52 +1920,12 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 zone_count += 1
             
             # Add features
-            provider.addFeatures(dggs_features)
-            layer.commitChanges()
+            provider.addFeatures(dggs_features, QgsFeatureSink.FastInsert)
             layer.updateExtents()
             
-            print(f"[DGGS Polygons] Created {zone_count} DGGS zone polygons")
-            
-            # Style the layer
-            symbol = QgsFillSymbol.createSimple({
-                'color': '255,107,107,100',  # Semi-transparent red
-                'outline_color': '#C92A2A',
-                'outline_width': '0.5'
-            })
-            renderer = QgsSingleSymbolRenderer(symbol)
-            layer.setRenderer(renderer)
-            
-            # Add labels
-            text_format = QgsTextFormat()
-            text_format.setFont(QFont("Arial", 9, QFont.Bold))
-            text_format.setSize(9)
-            text_format.setColor(QColor(0, 0, 0))
-            
-            buffer_settings = QgsTextBufferSettings()
-            buffer_settings.setEnabled(True)
-            buffer_settings.setSize(1)
-            buffer_settings.setColor(QColor(255, 255, 255))
-            text_format.setBuffer(buffer_settings)
+            log.debug("[DGGS Polygons] Created %d DGGS zone polygons", zone_count)
             
-            label_settings = QgsPalLayerSettings()
-            label_settings.setFormat(text_format)
-            label_settings.fieldName = "zone_id"
-            label_settings.enabled = True
-            label_settings.dist = 2
-            
-            labeling = QgsVectorLayerSimpleLabeling(label_settings)
-            layer.setLabeling(labeling)
-            layer.setLabelsEnabled(True)
-            
-            # Add layer to project
-            QgsProject.instance().addMapLayer(layer)
-            
-            # Zoom to layer
-            if layer.featureCount() > 0:
-                extent = layer.extent()
-                buffered_extent = extent.buffered(extent.width() * 0.1 if extent.width() > 0 else 0.1)
-                self.canvas.setExtent(buffered_extent)
-                self.canvas.refresh()
+            self._show_dggs_layer(layer, 'zones', margin=0.1)
             
             self.iface.messageBar().pushMessage(
                 "Success",
@@ -1276,7 +1941,6 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 level=Qgis.Critical,
                 duration=5
             )
-            import traceback
             traceback.print_exc()
     
     def create_dggs_grid_layer(self, extent, dggs_type, resolution):
@@ -1288,84 +1952,73 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             resolution: DGGS resolution level
         """
         try:
-            print(f"[DGGS Grid] Creating grid for extent: {extent.toString()}")
-            
-            # Remove existing DGGS layer
-            existing_layers = QgsProject.instance().mapLayersByName("DGGS Grid")
-            for existing_layer in existing_layers:
-                QgsProject.instance().removeMapLayer(existing_layer.id())
-            
-            # Create new polygon layer
-            layer = QgsVectorLayer("Polygon?crs=EPSG:4326", "DGGS Grid", "memory")
-            
-            if not layer.isValid():
-                raise Exception("Failed to create valid memory layer")
-            
-            provider = layer.dataProvider()
-            layer.startEditing()
-            
-            # Add fields
-            provider.addAttributes([
-                QgsField("zone_id", QVariant.String),
-                QgsField("dggs_type", QVariant.String),
-                QgsField("resolution", QVariant.Int),
-                QgsField("center_lat", QVariant.Double),
-                QgsField("center_lon", QVariant.Double),
-                QgsField("row", QVariant.Int),
-                QgsField("col", QVariant.Int)
-            ])
-            layer.updateFields()
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[DGGS Grid] Creating grid for extent: %s", extent.toString())
+            
+            # Replace any existing DGGS grid with a new polygon layer
+            layer, provider = self._create_dggs_memory_layer(
+                "Polygon?crs=EPSG:4326", "DGGS Grid", [
+                    QgsField("zone_id", QVariant.String),
+                    QgsField("dggs_type", QVariant.String),
+                    QgsField("resolution", QVariant.Int),
+                    QgsField("center_lat", QVariant.Double),
+                    QgsField("center_lon", QVariant.Double),
+                    QgsField("row", QVariant.Int),
+                    QgsField("col", QVariant.Int)
+                ])
+            
+            min_lon, min_lat = extent.xMinimum(), extent.yMinimum()
+            max_lon, max_lat = extent.xMaximum(), extent.yMaximum()
             
             # Calculate grid parameters
-            # Cell size decreases with higher resolution
-            cell_size = 0.1 * (15 - resolution) / 2
+            # Cell size decreases with higher resolution, but grows as needed
+            # to keep the grid at about max_cells to prevent performance issues
+            max_cells = 100
+            area = (max_lon - min_lon) * (max_lat - min_lat)
+            cell_size = max(0.1 * (15 - resolution) / 2, math.sqrt(area / max_cells))
             
             # Calculate grid dimensions
-            min_lon, min_lat = extent.xMinimum(), extent.yMinimum()
-            max_lon, max_lat = extent.xMaximum(), extent.yMaximum()
+            cols = max(1, math.ceil((max_lon - min_lon) / cell_size))
+            rows = max(1, math.ceil((max_lat - min_lat) / cell_size))
             
-            cols = int((max_lon - min_lon) / cell_size) + 1
-            rows = int((max_lat - min_lat) / cell_size) + 1
+            log.debug("[DGGS Grid] Creating %dx%d = %d cells", rows, cols, rows * cols)
             
-            # Limit grid size to prevent performance issues
-            max_cells = 100
-            if cols * rows > max_cells:
-                factor = ((cols * rows) / max_cells) ** 0.5
-                cell_size *= factor
-                cols = int((max_lon - min_lon) / cell_size) + 1
-                rows = int((max_lat - min_lat) / cell_size) + 1
-            
-            print(f"[DGGS Grid] Creating {rows}x{cols} = {rows*cols} cells")
-            
-            grid_features = []
-            
-            for row in range(rows):
-                for col in range(cols):
-                    # Calculate cell bounds
-                    cell_min_lon = min_lon + col * cell_size
-                    cell_max_lon = min_lon + (col + 1) * cell_size
-                    cell_min_lat = min_lat + row * cell_size
-                    cell_max_lat = min_lat + (row + 1) * cell_size
-                    
-                    # Calculate center
-                    center_lon = (cell_min_lon + cell_max_lon) / 2
-                    center_lat = (cell_min_lat + cell_max_lat) / 2
-                    
-                    # Generate zone ID for center
-                    zone_id = self.calculate_dggs_zone(
-                        center_lat, center_lon, dggs_type, resolution
-                    )
+            # Cell count is known up front, so fill a pre-sized list
+            grid_features = [None] * (rows * cols)
+            fields = layer.fields()
+            
+            # Cell bounds and centers along each axis, computed once
+            col_bounds = [
+                (min_lon + col * cell_size, min_lon + (col + 1) * cell_size)
+                for col in range(cols)
+            ]
+            row_bounds = [
+                (min_lat + row * cell_size, min_lat + (row + 1) * cell_size)
+                for row in range(rows)
+            ]
+            col_centers = [(x0 + x1) / 2 for x0, x1 in col_bounds]
+            row_centers = [(y0 + y1) / 2 for y0, y1 in row_bounds]
+            
+            # Zone IDs for all cell centers in row-major order
+            zone_ids = self.calculate_dggs_zones_batch(
+                [center_lat for center_lat in row_centers for _ in range(cols)],
+                col_centers * rows,
+                dggs_type, resolution
+            )
+            
+            for row, (cell_min_lat, cell_max_lat) in enumerate(row_bounds):
+                center_lat = row_centers[row]
+                for col, (cell_min_lon, cell_max_lon) in enumerate(col_bounds):
+                    center_lon = col_centers[col]
+                    index = row * cols + col
+                    zone_id = zone_ids[index]
                     
-                    # Create cell polygon
-                    cell_polygon = QgsGeometry.fromPolygonXY([[
-                        QgsPointXY(cell_min_lon, cell_min_lat),
-                        QgsPointXY(cell_max_lon, cell_min_lat),
-                        QgsPointXY(cell_max_lon, cell_max_lat),
-                        QgsPointXY(cell_min_lon, cell_max_lat),
-                        QgsPointXY(cell_min_lon, cell_min_lat)
-                    ]])
+                    # Create cell polygon (closed ring built in C++)
+                    cell_polygon = QgsGeometry.fromRect(QgsRectangle(
+                        cell_min_lon, cell_min_lat, cell_max_lon, cell_max_lat
+                    ))
                     
-                    grid_feature = QgsFeature(layer.fields())
+                    grid_feature = QgsFeature(fields)
                     grid_feature.setGeometry(cell_polygon)
                     grid_feature.setAttributes([
                         zone_id,
@@ -1376,51 +2029,18 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                         row,
                         col
                     ])
-                    grid_features.append(grid_feature)
+                    grid_features[index] = grid_feature
             
             # Add features
-            provider.addFeatures(grid_features)
-            layer.commitChanges()
+            provider.addFeatures(grid_features, QgsFeatureSink.FastInsert)
             layer.updateExtents()
             
-            print(f"[DGGS Grid] Created {len(grid_features)} grid cells")
-            
-            # Style the layer
-            symbol = QgsFillSymbol.createSimple({
-                'color': '107,179,255,50',  # Semi-transparent blue
-                'outline_color': '#1976D2',
-                'outline_width': '0.3'
-            })
-            renderer = QgsSingleSymbolRenderer(symbol)
-            layer.setRenderer(renderer)
-            
-            # Add labels
-            text_format = QgsTextFormat()
-            text_format.setFont(QFont("Arial", 8))
-            text_format.setSize(8)
-            text_format.setColor(QColor(0, 0, 0))
-            
-            buffer_settings = QgsTextBufferSettings()
-            buffer_settings.setEnabled(True)
-            buffer_settings.setSize(0.5)
-            buffer_settings.setColor(QColor(255, 255, 255))
-            text_format.setBuffer(buffer_settings)
-            
-            label_settings = QgsPalLayerSettings()
-            label_settings.setFormat(text_format)
-            label_settings.fieldName = "zone_id"
-            label_settings.enabled = True
+            log.debug("[DGGS Grid] Created %d grid cells", len(grid_features))
             
-            labeling = QgsVectorLayerSimpleLabeling(label_settings)
-            layer.setLabeling(labeling)
-            layer.setLabelsEnabled(True)
-            
-            # Add layer to project
-            QgsProject.instance().addMapLayer(layer)
-            
-            # Zoom to layer
-            self.canvas.setExtent(layer.extent())
-            self.canvas.refresh()
+            # Dense grids only get zone IDs as map tips, since label
+            # placement cost grows quickly with the cell count
+            self._show_dggs_layer(
+                layer, 'grid', labels=len(grid_features) <= MAX_LABELED_GRID_CELLS)
             
             self.iface.messageBar().pushMessage(
                 "Success",
@@ -1436,7 +2056,6 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 level=Qgis.Critical,
                 duration=5
             )
-            import traceback
             traceback.print_exc()
             self.lblZoneId.setText("Zone ID: (conversion failed)")
             QMessageBox.critical(self, "Error", f"DGGS conversion failed: {str(e)}")
@@ -1450,43 +2069,24 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             zone_id: Calculated zone ID
         """
         try:
-            print(f"[DGGS Layer] Creating layer for zone: {zone_id}")
-            print(f"[DGGS Layer] Location: {self.current_lat}, {self.current_lon}")
-            
-            # Check if DGGS layer already exists and remove it
-            existing_layers = QgsProject.instance().mapLayersByName("DGGS Zones")
-            for existing_layer in existing_layers:
-                print(f"[DGGS Layer] Removing existing layer: {existing_layer.id()}")
-                QgsProject.instance().removeMapLayer(existing_layer.id())
-            
-            # Create new point layer
-            layer = QgsVectorLayer("Point?crs=EPSG:4326", "DGGS Zones", "memory")
-            
-            if not layer.isValid():
-                raise Exception("Failed to create valid memory layer")
-            
-            print(f"[DGGS Layer] Layer created, valid: {layer.isValid()}")
-            
-            provider = layer.dataProvider()
-            
-            # Start editing
-            layer.startEditing()
-            
-            # Add fields
-            provider.addAttributes([
-                QgsField("zone_id", QVariant.String),
-                QgsField("dggs_type", QVariant.String),
-                QgsField("resolution", QVariant.Int),
-                QgsField("latitude", QVariant.Double),
-                QgsField("longitude", QVariant.Double),
-                QgsField("location", QVariant.String)
-            ])
-            layer.updateFields()
+            log.debug("[DGGS Layer] Creating layer for zone %s at %s, %s",
+                      zone_id, self.current_lat, self.current_lon)
+            
+            # Replace any existing DGGS zones with a new point layer
+            layer, provider = self._create_dggs_memory_layer(
+                "Point?crs=EPSG:4326", "DGGS Zones", [
+                    QgsField("zone_id", QVariant.String),
+                    QgsField("dggs_type", QVariant.String),
+                    QgsField("resolution", QVariant.Int),
+                    QgsField("latitude", QVariant.Double),
+                    QgsField("longitude", QVariant.Double),
+                    QgsField("location", QVariant.String)
+                ])
             
-            print(f"[DGGS Layer] Fields added: {[f.name() for f in layer.fields()]}")
+            fields = layer.fields()
             
             # Create feature for center point
-            center_feature = QgsFeature(layer.fields())
+            center_feature = QgsFeature(fields)
             point_geom = QgsGeometry.fromPointXY(QgsPointXY(self.current_lon, self.current_lat))
             center_feature.setGeometry(point_geom)
             center_feature.setAttributes([
@@ -1498,13 +2098,11 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 self.txtLocationName.text() or "Center Point"
             ])
             
-            print(f"[DGGS Layer] Center feature created with geometry: {center_feature.hasGeometry()}")
-            
             features = [center_feature]
             
             # Calculate AOI and add corner zone IDs if available
             if self.current_aoi_bbox:
-                print(f"[DGGS Layer] Adding AOI corners from bbox: {self.current_aoi_bbox}")
+                log.debug("[DGGS Layer] Adding AOI corners from bbox: %s", self.current_aoi_bbox)
                 west, south, east, north = self.current_aoi_bbox
                 
                 # Calculate corner zone IDs
@@ -1515,10 +2113,14 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                     "NE": (north, east)
                 }
                 
-                for corner_name, (lat, lon) in corners.items():
-                    corner_zone_id = self.calculate_dggs_zone(lat, lon, dggs_type, resolution)
-                    
-                    corner_feature = QgsFeature(layer.fields())
+                corner_zone_ids = self.calculate_dggs_zones_batch(
+                    [lat for lat, _ in corners.values()],
+                    [lon for _, lon in corners.values()],
+                    dggs_type, resolution
+                )
+                
+                for (corner_name, (lat, lon)), corner_zone_id in zip(corners.items(), corner_zone_ids):
+                    corner_feature = QgsFeature(fields)
                     corner_feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(lon, lat)))
                     corner_feature.setAttributes([
                         corner_zone_id,
@@ -1531,77 +2133,16 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                     features.append(corner_feature)
             
             # Add features to layer
-            success, added_features = provider.addFeatures(features)
-            print(f"[DGGS Layer] Add features result: {success}, count: {len(added_features)}")
+            success, added_features = provider.addFeatures(features, QgsFeatureSink.FastInsert)
+            log.debug("[DGGS Layer] Add features result: %s, count: %d", success, len(added_features))
             
-            # Commit changes
-            layer.commitChanges()
             layer.updateExtents()
             
-            print(f"[DGGS Layer] Feature count: {layer.featureCount()}")
-            print(f"[DGGS Layer] Extent: {layer.extent().toString()}")
-            
-            # Style the layer with distinctive markers
-            symbol = QgsMarkerSymbol.createSimple({
-                'name': 'circle',
-                'color': '#FF6B6B',
-                'size': '4',
-                'outline_color': '#C92A2A',
-                'outline_width': '0.5'
-            })
-            renderer = QgsSingleSymbolRenderer(symbol)
-            layer.setRenderer(renderer)
-            
-            # Add labels showing zone IDs
-            text_format = QgsTextFormat()
-            text_format.setFont(QFont("Arial", 10, QFont.Bold))
-            text_format.setSize(10)
-            text_format.setColor(QColor(0, 0, 0))
-            
-            # Add text buffer (halo) for better visibility
-            buffer_settings = QgsTextBufferSettings()
-            buffer_settings.setEnabled(True)
-            buffer_settings.setSize(1)
-            buffer_settings.setColor(QColor(255, 255, 255))
-            text_format.setBuffer(buffer_settings)
-            
-            label_settings = QgsPalLayerSettings()
-            label_settings.setFormat(text_format)
-            label_settings.fieldName = "zone_id"
-            label_settings.enabled = True
-            label_settings.dist = 2
-            
-            # Try to set placement, but handle version incompatibility gracefully
-            try:
-                # Try different placement options based on QGIS version
-                if hasattr(QgsPalLayerSettings, 'AroundPoint'):
-                    label_settings.placement = QgsPalLayerSettings.AroundPoint
-                elif hasattr(QgsPalLayerSettings, 'OverPoint'):
-                    label_settings.placement = QgsPalLayerSettings.OverPoint
-                # If neither exists, leave at default
-            except Exception as e:
-                print(f"[DGGS Layer] Could not set label placement: {e}")
-                # Continue without placement setting
-            
-            labeling = QgsVectorLayerSimpleLabeling(label_settings)
-            layer.setLabeling(labeling)
-            layer.setLabelsEnabled(True)
-            
-            # Add layer to project
-            QgsProject.instance().addMapLayer(layer)
-            print(f"[DGGS Layer] Layer added to project")
-            
-            # Force refresh
-            layer.triggerRepaint()
-            self.canvas.refresh()
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[DGGS Layer] %d feature(s), extent: %s",
+                          layer.featureCount(), layer.extent().toString())
             
-            # Zoom to layer extent if it has features
-            if layer.featureCount() > 0:
-                extent = layer.extent()
-                buffered_extent = extent.buffered(extent.width() * 0.2 if extent.width() > 0 else 0.1)
-                print(f"[DGGS Layer] Zooming to extent: {buffered_extent.toString()}")
-                self.canvas.setExtent(buffered_extent)
-                self.canvas.refresh()
+            self._show_dggs_layer(layer, 'point', margin=0.2)
             
             self.iface.messageBar().pushMessage(
                 "Success",
@@ -1617,7 +2158,6 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 level=Qgis.Warning,
                 duration=5
             )
-            import traceback
             traceback.print_exc()
     
     def zoom_to_location(self):
@@ -1632,10 +2172,8 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         # Transform point to map CRS
         point_4326 = QgsPointXY(self.current_lon, self.current_lat)
         
-        transform = QgsCoordinateTransform(
-            QgsCoordinateReferenceSystem('EPSG:4326'),
-            self.canvas.mapSettings().destinationCrs(),
-            QgsProject.instance()
+        transform = self.coordinate_transform(
+            QgsCoordinateReferenceSystem('EPSG:4326'), self.canvas.mapSettings().destinationCrs()
         )
         
         try:
@@ -1656,42 +2194,57 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             QMessageBox.warning(self, "Error", f"Failed to zoom: {str(e)}")
     
     def reverse_geocode(self):
-        """Perform reverse geocoding using Nominatim."""
+        """Perform reverse geocoding using Nominatim in the background."""
+        # A direct call supersedes a pending debounced one
+        self._reverse_geocode_timer.stop()
         if self.current_lon is None or self.current_lat is None:
             return
+        if self.current_address:
+            # Already known, e.g. from a forward geocoding result
+            return
         
-        try:
-            # Nominatim API
-            url = f"https://nominatim.openstreetmap.org/reverse?format=json&lat={self.current_lat}&lon={self.current_lon}"
-            
-            # Set user agent (required by Nominatim)
-            req = urllib.request.Request(
-                url,
-                headers={'User-Agent': 'QGIS ShareCOP Plugin/1.0'}
-            )
-            
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                
-                if 'display_name' in data:
-                    self.current_address = data['display_name']
-                    self.lblAddress.setText(f"Address: {self.current_address}")
-                else:
-                    self.lblAddress.setText("Address: (not found)")
+        # Nominatim API
+        url = f"https://nominatim.openstreetmap.org/reverse?format=json&lat={self.current_lat}&lon={self.current_lon}"
         
-        except Exception as e:
-            self.lblAddress.setText(f"Address: (geocoding failed: {str(e)[:50]})")
+        self._cancel_task(self.reverse_geocode_task)
+        # Points within about a metre share a cached address
+        cache_key = ('reverse', round(self.current_lat, 5), round(self.current_lon, 5))
+        self.reverse_geocode_task = GeocodeTask(
+            url, cache_key, self._on_reverse_geocode_finished)
+        self.lblAddress.setText("Address: (looking up...)")
+        self.reverse_geocode_task.start()
+    
+    def _on_reverse_geocode_finished(self, task):
+        """Show a reverse geocoding result; runs on the main thread."""
+        if task is not self.reverse_geocode_task:
+            # Superseded by a newer location
+            return
+        self.reverse_geocode_task = None
+        
+        if task.error is not None:
+            self.lblAddress.setText(f"Address: (geocoding failed: {str(task.error)[:50]})")
+        elif 'display_name' in task.data:
+            self.current_address = task.data['display_name']
+            self.lblAddress.setText(f"Address: {self.current_address}")
+        else:
+            self.lblAddress.setText("Address: (not found)")
     
     def browse_output_dir(self):
-        """Browse for output directory."""
+        """Browse for output directory, starting from the last one used."""
+        settings = QSettings()
+        start_dir = (
+            self.txtOutputDir.text().strip() or
+            settings.value(OUTPUT_DIR_SETTING, os.path.expanduser("~"))
+        )
         directory = QFileDialog.getExistingDirectory(
             self,
             "Select Output Directory",
-            os.path.expanduser("~"),
+            start_dir,
             QFileDialog.ShowDirsOnly
         )
         
         if directory:
+            settings.setValue(OUTPUT_DIR_SETTING, directory)
             self.txtOutputDir.setText(directory)
             self.check_export_ready()
     
@@ -1780,90 +2333,112 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 duration=5
             )
             
-            exported_items = []
-            for layer in selected_layers:
-                try:
-                    item_path = exporter.export_layer(layer, cop_metadata)
-                    exported_items.append(item_path)
-                except Exception as e:
-                    self.iface.messageBar().pushMessage(
-                        "Warning",
-                        f"Failed to export layer '{layer.name()}': {str(e)[:100]}",
-                        level=Qgis.Warning,
-                        duration=5
-                    )
-            
-            # Generate PDF for chatbot results if available
-            chatbot_pdf_path = None
-            if self.mission_query_results:
-                # Check if it's conversation format (new) or options format (old)
-                if 'conversation' in self.mission_query_results:
-                    chatbot_pdf_path = self.generate_conversation_pdf(
-                        exporter.assets_dir,
-                        mission,
-                        self.mission_query_results['conversation']
-                    )
-                elif 'options' in self.mission_query_results:
-                    # Legacy format support
-                    chatbot_pdf_path = self.generate_chatbot_pdf(
-                        exporter.assets_dir,
-                        mission,
-                        self.mission_query_results['options']
-                    )
+            def on_export_error(layer, e):
+                self.iface.messageBar().pushMessage(
+                    "Warning",
+                    f"Failed to export layer '{layer.name()}': {str(e)[:100]}",
+                    level=Qgis.Warning,
+                    duration=5
+                )
             
-            # Create collection
-            collection = self.create_collection(exporter, cop_metadata, selected_layers, chatbot_pdf_path)
-            collection_path = os.path.join(exporter.stac_dir, 'collection.json')
-            with open(collection_path, 'w', encoding='utf-8') as f:
-                json.dump(collection, f, indent=2)
+            exported_items = exporter.export_layers(selected_layers, cop_metadata, on_error=on_export_error)
             
-            # Create ZIP package
+            # Create ZIP package; generated reports are written straight into
+            # it, the collection and layer assets are added from stac_dir
             timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
             zip_filename = f"COP_{location_name.replace(' ', '_')}_{timestamp}.zip"
             zip_path = os.path.join(output_dir, zip_filename)
             
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add all files from stac_dir
-                for root, dirs, files in os.walk(exporter.stac_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, exporter.stac_dir)
-                        zipf.write(file_path, arcname)
-            
-            # Sign package if requested
-            if sign_package:
-                signature = self.sign_package(zip_path)
-                sig_path = zip_path + '.sig'
-                with open(sig_path, 'w') as f:
-                    f.write(signature)
-            
-            # Success message
-            msg = f"COP package created successfully:\n{zip_path}"
+            compresslevel = COMPRESSION_LEVELS[self.cmbCompression.currentIndex()]
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zipf:
+                # Generate PDF for chatbot results if available
+                chatbot_pdf_href = None
+                if self.mission_query_results:
+                    # Check if it's conversation format (new) or options format (old)
+                    if 'conversation' in self.mission_query_results:
+                        chatbot_pdf_href = self.generate_conversation_pdf(
+                            zipf,
+                            mission,
+                            self.mission_query_results['conversation']
+                        )
+                    elif 'options' in self.mission_query_results:
+                        # Legacy format support
+                        chatbot_pdf_href = self.generate_chatbot_pdf(
+                            zipf,
+                            mission,
+                            self.mission_query_results['options']
+                        )
+                
+                # Create collection; saved to stac_dir so the on-disk export
+                # keeps its root, and added to the zip from memory below
+                collection = self.create_collection(exporter, cop_metadata, selected_layers, chatbot_pdf_href)
+                exporter.write_json(os.path.join(exporter.stac_dir, 'collection.json'), collection)
+                
+                # Add exported files from stac_dir, skipping deflate for
+                # compressed rasters and names already written above
+                written = set(zipf.namelist())
+                for entry in iter_files(exporter.stac_dir):
+                    arcname = os.path.relpath(entry.path, exporter.stac_dir).replace(os.sep, '/')
+                    if arcname not in written:
+                        exporter.write_zip_entry(zipf, entry, arcname)
+            
+            # Sign package if requested; hashing a large package runs in the
+            # background and reports success once the signature is written
             if sign_package:
-                msg += f"\n\nSignature: {sig_path}"
-            
-            QMessageBox.information(self, "Success", msg)
-            
-            self.iface.messageBar().pushMessage(
-                "Success",
-                f"COP package exported: {zip_filename}",
-                level=Qgis.Success,
-                duration=5
-            )
+                self.sign_task = SignPackageTask(
+                    zip_path, self.sign_package, self._on_sign_task_finished)
+                QgsApplication.taskManager().addTask(self.sign_task)
+            else:
+                self._report_export_success(zip_path)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
-            import traceback
             traceback.print_exc()
     
-    def create_collection(self, exporter, cop_metadata, layers, chatbot_pdf_path=None):
+    def _on_sign_task_finished(self, task):
+        """Report a finished package signature; runs on the main thread."""
+        if task is self.sign_task:
+            self.sign_task = None
+        if task.error is not None:
+            QMessageBox.critical(self, "Error", f"Package signing failed: {str(task.error)}")
+        elif task.isCanceled():
+            self.iface.messageBar().pushMessage(
+                "Warning",
+                f"Signing cancelled; {os.path.basename(task.zip_path)} is unsigned",
+                level=Qgis.Warning,
+                duration=5
+            )
+        else:
+            self._report_export_success(task.zip_path, task.sig_path)
+    
+    def _report_export_success(self, zip_path, sig_path=None):
+        """Tell the user where the exported package and signature are.
+        
+        Args:
+            zip_path: Path to the ZIP package
+            sig_path: Path to the signature file, if the package was signed
+        """
+        msg = f"COP package created successfully:\n{zip_path}"
+        if sig_path:
+            msg += f"\n\nSignature: {sig_path}"
+        
+        QMessageBox.information(self, "Success", msg)
+        
+        self.iface.messageBar().pushMessage(
+            "Success",
+            f"COP package exported: {os.path.basename(zip_path)}",
+            level=Qgis.Success,
+            duration=5
+        )
+    
+    def create_collection(self, exporter, cop_metadata, layers, chatbot_pdf_href=None):
         """Create STAC collection for the COP.
         
         Args:
             exporter: STACCOPExporter instance
             cop_metadata: Dictionary of COP metadata
             layers: List of exported layers
-            chatbot_pdf_path: Optional path to chatbot results PDF
+            chatbot_pdf_href: Optional package-relative href of the chatbot results PDF
             
         Returns:
             Dictionary representing STAC collection
@@ -1916,13 +2491,14 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             collection['properties']['address'] = cop_metadata['address']
         
         # Add item links
-        for item in exporter.exported_items:
-            file_name = item.get('_file_name', item['id'])
-            collection['links'].append({
+        collection['links'].extend(
+            {
                 "rel": "item",
-                "href": f"./{file_name}.json",
+                "href": f"./{item.get('_file_name', item['id'])}.json",
                 "type": "application/json"
-            })
+            }
+            for item in exporter.exported_items
+        )
         
         # Add AOI information if available
         if 'aoi' in cop_metadata:
@@ -1943,10 +2519,10 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                     collection['properties']['cop:dggs_center_zone'] = dggs_info['center']
         
         # Add chatbot PDF as asset if available
-        if chatbot_pdf_path:
+        if chatbot_pdf_href:
             collection['assets'] = {
                 "chatbot_report": {
-                    "href": os.path.relpath(chatbot_pdf_path, exporter.stac_dir),
+                    "href": chatbot_pdf_href,
                     "title": "SEAL Geo Chatbot Mission Analysis",
                     "description": "AI-generated mission analysis and recommendations from SEAL Geo RAG Chatbot",
                     "type": "application/pdf",
@@ -1997,12 +2573,13 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
                 dggs_crs = self.cmbDggsCrs.currentText()
                 resolution = self.spinResolution.value()
                 
-                corners = {
-                    "southwest": self.calculate_dggs_zone(south, west, dggs_crs, resolution),
-                    "southeast": self.calculate_dggs_zone(south, east, dggs_crs, resolution),
-                    "northwest": self.calculate_dggs_zone(north, west, dggs_crs, resolution),
-                    "northeast": self.calculate_dggs_zone(north, east, dggs_crs, resolution)
-                }
+                corners = dict(zip(
+                    ("southwest", "southeast", "northwest", "northeast"),
+                    self.calculate_dggs_zones_batch(
+                        [south, south, north, north], [west, east, west, east],
+                        dggs_crs, resolution
+                    )
+                ))
                 
                 aoi_info["dggs_zones"] = {
                     "crs": dggs_crs,
@@ -2036,19 +2613,42 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         Returns:
             String zone ID
         """
-        try:
-            # Try using dggal library
-            import dggal
+        return self.calculate_dggs_zones_batch([lat], [lon], dggs_crs, resolution)[0]
+    
+    def calculate_dggs_zones_batch(self, lats, lons, dggs_crs, resolution):
+        """Calculate DGGS zone IDs for many points in one call.
+        
+        Args:
+            lats: Sequence of latitudes
+            lons: Sequence of longitudes, parallel to lats
+            dggs_crs: DGGS coordinate reference system
+            resolution: DGGS resolution level
             
-            # For now, use simplified zone ID format
-            # Format: {DGGS_TYPE}-R{RESOLUTION}-{LAT}_{LON}
-            zone_id = f"{dggs_crs}-R{resolution}-{lat:.4f}_{lon:.4f}"
-            return zone_id
+        Returns:
+            List of string zone IDs in input order
+        """
+        # For now, use simplified zone ID format
+        # Format: {DGGS_TYPE}-R{RESOLUTION}-{LAT}_{LON}
+        prefix = f"{dggs_crs}-R{resolution}-"
+        return [f"{prefix}{lat:.4f}_{lon:.4f}" for lat, lon in zip(lats, lons)]
+    
+    def coordinate_transform(self, source_crs, dest_crs):
+        """Return a cached transform between two CRS.
+        
+        Args:
+            source_crs: Source QgsCoordinateReferenceSystem
+            dest_crs: Destination QgsCoordinateReferenceSystem
             
-        except Exception:
-            # Fallback to simplified format
-            zone_id = f"{dggs_crs}-R{resolution}-{lat:.4f}_{lon:.4f}"
-            return zone_id
+        Returns:
+            QgsCoordinateTransform using the project's transform context
+        """
+        key = (source_crs.authid() or source_crs.toWkt(), dest_crs.authid() or dest_crs.toWkt())
+        transform = self._transforms.get(key)
+        if transform is None:
+            transform = self._transforms[key] = QgsCoordinateTransform(
+                source_crs, dest_crs, QgsProject.instance()
+            )
+        return transform
     
     def calculate_extent(self, layers):
         """Calculate combined extent of layers in EPSG:4326.
@@ -2067,11 +2667,7 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
         crs = self.canvas.mapSettings().destinationCrs()
         
         # Transform to EPSG:4326
-        transform = QgsCoordinateTransform(
-            crs,
-            QgsCoordinateReferenceSystem('EPSG:4326'),
-            QgsProject.instance()
-        )
+        transform = self.coordinate_transform(crs, QgsCoordinateReferenceSystem('EPSG:4326'))
         
         try:
             extent_4326 = transform.transformBoundingBox(extent)
@@ -2087,6 +2683,8 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
     def sign_package(self, zip_path):
         """Create digital signature for ZIP package.
         
+        Safe to call from a worker thread; it does not touch any widgets.
+        
         Args:
             zip_path: Path to ZIP file
             
@@ -2094,16 +2692,13 @@ class ShareCOPDialog(QDialog, FORM_CLASS):
             String containing signature (SHA256 hash for now)
         """
         # Calculate SHA256 hash
-        sha256_hash = hashlib.sha256()
-        with open(zip_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        sha256_hash = sha256_file(zip_path)
         
         # Create signature metadata
         signature = {
             "version": "1.0",
             "algorithm": "SHA256",
-            "hash": sha256_hash.hexdigest(),
+            "hash": sha256_hash,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "signer": "QGIS ShareCOP Plugin",
             "file": os.path.basename(zip_path)
@@ -3,10 +3,14 @@ STAC COP Exporter - Core export functionality
 """
 import hashlib
 import json
+import mmap
 import os
+import re
 import shutil
+import urllib.parse
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from qgis.core import (
     QgsVectorLayer,
@@ -17,6 +21,7 @@ from qgis.core import (
     QgsProject,
     QgsRasterFileWriter,
     QgsRasterPipe,
+    QgsRasterBandStats,
     QgsRectangle
 )
 try:
@@ -24,6 +29,183 @@ try:
     GDAL_AVAILABLE = True
 except ImportError:
     GDAL_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    from zlib_ng import zlib_ng
+    ZLIB_NG_AVAILABLE = True
+except ImportError:
+    ZLIB_NG_AVAILABLE = False
+
+# zipfile compresses through its module-level zlib reference; when zlib-ng
+# (a SIMD-accelerated, API-compatible drop-in) is installed, deflate with it.
+# Otherwise archives are compressed with the stock zlib as before
+if ZLIB_NG_AVAILABLE:
+    zipfile.zlib = zlib_ng
+
+# Formats that are already compressed; deflating them again costs CPU for
+# next to no size reduction, so they are stored as-is in ZIP archives
+STORED_EXTENSIONS = frozenset((
+    '.pdf', '.tif', '.tiff', '.cog', '.png', '.jpg', '.jpeg', '.zip', '.gz'
+))
+
+# hashlib.file_digest (Python 3.11+) reads and hashes files in C
+FILE_DIGEST_AVAILABLE = hasattr(hashlib, 'file_digest')
+
+# Without it, files up to this size are hashed through a single memory map
+MMAP_HASH_LIMIT = 2 * 1024 ** 3
+
+# Read size for chunked hashing and for copying files into archives
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Characters replaced in STAC IDs: \w is exactly str.isalnum() plus '_'
+_INVALID_ID_CHARS = re.compile(r'[^\w-]')
+
+# Raster providers and source fragments identifying web service layers
+_WEB_SERVICE_PROVIDERS = frozenset((
+    'wms', 'xyz', 'wmts', 'wcs', 'arcgismapserver', 'arcgisfeatureserver'
+))
+_WEB_SERVICE_SOURCE = re.compile(
+    r'type=(?:xyz|wms|wmts)|servicetype=|https?://|url=https?', re.IGNORECASE)
+
+# Pixels sampled for STAC band statistics; approximate values are enough for
+# metadata and avoid reading every pixel of large rasters
+RASTER_STATS_SAMPLE_SIZE = 250000
+
+# Worker threads for GDAL raster copies started by export_layers
+RASTER_COPY_WORKERS = 4
+
+# Indented JSON encoder for STAC documents: orjson when available, stdlib
+# otherwise; dump_json returns UTF-8 bytes
+if ORJSON_AVAILABLE:
+    def dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    def dump_json(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def sha256_file(path):
+    """
+    Calculate the SHA256 hex digest of a file
+    
+    Uses hashlib.file_digest where available. On older Pythons the
+    file is memory-mapped and hashed in one update so the digest runs
+    in C over the whole buffer; empty and very large files are read in
+    1 MiB chunks into a reused buffer instead.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        Hex digest string
+    """
+    with open(path, 'rb') as f:
+        if FILE_DIGEST_AVAILABLE:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        sha256_hash = hashlib.sha256()
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= MMAP_HASH_LIMIT:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sha256_hash.update(mm)
+        else:
+            # Reuse one buffer rather than allocating a bytes object per chunk
+            view = memoryview(bytearray(COPY_CHUNK_SIZE))
+            while True:
+                n = f.readinto(view)
+                if not n:
+                    break
+                sha256_hash.update(view[:n])
+    return sha256_hash.hexdigest()
+
+
+def geotiff_options(src_ds):
+    """
+    Return GeoTIFF creation options for an LZW copy of a GDAL dataset
+    
+    Output is tiled and compressed on all cores; a horizontal-differencing
+    predictor is added for integer data (2) and floating-point data (3),
+    which typically shrinks LZW output noticeably. Paletted and complex
+    rasters get no predictor.
+    
+    Args:
+        src_ds: Source gdal.Dataset
+        
+    Returns:
+        List of creation option strings
+    """
+    options = [
+        'COMPRESS=LZW', 'TILED=YES', 'BLOCKXSIZE=512', 'BLOCKYSIZE=512',
+        'NUM_THREADS=ALL_CPUS', 'BIGTIFF=IF_SAFER'
+    ]
+    if src_ds.RasterCount:
+        band = src_ds.GetRasterBand(1)
+        type_name = gdal.GetDataTypeName(band.DataType) or ''
+        if band.GetColorTable() is None:
+            if type_name.startswith('Float'):
+                options.append('PREDICTOR=3')
+            elif type_name == 'Byte' or type_name.startswith(('Int', 'UInt')):
+                options.append('PREDICTOR=2')
+    return options
+
+
+def iter_files(root):
+    """
+    Yield the files below a directory using os.scandir
+    
+    Directory entries carry their file type from the listing, so unlike
+    os.walk no extra stat is needed to tell files from directories.
+    
+    Args:
+        root: Directory to walk
+        
+    Yields:
+        os.DirEntry for each regular file, directories depth first
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, do not descend into symlinked directories
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    yield entry
+
+
+def zip_write_stored(zipf, path, arcname):
+    """
+    Add a file to a ZIP archive uncompressed, copying it in 1 MiB chunks
+    
+    ZipFile.write copies through an 8 KiB buffer, which dominates the
+    cost of storing large rasters; ZIP64 is enabled from the known size.
+    
+    Args:
+        zipf: ZipFile open for writing
+        path: Path of the file to add
+        arcname: Name of the file inside the archive
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    with open(path, 'rb') as src:
+        zip_copy_stored(zipf, zinfo, src)
+
+
+def zip_copy_stored(zipf, zinfo, src):
+    """
+    Copy an open binary file into a ZIP archive member uncompressed
+    
+    Args:
+        zipf: ZipFile open for writing
+        zinfo: ZipInfo describing the new member
+        src: Binary file object positioned at the data to copy
+    """
+    zinfo.compress_type = zipfile.ZIP_STORED
+    with zipf.open(zinfo, 'w') as dest:
+        shutil.copyfileobj(src, dest, COPY_CHUNK_SIZE)
 
 
 class STACCOPExporter:
@@ -41,6 +223,13 @@ class STACCOPExporter:
         self.map_canvas = map_canvas
         self.exported_items = []
         
+        # One timestamp for every item and the collection of this export
+        self.export_time = datetime.now(timezone.utc).isoformat()
+        
+        # Serialised JSON documents by path, so packaging can add them to
+        # archives without reading them back from disk
+        self.json_documents = {}
+        
         # Create STAC collection directory
         self.stac_dir = os.path.join(output_dir, 'stac_cop_export')
         os.makedirs(self.stac_dir, exist_ok=True)
@@ -52,12 +241,81 @@ class STACCOPExporter:
         # Clip extent for exports
         self.clip_extent = None
         self.clip_crs = None
+        
+        # Pending GDAL raster copies by layer ID, started by export_layers
+        self._raster_copies = {}
+        
+        # Coordinate transforms by (source, destination) CRS, so each PROJ
+        # pipeline is set up once per export rather than once per layer
+        self._transforms = {}
     
     def set_clip_extent(self, extent, crs):
         """Set extent for clipping exported layers"""
         self.clip_extent = extent
         self.clip_crs = crs
 
+    def coordinate_transform(self, source_crs, dest_crs):
+        """
+        Return a cached transform between two CRS
+        
+        Args:
+            source_crs: Source QgsCoordinateReferenceSystem
+            dest_crs: Destination QgsCoordinateReferenceSystem
+            
+        Returns:
+            QgsCoordinateTransform using the project's transform context
+        """
+        key = (source_crs.authid() or source_crs.toWkt(), dest_crs.authid() or dest_crs.toWkt())
+        transform = self._transforms.get(key)
+        if transform is None:
+            transform = self._transforms[key] = QgsCoordinateTransform(
+                source_crs, dest_crs, QgsProject.instance()
+            )
+        return transform
+
+    def export_layers(self, layers, cop_metadata, on_error=None):
+        """
+        Export several layers, copying local rasters with GDAL in parallel
+        
+        GDAL raster copies open their own datasets, so they start up front in
+        worker threads; layers are then exported in order on the calling
+        thread, which also handles vector layers and the QGIS raster writer
+        since map layers are not thread-safe.
+        
+        Args:
+            layers: List of QgsMapLayer to export
+            cop_metadata: Dictionary containing COP metadata fields
+            on_error: Optional function called with (layer, exception) when a
+                layer fails to export; without it the exception propagates
+            
+        Returns:
+            List of STAC Item paths for the exported layers
+        """
+        item_paths = []
+        with ThreadPoolExecutor(max_workers=RASTER_COPY_WORKERS) as executor:
+            outputs = set()
+            for layer in layers:
+                source_path = self.local_raster_source(layer)
+                output_file = self.raster_output_path(self.sanitize_id(layer.name()))
+                # Layers sharing a name share an output file; copy those in turn
+                if source_path is not None and output_file not in outputs:
+                    outputs.add(output_file)
+                    self._raster_copies[layer.id()] = executor.submit(
+                        self.copy_raster_gdal, source_path, output_file)
+            
+            try:
+                for layer in layers:
+                    try:
+                        item_paths.append(self.export_layer(layer, cop_metadata))
+                    except Exception as e:
+                        if on_error is None:
+                            raise
+                        on_error(layer, e)
+            finally:
+                self._raster_copies.clear()
+        
+        return item_paths
+
     def export_layer(self, layer, cop_metadata):
         """
         Export a single QGIS layer to STAC COP format
@@ -86,8 +344,7 @@ class STACCOPExporter:
         
         # Remove internal _file_name before saving
         item_to_save = {k: v for k, v in stac_item.items() if k != '_file_name'}
-        with open(item_path, 'w', encoding='utf-8') as f:
-            json.dump(item_to_save, f, indent=2)
+        self.write_json(item_path, item_to_save)
         
         self.exported_items.append(stac_item)
         return item_path
@@ -114,11 +371,7 @@ class STACCOPExporter:
             # Apply extent filter if set
             if self.clip_extent and self.clip_crs:
                 # Transform clip extent to layer CRS
-                transform = QgsCoordinateTransform(
-                    self.clip_crs,
-                    layer.crs(),
-                    QgsProject.instance()
-                )
+                transform = self.coordinate_transform(self.clip_crs, layer.crs())
                 clip_extent_in_layer_crs = transform.transformBoundingBox(self.clip_extent)
                 options.filterExtent = clip_extent_in_layer_crs
             
@@ -138,19 +391,7 @@ class STACCOPExporter:
             # Export raster - handle both files and web services
             source_path = layer.source()
             
-            # Check if this is a web service (XYZ, WMS, WMTS, etc.)
-            # Check for common web service parameters and URLs
-            is_web_service = any(indicator in source_path.lower() for indicator in [
-                'type=xyz', 'type=wms', 'type=wmts', 'servicetype=', 
-                'http://', 'https://', 'url=http', 'url=https'
-            ]) or (source_path.startswith('crs=') and '&type=' in source_path)
-            
-            # Also check provider type for web services
-            provider_type = layer.providerType().lower()
-            if provider_type in ['wms', 'xyz', 'wmts', 'wcs', 'arcgismapserver', 'arcgisfeatureserver']:
-                is_web_service = True
-            
-            if is_web_service:
+            if self.is_web_service(layer):
                 # For web services, export metadata as JSON instead of raster data
                 output_file = os.path.join(self.assets_dir, f'{layer_id}_service.json')
                 
@@ -162,22 +403,16 @@ class STACCOPExporter:
                     'provider': layer.providerType()
                 }
                 
-                # Extract URL if present (handle URL-encoded characters)
-                if 'url=' in source_path:
-                    url_start = source_path.find('url=') + 4
-                    url_end = source_path.find('&', url_start)
-                    if url_end == -1:
-                        url = source_path[url_start:]
-                    else:
-                        url = source_path[url_start:url_end]
-                    # Decode URL-encoded characters
-                    import urllib.parse
-                    url = urllib.parse.unquote(url)
-                    service_info['url'] = url
+                # Extract URL if present from the &-separated key=value URI
+                # (handle URL-encoded characters)
+                for param in source_path.split('&'):
+                    key, _, value = param.partition('=')
+                    if key == 'url':
+                        service_info['url'] = urllib.parse.unquote(value)
+                        break
                 
                 # Save service metadata
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(service_info, f, indent=2)
+                self.write_json(output_file, service_info)
                 
                 return output_file
             
@@ -186,32 +421,18 @@ class STACCOPExporter:
                 source_path = source_path.split('|')[0]
             
             # Determine output format and extension
-            output_file = os.path.join(self.assets_dir, f'{layer_id}.tif')
+            output_file = self.raster_output_path(layer_id)
             
-            # Try using GDAL directly if available for better reliability
+            # Try using GDAL directly if available for better reliability,
+            # reusing a copy already started by export_layers
             if GDAL_AVAILABLE:
-                try:
-                    # Open source dataset
-                    src_ds = gdal.Open(source_path, gdal.GA_ReadOnly)
-                    if src_ds is None:
-                        raise Exception(f"Cannot open raster source: {source_path}")
-                    
-                    # Create output with GeoTIFF driver
-                    driver = gdal.GetDriverByName('GTiff')
-                    dst_ds = driver.CreateCopy(output_file, src_ds, strict=0, options=['COMPRESS=LZW'])
-                    
-                    # Close datasets
-                    dst_ds = None
-                    src_ds = None
-                    
-                    if not os.path.exists(output_file):
-                        raise Exception("GDAL export did not create output file")
-                    
+                pending = self._raster_copies.pop(layer.id(), None)
+                if pending is not None:
+                    copied = pending.result()
+                else:
+                    copied = self.copy_raster_gdal(source_path, output_file)
+                if copied:
                     return output_file
-                    
-                except Exception as e:
-                    # GDAL failed, try fallback
-                    pass
             
             # Fallback: try QGIS raster writer
             try:
@@ -255,7 +476,7 @@ class STACCOPExporter:
                 # Final fallback: copy original file if it exists and is a file
                 if os.path.exists(source_path) and os.path.isfile(source_path):
                     try:
-                        shutil.copy2(source_path, output_file)
+                        shutil.copyfile(source_path, output_file)
                         return output_file
                     except Exception as copy_error:
                         raise Exception(f"Failed to export raster - GDAL failed, QGIS writer failed ({str(e)}), and file copy failed ({str(copy_error)})")
@@ -265,6 +486,82 @@ class STACCOPExporter:
         else:
             raise Exception(f"Unsupported layer type: {type(layer)}")
 
+    @staticmethod
+    def is_web_service(layer):
+        """
+        Check whether a raster layer is served over the web (XYZ, WMS, ...)
+        
+        Args:
+            layer: QgsRasterLayer to check
+            
+        Returns:
+            True for web service layers
+        """
+        # Provider type settles most layers without scanning the source
+        if layer.providerType().lower() in _WEB_SERVICE_PROVIDERS:
+            return True
+        
+        # Check for common web service parameters and URLs
+        source_path = layer.source()
+        return bool(_WEB_SERVICE_SOURCE.search(source_path)) or (
+            source_path.startswith('crs=') and '&type=' in source_path
+        )
+    
+    def local_raster_source(self, layer):
+        """
+        Return the file GDAL should copy for a local raster layer
+        
+        Args:
+            layer: QgsMapLayer to check
+            
+        Returns:
+            Source path without GDAL dataset specifiers, or None if the layer
+            is not a local raster or GDAL is not available
+        """
+        if not GDAL_AVAILABLE or not isinstance(layer, QgsRasterLayer) or self.is_web_service(layer):
+            return None
+        return layer.source().split('|')[0]
+    
+    def raster_output_path(self, layer_id):
+        """Return the GeoTIFF asset path for a sanitized layer identifier."""
+        return os.path.join(self.assets_dir, f'{layer_id}.tif')
+    
+    @staticmethod
+    def copy_raster_gdal(source_path, output_file):
+        """
+        Copy a raster to an LZW-compressed GeoTIFF with GDAL
+        
+        Uses only its own GDAL datasets, so it is safe to run in a worker
+        thread.
+        
+        Args:
+            source_path: Path of the source raster
+            output_file: Path of the GeoTIFF to create
+            
+        Returns:
+            True if the copy was written, False if GDAL failed
+        """
+        try:
+            # Open source dataset
+            src_ds = gdal.Open(source_path, gdal.GA_ReadOnly)
+            if src_ds is None:
+                raise Exception(f"Cannot open raster source: {source_path}")
+            
+            # Create output with GeoTIFF driver
+            driver = gdal.GetDriverByName('GTiff')
+            dst_ds = driver.CreateCopy(output_file, src_ds, strict=0, options=geotiff_options(src_ds))
+            
+            # CreateCopy returns None on failure; closing flushes the file
+            copied = dst_ds is not None
+            dst_ds = None
+            src_ds = None
+            
+            return copied
+            
+        except Exception:
+            # GDAL failed; the caller falls back to the QGIS writer
+            return False
+
     def create_stac_item(self, layer, layer_id, asset_path, cop_metadata, file_name):
         """
         Create STAC Item with COP extension
@@ -285,50 +582,37 @@ class STACCOPExporter:
         
         # Transform to WGS84 if needed
         if crs.authid() != 'EPSG:4326':
-            transform = QgsCoordinateTransform(
-                crs,
-                QgsCoordinateReferenceSystem('EPSG:4326'),
-                QgsProject.instance()
-            )
+            transform = self.coordinate_transform(crs, QgsCoordinateReferenceSystem('EPSG:4326'))
             extent = transform.transformBoundingBox(extent)
         
+        # Read the bounds once; each accessor is a call into C++
+        bbox = [extent.xMinimum(), extent.yMinimum(), extent.xMaximum(), extent.yMaximum()]
+        
         # Check if extent is valid (not NaN or infinite)
-        if (not extent.isFinite() or 
-            extent.xMinimum() == extent.xMaximum() or 
-            extent.yMinimum() == extent.yMaximum()):
+        if not extent.isFinite() or bbox[0] == bbox[2] or bbox[1] == bbox[3]:
             # Use AOI bbox if available, otherwise use location point
             if cop_metadata.get('aoi') and cop_metadata['aoi'].get('bbox'):
-                aoi_bbox = cop_metadata['aoi']['bbox']
-                bbox = aoi_bbox
-                extent = QgsRectangle(aoi_bbox[0], aoi_bbox[1], aoi_bbox[2], aoi_bbox[3])
+                bbox = cop_metadata['aoi']['bbox']
             elif cop_metadata.get('location_lon') and cop_metadata.get('location_lat'):
                 # Create small bbox around the point location
                 lon = cop_metadata['location_lon']
                 lat = cop_metadata['location_lat']
                 offset = 0.001  # ~100m at equator
                 bbox = [lon - offset, lat - offset, lon + offset, lat + offset]
-                extent = QgsRectangle(bbox[0], bbox[1], bbox[2], bbox[3])
             else:
                 # Last resort: use a default small extent
                 bbox = [0, 0, 0.001, 0.001]
-                extent = QgsRectangle(0, 0, 0.001, 0.001)
-        else:
-            bbox = [
-                extent.xMinimum(),
-                extent.yMinimum(),
-                extent.xMaximum(),
-                extent.yMaximum()
-            ]
         
         # Create geometry
+        xmin, ymin, xmax, ymax = bbox
         geometry = {
             "type": "Polygon",
             "coordinates": [[
-                [extent.xMinimum(), extent.yMinimum()],
-                [extent.xMaximum(), extent.yMinimum()],
-                [extent.xMaximum(), extent.yMaximum()],
-                [extent.xMinimum(), extent.yMaximum()],
-                [extent.xMinimum(), extent.yMinimum()]
+                [xmin, ymin],
+                [xmax, ymin],
+                [xmax, ymax],
+                [xmin, ymax],
+                [xmin, ymin]
             ]]
         }
         
@@ -373,7 +657,7 @@ class STACCOPExporter:
             "bbox": bbox,
             "geometry": geometry,
             "properties": {
-                "datetime": datetime.now(timezone.utc).isoformat(),
+                "datetime": self.export_time,
                 "title": layer.name()
             },
             "assets": {
@@ -418,7 +702,8 @@ class STACCOPExporter:
                     "data_type": provider.dataType(band_num)
                 }
                 # Add statistics if available
-                stats = provider.bandStatistics(band_num)
+                stats = provider.bandStatistics(
+                    band_num, QgsRasterBandStats.All, QgsRectangle(), RASTER_STATS_SAMPLE_SIZE)
                 if stats.minimumValue != stats.maximumValue:
                     band_info["statistics"] = {
                         "minimum": stats.minimumValue,
@@ -475,11 +760,9 @@ class STACCOPExporter:
         
         # Calculate spatial extent
         if all_bbox:
-            min_x = min(bbox[0] for bbox in all_bbox)
-            min_y = min(bbox[1] for bbox in all_bbox)
-            max_x = max(bbox[2] for bbox in all_bbox)
-            max_y = max(bbox[3] for bbox in all_bbox)
-            spatial_bbox = [min_x, min_y, max_x, max_y]
+            # Transpose once so each bound is a C-level min/max over a tuple
+            min_xs, min_ys, max_xs, max_ys = zip(*(bbox[:4] for bbox in all_bbox))
+            spatial_bbox = [min(min_xs), min(min_ys), max(max_xs), max(max_ys)]
         else:
             spatial_bbox = [-180, -90, 180, 90]
         
@@ -487,8 +770,7 @@ class STACCOPExporter:
         if all_times:
             temporal_interval = [[min(all_times), max(all_times)]]
         else:
-            now = datetime.now(timezone.utc).isoformat()
-            temporal_interval = [[now, now]]
+            temporal_interval = [[self.export_time, self.export_time]]
         
         collection = {
             "stac_version": "1.0.0",
@@ -520,21 +802,52 @@ class STACCOPExporter:
             ]
         }
         
-        # Add item links
-        for item in self.exported_items:
-            file_name = item.get('_file_name', item['id'])  # Fallback to ID if no file_name
-            collection['links'].append({
-                "rel": "item",
-                "href": f"./{file_name}.json"
-            })
+        # Add item links, falling back to the ID if no file_name
+        collection['links'].extend(
+            {"rel": "item", "href": f"./{item.get('_file_name', item['id'])}.json"}
+            for item in self.exported_items
+        )
         
         # Save collection
         collection_path = os.path.join(self.stac_dir, 'collection.json')
-        with open(collection_path, 'w', encoding='utf-8') as f:
-            json.dump(collection, f, indent=2)
+        self.write_json(collection_path, collection)
         
         return collection_path
 
+    def write_json(self, path, obj):
+        """
+        Save a JSON document and keep its serialised bytes for packaging
+        
+        Args:
+            path: Output file path
+            obj: JSON-serialisable object
+        """
+        data = dump_json(obj)
+        with open(path, 'wb') as f:
+            f.write(data)
+        self.json_documents[path] = data
+    
+    def write_zip_entry(self, zipf, entry, arcname):
+        """
+        Add an exported file to a ZIP archive
+        
+        JSON documents written by this exporter are added from memory;
+        already-compressed formats are stored and everything else uses the
+        archive's compression.
+        
+        Args:
+            zipf: ZipFile open for writing
+            entry: os.DirEntry of the file, as yielded by iter_files
+            arcname: Name of the file inside the archive
+        """
+        data = self.json_documents.get(entry.path)
+        if data is not None:
+            zipf.writestr(arcname, data)
+        elif os.path.splitext(entry.name)[1].lower() in STORED_EXTENSIONS:
+            zip_write_stored(zipf, entry.path, arcname)
+        else:
+            zipf.write(entry.path, arcname)
+
     def create_zip_archive(self):
         """
         Create ZIP archive of all exported STAC files and generate SHA256 hash
@@ -546,21 +859,14 @@ class STACCOPExporter:
         zip_filename = f'stac_cop_export_{timestamp}.zip'
         zip_path = os.path.join(self.output_dir, zip_filename)
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through STAC directory and add all files
-            for root, dirs, files in os.walk(self.stac_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, self.output_dir)
-                    zipf.write(file_path, arcname)
-        
-        # Calculate SHA256 hash of the ZIP file
-        sha256_hash = hashlib.sha256()
-        with open(zip_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        
-        hash_value = sha256_hash.hexdigest()
+        # Write to a seekable file so ZipFile records CRC and sizes in the
+        # local headers, which streaming readers need for stored members
+        with open(zip_path, 'wb', buffering=COPY_CHUNK_SIZE) as f:
+            with zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+                # Walk through STAC directory and add all files
+                for entry in iter_files(self.stac_dir):
+                    self.write_zip_entry(zipf, entry, os.path.relpath(entry.path, self.output_dir))
+        hash_value = sha256_file(zip_path)
         
         # Write hash to a text file
         hash_filename = f'stac_cop_export_{timestamp}.zip.sha256'
@@ -582,8 +888,8 @@ class STACCOPExporter:
             Sanitized identifier
         """
         # Remove special characters and spaces
-        sanitized = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+        sanitized = _INVALID_ID_CHARS.sub('_', name)
         # Ensure it starts with alphanumeric
-        if not sanitized[0].isalnum():
+        if not sanitized[:1].isalnum():
             sanitized = 'item_' + sanitized
         return sanitized.lower()